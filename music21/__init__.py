@@ -190,7 +190,17 @@ __version__ = VERSION_STR
 from music21.test.testRunner import mainTest  # noqa: E402
 
 # -----------------------------------------------------------------------------
-# this brings all of our own __all__ names into the music21 package namespace
-# pylint: disable=wildcard-import
-from music21 import *  # @UnresolvedImport  # noqa: E402,F403
+# Everything else in __all__ is imported only when first used, so that
+# `import music21` does not need to load every subpackage:
+# `music21.stream` or `from music21 import *` will import them as needed.
+
+def __getattr__(name):
+    if name in __all__:
+        import importlib
+        return importlib.import_module('music21.' + name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
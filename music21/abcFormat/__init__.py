@@ -55,7 +55,10 @@ __all__ = [
 ]
 
 import copy
+import hashlib
 import io
+import json
+import os
 import pathlib
 import re
 import unittest
@@ -105,6 +108,53 @@ reChord = re.compile('[.*?]')  # non greedy
 reAbcVersion = re.compile(r'^%abc-((\d+)\.(\d+)\.?(\d+)?)')
 reDirective = re.compile(r'^%%([a-z\-]+)\s+([^\s]+)(.*)')
 
+# Master pattern for ABCHandler.tokenize.  At each position the first
+# alternative that matches gives the kind of token that starts there; the order
+# of the alternatives is the order in which the tokenizer tests for them.
+_reTokenPatterns = [
+    ('comment', r'%[^\n]*'),
+    ('metadata', r"[^\W\d_]:(?=[^|])[^\n]*"),
+    ('bar', r':\|[12]|\|\]|\|\||\[\||\[[12]|\|[12]|:\||\|:|::|\||:'),
+    ('tuplet', r'\(\d(?::\d?(?::\d?)?)?'),
+    ('brokenRhythm', r'[<>]+'),
+    ('exclaim', r'!'),
+    ('slur', r'\((?=[\s\S])'),
+    ('single', r'[)\-.u{}vKkM]'),
+    ('chordSymbol', r'"'),
+    ('chord', r'\['),
+    # a pitch letter with octave and length modifiers
+    ('note', r"(?![.~^=_HLMOPSTuv])[^\W\d_][\d,/']*"),
+    # decorations and accidentals (with stray modifiers) and perhaps a pitch letter
+    ('decoratedNote',
+     r"[~^=_HLOPST][.~^=_HLMOPSTuv\d,/']*(?:(?![.~^=_HLMOPSTuvwhN])[^\W\d_][\d,/']*)?"),
+    ('skip', r'(?:(?![%|:\[(<>!)\-".{}~^=_])[\W\d])+'),
+    ('other', r'[\s\S]'),
+]
+# Leading white space is consumed along with the token, so the token starts at
+# match.start(match.lastgroup).
+reToken = re.compile(r'\s*(?:'
+                     + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _reTokenPatterns)
+                     + ')')
+reTokenWithoutMetadata = re.compile('|'.join(f'(?P<{name}>{pattern})'
+                                             for name, pattern in _reTokenPatterns
+                                             if name != 'metadata'))
+reChordLengthModifier = re.compile(r'[\d/]*')
+
+# note events that ABCHandler.tokenize drops: some collections here are not yet
+# supported; others may be the result of errors in encoded files
+# v is up bow; might be: "^Segno"v which also should be dropped
+# H is fermata
+# . dot may be staccato, but should be attached to pitch
+_unsupportedNoteEvents = frozenset([
+    'w', 'u', 'v', 'v.', 'h', 'H', 'vk',
+    'uk', 'U', '~',
+    '.', '=', 'V', 'v.', 'S', 's',
+    'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
+    'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
+    'l', 'L', 'R',
+    'y', 'T', 't', 'x', 'Z',
+])
+
 
 # ------------------------------------------------------------------------------
 class ABCTokenException(exceptions21.Music21Exception):
@@ -1374,7 +1424,7 @@ class ABCNote(ABCToken):
         Traceback (most recent call last):
         music21.abcFormat.ABCHandlerException: cannot find any pitch information in: 'x'
         '''
-        environLocal.printDebug(['getPitchName:', strSrc])
+        # environLocal.printDebug(['getPitchName:', strSrc])
 
         # skip some articulations parsed with the pitch
         # some characters are errors in parsing or encoding not yet handled
@@ -2019,6 +2069,10 @@ class ABCHandler:
         '''
         Walk the abc string, creating ABC objects along the way.
 
+        The string is scanned with a single compiled pattern, `reToken`, whose
+        alternatives each recognize the start of one kind of token, so that
+        white space and unsupported characters are skipped over in bulk.
+
         This may be called separately from process(), in the case
         that pre/post parse processing is not needed.
 
@@ -2057,231 +2111,53 @@ class ABCHandler:
         # noinspection SpellCheckingInspection
         accidentalsAndDecorations = '.~^=_HLMOPSTuv'
         accidentals = '^=_'
+        singleCharacterTokens = {
+            ')': ABCParenStop,
+            '-': ABCTie,
+            '.': ABCStaccato,
+            'u': ABCUpbow,
+            '{': ABCGraceStart,
+            '}': ABCGraceStop,
+            'v': ABCDownbow,
+            'K': ABCAccent,
+            'k': ABCStraccent,
+            'M': ABCTenuto,
+        }
+        exclaimDict = {'!crescendo(!': ABCCrescStart,
+                       '!crescendo)!': ABCParenStop,
+                       '!diminuendo(!': ABCDimStart,
+                       '!diminuendo)!': ABCParenStop,
+                       }
+        tokens = self.tokens
+        srcLen = self.srcLen
 
         activeChordSymbol = ''  # accumulate, then prepend
         accidentalized = {}
         accidental = None
         abcPitch = None  # ABC substring defining any pitch within the current token
         self.isFirstComment = True
-
-        while self.pos < self.srcLen - 1:
-            self.pos += 1
-            self.pos += self.skipAhead
-            self.skipAhead = 0
-            if self.pos > self.srcLen - 1:
-                break
-
-            q = self._getLinearContext(self.strSrc, self.pos)
-            unused_cPrev, c, cNext, cNextNext = q
-            # cPrevNotSpace, cPrev, c, cNext, cNextNotSpace, cNextNext = q
-
-            # comment lines, also encoding defs
-            if c == '%':
-                self.processComment()
-                continue
-
-            if self.startsMetadata(c, cNext, cNextNext):
-                # collect until end of line; add one to get line break
-                j = self._getNextLineBreak(self.strSrc, self.pos)
-                self.skipAhead = j - (self.pos + 1)
-                self.currentCollectStr = self.strSrc[self.pos:j].strip()
-                # environLocal.printDebug(['got metadata:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCMetadata(self.currentCollectStr))
-                continue
-
-            # get bars: if not a space and not alphanumeric
-            if not c.isspace() and not c.isalnum() and c not in ('~', '('):
-                matchBars = False
-                for barIndex in range(len(ABC_BARS)):
-                    # first of bars tuple is symbol to match
-                    # three possible sizes of bar indications: 3, 2, 1
-                    barTokenArchetype = ABC_BARS[barIndex][0]
-                    if len(barTokenArchetype) == 3:
-                        if cNextNext is not None and (c + cNext + cNextNext == barTokenArchetype):
-                            self.skipAhead = 2
-                            matchBars = True
-                            break
-                    elif cNext is not None and (len(barTokenArchetype) == 2):
-                        if c + cNext == barTokenArchetype:
-                            self.skipAhead = 1
-                            matchBars = True
-                            break
-                    elif len(barTokenArchetype) == 1:
-                        if c == barTokenArchetype:
-                            self.skipAhead = 0
-                            matchBars = True
-                            break
-                if matchBars is True:
-                    accidentalized = {}
-                    accidental = None
-                    j = self.pos + self.skipAhead + 1
-                    self.currentCollectStr = self.strSrc[self.pos:j]
-                    # filter and replace with 2 tokens if necessary
-                    for tokenSub in self.barlineTokenFilter(self.currentCollectStr):
-                        self.tokens.append(tokenSub)
-                    # environLocal.printDebug(['got bars:', repr(self.currentCollectStr)])
-                    # if self.currentCollectStr == '::':
-                    #     # create a start and and an end
-                    #     self.tokens.append(ABCBar(':|'))
-                    #     self.tokens.append(ABCBar('|:'))
-                    # else:
-                    #     self.tokens.append(ABCBar(self.currentCollectStr))
+        propagation = self._accidentalPropagation()
+
+        pos = 0
+        while pos < srcLen:
+            m = reToken.match(strSrc, pos)
+            kind = m.lastgroup
+            pos = m.start(kind)
+            if kind == 'metadata':
+                c = strSrc[pos]
+                if c == 'w' or c.isupper():
+                    # collect until end of line
+                    self.currentCollectStr = m.group(kind).strip()
+                    # environLocal.printDebug(['got metadata:', repr(self.currentCollectStr)])
+                    tokens.append(ABCMetadata(self.currentCollectStr))
+                    pos = m.end()
                     continue
-
-            # get tuplet indicators: (2, (3, (p:q:r or (3::
-            if c == '(' and cNext is not None and cNext.isdigit():
-                self.skipAhead = 1
-                j = self.pos + self.skipAhead + 1  # always two characters
-                unused1, possibleColon, qChar, unused2 = self._getLinearContext(self.strSrc, j)
-                if possibleColon == ':':
-                    j += 1
-                    self.skipAhead += 1
-                    if qChar is not None and qChar.isdigit():
-                        j += 1
-                        self.skipAhead += 1
-                    unused1, possibleColon, rChar, unused2 = self._getLinearContext(self.strSrc, j)
-                    if possibleColon == ':':
-                        j += 1  # include the r characters
-                        self.skipAhead += 1
-                        if rChar is not None and rChar.isdigit():
-                            j += 1
-                            self.skipAhead += 1
-
-                self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got tuplet start:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCTuplet(self.currentCollectStr))
-                continue
-
-            # get broken rhythm modifiers: < or >, >>, up to <<<
-            if c in '<>':
-                j = self.pos + 1
-                while j < self.srcLen - 1 and self.strSrc[j] in '<>':
-                    j += 1
-                self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(
-                #     ['got bidrectional rhythm mod:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCBrokenRhythmMarker(self.currentCollectStr))
-                self.skipAhead = j - (self.pos + 1)
-                continue
-
-            # get dynamics. skip over the open paren to avoid confusion.
-            # NB: Nested crescendos are not an issue (not proper grammar).
-            if c == '!':
-                exclaimDict = {'!crescendo(!': ABCCrescStart,
-                               '!crescendo)!': ABCParenStop,
-                               '!diminuendo(!': ABCDimStart,
-                               '!diminuendo)!': ABCParenStop,
-                               }
-                j = self.pos + 1
-                while j < self.pos + 20 and j < self.srcLen:  # a reasonable upper bound
-                    if self.strSrc[j] == '!':
-                        if self.strSrc[self.pos:j + 1] in exclaimDict:
-                            exclaimClass = exclaimDict[self.strSrc[self.pos:j + 1]]
-                            exclaimObject = exclaimClass(c)
-                            self.tokens.append(exclaimObject)
-                            self.skipAhead = j - self.pos  # not + 1
-                            break
-                        # NB: We're currently skipping over all other '!' expressions
-                        else:
-                            self.skipAhead = j - self.pos  # not + 1
-                            break
-                    j += 1
-                # not found, continue...
-                continue
-
-            # get slurs, ensuring that they're not confused for tuplets
-            if c == '(' and cNext is not None and not cNext.isdigit():
-                self.tokens.append(ABCSlurStart(c))
-                continue
-
-            # get slur/tuplet ending; treat it as a general parenthesis stop
-            if c == ')':
-                self.tokens.append(ABCParenStop(c))
-                continue
-
-            # get ties between two notes
-            if c == '-':
-                self.tokens.append(ABCTie(c))
-                continue
-
-            # get chord symbols / guitar chords; collected and joined with
-            # chord or notes
-            if c == '"':
-                j = self.pos + 1
-                while j < self.srcLen - 1 and self.strSrc[j] != '"':
-                    j += 1
-                j += 1  # need character that caused break
-                # there may be more than one chord symbol: need to accumulate
-                activeChordSymbol += self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got chord symbol:', repr(activeChordSymbol)])
-                self.skipAhead = j - (self.pos + 1)
-                continue
-
-            # get chords
-            if c == '[':
-                j = self.pos + 1
-
-                # find closing chord bracket
-                while j < self.srcLen - 1 and self.strSrc[j] != ']':
-                    j += 1
-
-                j += 1  # need character that caused break
-
-                # find outer chord length modifier
-                while j < self.srcLen and (self.strSrc[j].isdigit() or self.strSrc[j] in '/'):
-                    j += 1
-
-                # prepend chord symbol
-                if activeChordSymbol != '':
-                    self.currentCollectStr = activeChordSymbol + self.strSrc[self.pos:j]
-                    activeChordSymbol = ''  # reset
-                else:
-                    self.currentCollectStr = self.strSrc[self.pos:j]
-
-                # environLocal.printDebug(['got chord:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCChord(self.currentCollectStr))
-                self.skipAhead = j - (self.pos + 1)
-                # TODO: Chords need to be aware of accidentals too.
-                # Also what happens to prefixes and suffixes attached to chords,
-                # like ties.
-                continue
-
-            if c == '.':
-                self.tokens.append(ABCStaccato(c))
-                continue
-
-            if c == 'u':
-                self.tokens.append(ABCUpbow(c))
-                continue
-
-            if c == '{':
-                self.tokens.append(ABCGraceStart(c))
-                continue
-
-            if c == '}':
-                self.tokens.append(ABCGraceStop(c))
-                continue
-
-            if c == 'v':
-                self.tokens.append(ABCDownbow(c))
-                continue
-
-            if c == 'K':
-                self.tokens.append(ABCAccent(c))
-                continue
-
-            if c == 'k':
-                self.tokens.append(ABCStraccent(c))
-                continue
-
-            if c == 'M':
-                self.tokens.append(ABCTenuto(c))
-                continue
+                m = reTokenWithoutMetadata.match(strSrc, pos)
+                kind = m.lastgroup
+            end = m.end()
 
             # get the start of a note event: alpha, decoration, or accidental
-            if c.isalpha() or c in '~^=_':
-                # condition where we start with an alpha that is not an alpha
-                # that comes before a pitch indication
+            if kind == 'note' or kind == 'decoratedNote':
                 # From the 2.2 draft standard, we see the following "decorations"
                 # defined:
                 #     .       staccato mark
@@ -2302,83 +2178,59 @@ class ABCHandler:
                 #     =       natural
                 #     _       flat
                 #     __      double-flat
-                foundPitchAlpha = c.isalpha() and c not in accidentalsAndDecorations
-                if foundPitchAlpha:
-                    abcPitch = c
-                if c in accidentals:
-                    accidental = c
-                j = self.pos + 1
-
-                while j <= self.srcLen - 1:
-                    # if we have not found pitch alpha
-                    # decorations and/or accidentals may precede note names
-                    if not foundPitchAlpha and self.strSrc[j] in accidentalsAndDecorations:
-                        j += 1
-                        if self.strSrc[j] in accidentals:
-                            accidental += self.strSrc[j]
-                        continue
-                    # only allow one pitch alpha to be a continue condition
-                    elif (not foundPitchAlpha and self.strSrc[j].isalpha()
-                          # noinspection SpellCheckingInspection
-                          and self.strSrc[j] not in '~wuvhHLTSN'):
-                        foundPitchAlpha = True
-                        abcPitch = self.strSrc[j]
-                        j += 1
-                        continue
-                    # continue conditions after alpha:
-                    # , register modification (, ') or number, rhythm indication
-                    # number, /,
-                    elif self.strSrc[j].isdigit() or self.strSrc[j] in ',/,\'':
-                        if self.strSrc[j] in ',\'':  # Register (octave) modification
-                            abcPitch += self.strSrc[j]
-                        j += 1
-                        continue
-                    else:  # space, all else: break
-                        break
-                # prepend chord symbol
-                if activeChordSymbol != '':
-                    self.currentCollectStr = activeChordSymbol + self.strSrc[self.pos:j]
-                    activeChordSymbol = ''  # reset
+                #
+                # note that abcPitch and accidental carry over from earlier tokens
+                # until they are replaced or used.
+                noteStr = m.group(kind)
+                if kind == 'note':
+                    abcPitch = noteStr[0]
+                    if ',' in noteStr or "'" in noteStr:
+                        # Register (octave) modification
+                        abcPitch += ''.join(ch for ch in noteStr if ch in ",'")
                 else:
-                    self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got note event:', repr(self.currentCollectStr)])
+                    if noteStr[0] in accidentals:
+                        accidental = noteStr[0]
+                    foundPitchAlpha = False
+                    for k in range(1, len(noteStr)):
+                        ch = noteStr[k]
+                        if not foundPitchAlpha and ch in accidentalsAndDecorations:
+                            # the character after a decoration may add to the accidental
+                            if noteStr[k + 1:k + 2] in ('^', '=', '_'):
+                                accidental = (accidental or '') + noteStr[k + 1]
+                        elif ch in ",'":
+                            abcPitch = (abcPitch or '') + ch
+                        elif ch.isalpha():
+                            foundPitchAlpha = True
+                            abcPitch = ch
+
+                # prepend chord symbol
+                collectStr = activeChordSymbol + noteStr
+                activeChordSymbol = ''  # reset
+                self.currentCollectStr = collectStr
+                # environLocal.printDebug(['got note event:', repr(collectStr)])
+                first = collectStr[0]
 
                 # NOTE: skipping a number of articulations and other markers
                 # that are not yet supported
-                # some collections here are not yet supported; others may be
-                # the result of errors in encoded files
-                # v is up bow; might be: "^Segno"v which also should be dropped
-                # H is fermata
-                # . dot may be staccato, but should be attached to pitch
-                if self.currentCollectStr in ('w', 'u', 'v', 'v.', 'h', 'H', 'vk',
-                               'uk', 'U', '~',
-                               '.', '=', 'V', 'v.', 'S', 's',
-                               'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
-                               'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
-                               'l', 'L', 'R',
-                               'y', 'T', 't', 'x', 'Z'):
+                if collectStr in _unsupportedNoteEvents:
                     pass
                 # these are bad chords, or other problematic notations like
                 # "D.C."x
-                elif (self.currentCollectStr.startswith('"')
-                      and (self.currentCollectStr[-1] in ('u', 'v', 'k', 'K', 'Q', '.',
-                                                          'y', 'T', 'w', 'h', 'x',)
-                           or self.currentCollectStr.endswith('v.'))):
+                elif (first == '"'
+                      and (collectStr[-1] in 'uvkKQ.yTwhx'
+                           or collectStr.endswith('v.'))):
                     pass
-                elif (self.currentCollectStr.startswith('x')
-                      or self.currentCollectStr.startswith('H')
-                      or self.currentCollectStr.startswith('Z')):
+                elif first in 'xHZ':
                     pass
                 # not sure what =20 refers to
-                elif (len(self.currentCollectStr) > 1
-                      and self.currentCollectStr.startswith('=')
-                      and self.currentCollectStr[1].isdigit()):
+                elif (first == '='
+                      and len(collectStr) > 1
+                      and collectStr[1].isdigit()):
                     pass
-                # only let valid self.currentCollectStr strings be parsed
+                # only let valid collectStr strings be parsed
                 elif abcPitch:
                     pitchClass = abcPitch[0].upper()
                     carriedAccidental = None
-                    propagation = self._accidentalPropagation()
                     if accidental:
                         # Remember the active accidentals in the measure
                         if propagation == 'octave':
@@ -2391,16 +2243,82 @@ class ABCHandler:
                             carriedAccidental = accidentalized[pitchClass]
                         elif propagation == 'octave' and abcPitch in accidentalized:
                             carriedAccidental = accidentalized[abcPitch]
-                    abcNote = ABCNote(self.currentCollectStr, carriedAccidental=carriedAccidental)
-                    self.tokens.append(abcNote)
+                    tokens.append(ABCNote(collectStr, carriedAccidental=carriedAccidental))
                 else:
-                    self.tokens.append(ABCNote(self.currentCollectStr))
+                    tokens.append(ABCNote(collectStr))
+            elif kind == 'skip' or kind == 'other':
+                # look for white space: can be used to determine beam groups
+                # no action: normal continuation
+                pass
 
-                self.skipAhead = j - (self.pos + 1)
-                continue
-            # look for white space: can be used to determine beam groups
-            # no action: normal continuation of 1 char
-            pass
+            # comment lines, also encoding defs
+            elif kind == 'comment':
+                self.pos = pos
+                self.processComment()
+                # directives and the abc version can change how accidentals carry
+                propagation = self._accidentalPropagation()
+
+            elif kind == 'bar':
+                accidentalized = {}
+                accidental = None
+                # filter and replace with 2 tokens if necessary
+                tokens.extend(self.barlineTokenFilter(m.group(kind)))
+
+            # get tuplet indicators: (2, (3, (p:q:r or (3::
+            elif kind == 'tuplet':
+                tokens.append(ABCTuplet(m.group(kind)))
+
+            # get broken rhythm modifiers: < or >, >>, up to <<<
+            elif kind == 'brokenRhythm':
+                # a run is never extended to include the last character of the source
+                end = max(pos + 1, min(end, srcLen - 1))
+                tokens.append(ABCBrokenRhythmMarker(strSrc[pos:end]))
+
+            # get dynamics. skip over the open paren to avoid confusion.
+            # NB: Nested crescendos are not an issue (not proper grammar).
+            elif kind == 'exclaim':
+                j = strSrc.find('!', pos + 1, pos + 20)  # a reasonable upper bound
+                if j != -1:
+                    exclaimClass = exclaimDict.get(strSrc[pos:j + 1])
+                    # NB: We're currently skipping over all other '!' expressions
+                    if exclaimClass is not None:
+                        tokens.append(exclaimClass('!'))
+                    end = j + 1
+
+            # get slurs, ensuring that they're not confused for tuplets
+            elif kind == 'slur':
+                tokens.append(ABCSlurStart('('))
+
+            elif kind == 'single':
+                c = m.group(kind)
+                tokens.append(singleCharacterTokens[c](c))
+
+            # get chord symbols / guitar chords; collected and joined with
+            # chord or notes
+            elif kind == 'chordSymbol':
+                j = strSrc.find('"', pos + 1, srcLen - 1)
+                end = j + 1 if j != -1 else srcLen
+                # there may be more than one chord symbol: need to accumulate
+                activeChordSymbol += strSrc[pos:end]
+
+            # get chords
+            elif kind == 'chord':
+                # find closing chord bracket
+                j = strSrc.find(']', pos + 1, srcLen - 1)
+                end = j + 1 if j != -1 else srcLen
+                # find outer chord length modifier
+                end = reChordLengthModifier.match(strSrc, end).end()
+                # prepend chord symbol
+                self.currentCollectStr = activeChordSymbol + strSrc[pos:end]
+                activeChordSymbol = ''  # reset
+                # environLocal.printDebug(['got chord:', repr(self.currentCollectStr)])
+                tokens.append(ABCChord(self.currentCollectStr))
+                # TODO: Chords need to be aware of accidentals too.
+                # Also what happens to prefixes and suffixes attached to chords,
+                # like ties.
+
+            pos = end
+        self.pos = pos
 
     def tokenProcess(self):
         '''
@@ -3224,7 +3142,17 @@ class ABCFile(prebase.ProtoM21Object):
     The abcVersion attribution optionally specifies the (major, minor, patch)
     version of ABC to process-- e.g., (1.2.0).
     If not set, default ABC 1.3 parsing is performed.
+
+    Large collections can be read one tune at a time: when a file has been
+    opened by name, `read(number=...)` uses a persisted index of the `X:` lines
+    (see :meth:`~music21.abcFormat.ABCFile.indexReferenceNumbers`) and only
+    tokenizes the requested tune, and
+    :meth:`~music21.abcFormat.ABCFile.iterateScores` translates the tunes of
+    any open file one after another.
     '''
+    # bump when the format of the persisted tune index changes
+    tuneIndexVersion = 1
+
     def __init__(self, abcVersion=None):
         self.abcVersion = abcVersion
         self.file = None
@@ -3263,6 +3191,8 @@ class ABCFile(prebase.ProtoM21Object):
 
         If `number` is given, a work number will be extracted if possible.
         '''
+        if number is not None and self.filename is not None:
+            return self.readstr(self.readTuneSource(number))
         return self.readstr(self.file.read(), number)
 
     @staticmethod
@@ -3316,7 +3246,7 @@ class ABCFile(prebase.ProtoM21Object):
                     forcedNum = int(line.replace(' ', '').rstrip().replace('X:', ''))
                     if forcedNum == int(number):
                         gather = True
-                except TypeError:
+                except (TypeError, ValueError):
                     pass
             # if already gathering and find another ref number definition
             # stop gathering
@@ -3333,6 +3263,231 @@ class ABCFile(prebase.ProtoM21Object):
         referenceNumbers = '\n'.join(collect)
         return referenceNumbers
 
+    @staticmethod
+    def _referenceNumberFromLine(line):
+        '''
+        Return a two-element tuple of whether `line` is an `X:` reference number
+        line and the number it defines, if it can be read as an integer.
+
+        >>> abcFormat.ABCFile._referenceNumberFromLine('  X: 0490\\r\\n')
+        (True, 490)
+        >>> abcFormat.ABCFile._referenceNumberFromLine(b'X:2')
+        (True, 2)
+        >>> abcFormat.ABCFile._referenceNumberFromLine('X:two')
+        (True, None)
+        >>> abcFormat.ABCFile._referenceNumberFromLine('T:X:1')
+        (False, None)
+        '''
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        line = line.strip()
+        if not line.startswith('X:'):
+            return (False, None)
+        try:
+            return (True, int(line[2:].replace(' ', '')))
+        except ValueError:
+            return (True, None)
+
+    @staticmethod
+    def scanReferenceNumbers(fileLike) -> dict:
+        '''
+        Scan a binary file-like object for the lines that begin a new tune
+        with an `X:` reference number, and return a dictionary giving the
+        byte range of the file header (everything before the first `X:`)
+        and a list of [number, start, end] byte ranges, one per tune, in
+        file order.  Tunes whose reference number is not an integer have
+        a number of None.
+
+        >>> from io import BytesIO
+        >>> data = b'%abc-2.1\\nO: Irish\\n\\nX:1\\nT:One\\nX:02\\nT:Two\\n'
+        >>> scan = abcFormat.ABCFile.scanReferenceNumbers(BytesIO(data))
+        >>> scan['header']
+        [0, 19]
+        >>> scan['tunes']
+        [[1, 19, 29], [2, 29, 40]]
+        >>> data[29:40]
+        b'X:02\\nT:Two\\n'
+        '''
+        tunes = []
+        headerEnd = None
+        position = 0
+        for line in fileLike:
+            isReference, number = ABCFile._referenceNumberFromLine(line)
+            if isReference:
+                if headerEnd is None:
+                    headerEnd = position
+                if tunes:
+                    tunes[-1][2] = position
+                tunes.append([number, position, None])
+            position += len(line)
+        if tunes:
+            tunes[-1][2] = position
+        else:
+            headerEnd = position
+        return {'header': [0, headerEnd], 'tunes': tunes}
+
+    def _tuneIndexCachePath(self) -> pathlib.Path:
+        '''
+        Return the path in the scratch directory where the tune index for
+        the open file is stored.
+        '''
+        key = str(pathlib.Path(self.filename).resolve()).encode('utf-8')
+        digest = hashlib.sha1(key).hexdigest()[:20]
+        return environLocal.getRootTempDir() / f'm21AbcIndex-{digest}.json'
+
+    def indexReferenceNumbers(self, useCache=True) -> dict:
+        '''
+        Return the index of tune boundaries (see
+        :meth:`~music21.abcFormat.ABCFile.scanReferenceNumbers`) for the file
+        opened with `open()`.
+
+        The index is stored as JSON in the scratch directory and reused until the
+        file's size or modification time changes, so finding one tune in a large
+        collection only requires reading that tune's bytes.
+
+        >>> af = abcFormat.ABCFile()
+        >>> af.open(common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc')
+        >>> index = af.indexReferenceNumbers()
+        >>> len(index['tunes'])
+        554
+        >>> index['tunes'][1][0]
+        2
+        >>> af.close()
+        '''
+        if self.filename is None:
+            raise ABCFileException('can only index files opened by name')
+        stat = os.stat(self.filename)
+        cachePath = self._tuneIndexCachePath()
+        if useCache and cachePath.exists():
+            try:
+                with io.open(cachePath, encoding='utf-8') as f:
+                    index = json.load(f)
+                if (index.get('version') == self.tuneIndexVersion
+                        and index.get('size') == stat.st_size
+                        and index.get('mtime') == stat.st_mtime):
+                    return index
+            except (OSError, ValueError):
+                pass
+
+        with io.open(self.filename, 'rb') as f:
+            index = self.scanReferenceNumbers(f)
+        index['version'] = self.tuneIndexVersion
+        index['size'] = stat.st_size
+        index['mtime'] = stat.st_mtime
+        if useCache:
+            try:
+                with io.open(cachePath, 'w', encoding='utf-8') as f:
+                    json.dump(index, f)
+            except OSError:  # pragma: no cover
+                environLocal.printDebug(['could not write ABC tune index', cachePath])
+        return index
+
+    def readTuneSource(self, number: int) -> str:
+        '''
+        Return the source of the tune with reference number `number` from the
+        file opened with `open()`, reading only that tune's bytes.
+        The result is the same as calling
+        :meth:`~music21.abcFormat.ABCFile.extractReferenceNumber` on the
+        whole file (apart from the trailing newline).
+
+        >>> af = abcFormat.ABCFile()
+        >>> af.open(common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc')
+        >>> print(af.readTuneSource(2)[:36])
+        X:2
+        T: Zanmen de ling xiu Mao Zedong
+        >>> af.readTuneSource(999)
+        Traceback (most recent call last):
+        music21.abcFormat.ABCFileException: cannot find requested
+            reference number in source file: 999
+        >>> af.close()
+
+        Reference numbers that are not integers are not in the index, so
+        the whole file is searched for them instead.
+        '''
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            with io.open(self.filename, encoding='utf-8') as f:
+                return self.extractReferenceNumber(f.read(), number)
+        for tuneNumber, start, end in self.indexReferenceNumbers()['tunes']:
+            if tuneNumber == number:
+                return self._readBytes(start, end)
+        raise ABCFileException(
+            f'cannot find requested reference number in source file: {number}')
+
+    def _readBytes(self, start, end) -> str:
+        '''
+        Read and decode the bytes from `start` to `end` of the named file,
+        normalizing line endings as reading in text mode would.
+        '''
+        with io.open(self.filename, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start).decode('utf-8')
+        return data.replace('\r\n', '\n').replace('\r', '\n')
+
+    def iterateTuneSources(self):
+        '''
+        Yield (number, source) tuples for each tune of the open file in turn,
+        reading the file one line at a time so that only one tune is held in memory.
+        The file header (anything before the first `X:` line) is prepended to
+        every tune, as :meth:`~music21.abcFormat.ABCHandler.splitByReferenceNumber`
+        does.  A file with no reference numbers yields one tune with number None.
+
+        >>> from io import StringIO
+        >>> af = abcFormat.ABCFile()
+        >>> af.openFileLike(StringIO('O: Irish\\nX:1\\nT:One\\nX:2\\nT:Two\\n'))
+        >>> for number, src in af.iterateTuneSources():
+        ...     print(number, repr(src))
+        1 'O: Irish\\nX:1\\nT:One\\n'
+        2 'O: Irish\\nX:2\\nT:Two\\n'
+        '''
+        header = []
+        current = None
+        number = None
+        for line in self.file:
+            isReference, lineNumber = self._referenceNumberFromLine(line)
+            if isReference:
+                if current is not None:
+                    yield (number, ''.join(header + current))
+                current = []
+                number = lineNumber
+            if current is None:
+                header.append(line)
+            else:
+                current.append(line)
+        if current is not None:
+            yield (number, ''.join(header + current))
+        elif header:
+            yield (None, ''.join(header))
+
+    def iterateScores(self):
+        '''
+        Yield a :class:`~music21.stream.Score` for each tune in the open file,
+        tokenizing and translating one tune at a time.  Unlike parsing the file
+        into an :class:`~music21.stream.Opus`, memory use is bounded by the largest
+        tune rather than by the whole collection.
+
+        >>> af = abcFormat.ABCFile()
+        >>> af.open(common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc')
+        >>> scores = af.iterateScores()
+        >>> sc = next(scores)
+        >>> sc.metadata.number
+        '1'
+        >>> next(scores).metadata.title
+        'Zanmen de ling xiu Mao Zedong'
+        >>> af.close()
+
+        As when building an Opus, a tune that cannot be translated is skipped
+        with a warning.
+        '''
+        for number, src in self.iterateTuneSources():
+            handler = ABCHandler(abcVersion=self.abcVersion)
+            handler.process(src)
+            try:
+                yield translate.abcToStreamScore(handler)
+            except IndexError:
+                environLocal.warn(f'Failure for piece number {number}')
+
     def readstr(self, strSrc: str, number: Optional[int] = None) -> ABCHandler:
         '''
         Read a string and process all Tokens.
@@ -3655,6 +3810,71 @@ class Test(unittest.TestCase):
         af.close()
         self.assertEqual(len(ah), 101)
 
+    def testTuneIndexMatchesExtract(self):
+        from music21 import corpus
+        fp = corpus.getWork('essenFolksong/han1')
+        with io.open(fp, encoding='utf-8') as f:
+            data = f.read()
+
+        af = ABCFile()
+        af.open(fp)
+        for number in (1, 2, 339, 554):
+            self.assertEqual(af.readTuneSource(number).rstrip('\n'),
+                             ABCFile.extractReferenceNumber(data, number).rstrip('\n'))
+        af.close()
+
+    def testTuneSourceNonIntegerNumber(self):
+        fp = environLocal.getTempFile('.abc')
+        with io.open(fp, 'w', encoding='utf-8') as f:
+            f.write('X:1\nT:One\nK:C\nCDEF|\nX:2a\nT:Two\nK:C\nGABc|\n')
+        af = ABCFile()
+        af.open(fp)
+        self.assertIn('T:Two', af.readTuneSource('2a'))
+        self.assertIn('T:One', af.readTuneSource('1'))
+        with self.assertRaises(ABCFileException):
+            af.readTuneSource('3b')
+        af.close()
+        os.remove(fp)
+        os.remove(af._tuneIndexCachePath())
+
+    def testTuneIndexPersisted(self):
+        fp = environLocal.getTempFile('.abc')
+        with io.open(fp, 'w', encoding='utf-8') as f:
+            f.write('X:1\nT:One\nK:C\nCDEF|\nX:2\nT:Two\nK:C\nGABc|\n')
+        af = ABCFile()
+        af.open(fp)
+        cachePath = af._tuneIndexCachePath()
+        self.assertEqual([t[0] for t in af.indexReferenceNumbers()['tunes']], [1, 2])
+        self.assertTrue(cachePath.exists())
+        af.close()
+
+        # changing the file invalidates the stored index
+        with io.open(fp, 'a', encoding='utf-8') as f:
+            f.write('X:3\nT:Three\nK:C\ncBAG|\n')
+        af = ABCFile()
+        af.open(fp)
+        self.assertIn('T:Three', af.readTuneSource(3))
+        af.close()
+        os.remove(fp)
+        os.remove(cachePath)
+
+    def testIterateScoresMatchesOpus(self):
+        from music21.abcFormat import testFiles
+        from io import StringIO
+
+        ah = ABCHandler()
+        ah.process(testFiles.theAleWifesDaughter + '\n' + testFiles.williamAndNancy)
+        opus = translate.abcToStreamOpus(ah)
+
+        af = ABCFile()
+        af.openFileLike(StringIO(testFiles.theAleWifesDaughter + '\n'
+                                 + testFiles.williamAndNancy))
+        scores = list(af.iterateScores())
+        self.assertEqual(len(scores), len(opus.scores))
+        for sc, opusScore in zip(scores, opus.scores):
+            self.assertEqual(sc.metadata.title, opusScore.metadata.title)
+            self.assertEqual(len(sc.flat.notes), len(opusScore.flat.notes))
+
     def testSlurs(self):
         from music21.abcFormat import testFiles
         ah = ABCHandler()
@@ -70,13 +70,46 @@ class StreamAligner:
     - m, the number of columns in the distance matrix, the top-most row of the matrix
     - j, the index into columns in the distance matrix
     - the second element of tuple
+
+    The `mode` determines how much of the distance matrix is kept in memory:
+
+    - 'full' (default) computes and stores the whole (n+1) x (m+1) matrix
+      in `self.distanceMatrix`.
+    - 'banded' only computes the cells near the diagonal, starting with a band of
+      `bandWidth` cells on either side and widening it until the alignment found is
+      known to be optimal (Ukkonen's method).  Fast and small for streams that are
+      mostly the same, like OMR output and a ground truth.
+    - 'hirschberg' finds an optimal alignment in memory proportional to n + m by
+      splitting the problem in half recursively (Hirschberg's method).
+
+    All three find an alignment of the same total cost (`self.alignmentCost`), but where
+    several alignments are equally good, 'banded' and 'hirschberg' may not choose the same
+    one as 'full'.  Neither stores `self.distanceMatrix`.
+
+    >>> target = converter.parse('tinyNotation: c4 d e f g a b')
+    >>> source = converter.parse('tinyNotation: c4 d f g a a b')
+    >>> for mode in ('full', 'banded', 'hirschberg'):
+    ...     sa = alpha.analysis.aligner.StreamAligner(target, source, mode=mode)
+    ...     sa.align()
+    ...     print(mode, sa.alignmentCost)
+    full 3
+    banded 3
+    hirschberg 3
     '''
+    modes = ('full', 'banded', 'hirschberg')
 
-    def __init__(self, targetStream=None, sourceStream=None, hasher_func=None, preHashed=False):
+    def __init__(self, targetStream=None, sourceStream=None, hasher_func=None, preHashed=False,
+                 *, mode='full', bandWidth=16):
         self.targetStream = targetStream
         self.sourceStream = sourceStream
 
+        if mode not in self.modes:
+            raise AlignerException(f'mode must be one of {self.modes}, not {mode!r}')
+        self.mode = mode
+        self.bandWidth = bandWidth
+
         self.distanceMatrix = None
+        self.alignmentCost = None
 
         if hasher_func is None:
             hasher_func = self.getDefaultHasher()
@@ -93,6 +126,7 @@ class StreamAligner:
 
         self.hashedTargetStream = None
         self.hashedSourceStream = None
+        self._streamCodes = None
         self.changesCount = None
 
     def getDefaultHasher(self):
@@ -118,9 +152,15 @@ class StreamAligner:
 
     def align(self):
         self.makeHashedStreams()
-        self.setupDistanceMatrix()
-        self.populateDistanceMatrix()
-        self.calculateChangesList()
+        if self.mode == 'banded':
+            self.alignBanded()
+        elif self.mode == 'hirschberg':
+            self.alignHirschberg()
+        else:
+            self.setupDistanceMatrix()
+            self.populateDistanceMatrix()
+            self.alignmentCost = int(self.distanceMatrix[self.n][self.m])
+            self.calculateChangesList()
 
     def makeHashedStreams(self):
         '''
@@ -174,7 +214,16 @@ class StreamAligner:
          NoteHashWithReference(Pitch=67, Duration=1.0, Offset=1.0)]
 
         '''
-        if not self.preHashed:
+        self._streamCodes = None
+        if not self.preHashed and self._canHashToCodes():
+            # hashes both streams to codes that can be compared at once;
+            # not cached on the streams, since fixers change their notes in place
+            targetCodes = self.hasher.hashStreamCodes(self.targetStream, useCache=False)
+            sourceCodes = self.hasher.hashStreamCodes(self.sourceStream, useCache=False)
+            self._streamCodes = (targetCodes.codes, sourceCodes.codes)
+            self.hashedTargetStream = targetCodes.noteHashes()
+            self.hashedSourceStream = sourceCodes.noteHashes()
+        elif not self.preHashed:
             self.hashedTargetStream = self.hasher.hashStream(self.targetStream)
             self.hashedSourceStream = self.hasher.hashStream(self.sourceStream)
 
@@ -309,6 +358,15 @@ class StreamAligner:
         insertCost = self.insertCost(self.hashedSourceStream[0])
         deleteCost = self.deleteCost(self.hashedSourceStream[0])
 
+        if self._usesDefaultCosts():
+            # the same values, a row at a time
+            codes = self._hashCodes()
+            self.distanceMatrix[0] = self._firstRow(self.m, deleteCost)
+            for i in range(1, self.n + 1):
+                self.distanceMatrix[i] = self._nextRow(
+                    self.distanceMatrix[i - 1], codes, i - 1, 0, self.m, insertCost, deleteCost)
+            return
+
         # setup all the entries in the first column, the target stream
         for i in range(1, self.n + 1):
             self.distanceMatrix[i][0] = self.distanceMatrix[i - 1][0] + insertCost
@@ -856,9 +914,305 @@ class StreamAligner:
         if i != 0 and j != 0:
             raise AlignmentTracebackException('Traceback of best alignment did not end properly')
 
+        self._countChanges()
+
+    def _countChanges(self):
         self.changesCount = Counter(elem[2] for elem in self.changes)
         self.similarityScore = float(self.changesCount[ChangeOps.NoChange]) / len(self.changes)
 
+    # --------------------------------------------------------------------------
+    # vectorized alignment
+
+    def _usesDefaultCosts(self):
+        '''
+        Returns True unless a subclass has changed how costs are computed, in which case
+        the vectorized methods cannot be used.
+        '''
+        cls = type(self)
+        return all(getattr(cls, name) is getattr(StreamAligner, name)
+                   for name in ('insertCost', 'deleteCost', 'substitutionCost',
+                                'calculateNumSimilarities', 'tupleEqualityWithoutReference'))
+
+    def _canHashToCodes(self):
+        return (isinstance(self.hasher, hasher.Hasher)
+                and type(self.hasher).hashStream is hasher.Hasher.hashStream
+                and 'numpy' not in base._missingImport)
+
+    def _hashCodes(self):
+        '''
+        Returns a pair of arrays, of shape (n, k) and (m, k), where k is the number of
+        hashed attributes, giving a number for the value of each attribute of each hashed
+        item in the target and source streams, so that two items are equal
+        in an attribute when their numbers are.
+
+        >>> target = converter.parse('tinyNotation: c4 d e')
+        >>> source = converter.parse('tinyNotation: c2 e4')
+        >>> sa = alpha.analysis.aligner.StreamAligner(target, source)
+        >>> sa.makeHashedStreams()
+        >>> targetCodes, sourceCodes = sa._hashCodes()
+        >>> targetCodes.tolist()
+        [[0, 0], [1, 0], [2, 0]]
+        >>> sourceCodes.tolist()
+        [[0, 1], [2, 0]]
+        '''
+        if 'numpy' in base._missingImport:
+            raise AlignerException('Cannot run Aligner without numpy.')
+        import numpy as np
+
+        if getattr(self, '_streamCodes', None) is not None:
+            return self._streamCodes
+
+        keys = self.hashedSourceStream[0].hashItemsKeys
+        valueCodes = [{} for _ in keys]
+
+        def encode(hashedStream):
+            return np.array(
+                [[codes.setdefault(getattr(tup, key), len(codes))
+                  for key, codes in zip(keys, valueCodes)]
+                 for tup in hashedStream],
+                dtype=np.int64).reshape(len(hashedStream), len(keys))
+
+        return encode(self.hashedTargetStream), encode(self.hashedSourceStream)
+
+    @staticmethod
+    def _firstRow(length, deleteCost):
+        import numpy as np
+        return np.arange(length + 1, dtype=np.int64) * deleteCost
+
+    @staticmethod
+    def _nextRow(previousRow, codes, targetIndex, sourceStart, sourceEnd,
+                 insertCost, deleteCost):
+        '''
+        Given a row of the distance matrix for the source items sourceStart to
+        sourceEnd, returns the next row, for target item `targetIndex`.
+        Every cell is the minimum of the cell above plus the insert cost, the
+        cell diagonally above plus the substitution cost, and the cell to the left plus
+        the delete cost; the last is found for the whole row at once
+        with a running minimum.
+        '''
+        import numpy as np
+        targetCodes, sourceCodes = codes
+        numKeys = targetCodes.shape[1]
+        substitution = numKeys - (sourceCodes[sourceStart:sourceEnd]
+                                  == targetCodes[targetIndex]).sum(axis=1)
+        best = np.empty_like(previousRow)
+        best[0] = previousRow[0] + insertCost
+        np.minimum(previousRow[1:] + insertCost, previousRow[:-1] + substitution, out=best[1:])
+        deletes = np.arange(len(best), dtype=np.int64) * deleteCost
+        return np.minimum.accumulate(best - deletes) + deletes
+
+    def _substitutionCost(self, codes, i, j):
+        targetCodes, sourceCodes = codes
+        return int(targetCodes.shape[1] - (targetCodes[i - 1] == sourceCodes[j - 1]).sum())
+
+    def _traceback(self, getCost, codes, i, j, iStart=0, jStart=0):
+        '''
+        Follows the cells of a distance matrix, where getCost(i, j) gives the cost in
+        each cell, from (i, j) back to (iStart, jStart) and returns a list of
+        (op, i, j) tuples for each step, last first.  Where several steps are equally good,
+        a diagonal step is preferred to an insertion, and that to a deletion.
+        '''
+        insertCost = self.insertCost(self.hashedSourceStream[0])
+        ops = []
+        while i > iStart or j > jStart:
+            cost = getCost(i, j)
+            if i > iStart and j > jStart:
+                substitution = self._substitutionCost(codes, i, j)
+                if getCost(i - 1, j - 1) + substitution == cost:
+                    op = ChangeOps.NoChange if substitution == 0 else ChangeOps.Substitution
+                    ops.append((op, i, j))
+                    i -= 1
+                    j -= 1
+                    continue
+            if i > iStart and getCost(i - 1, j) + insertCost == cost:
+                ops.append((ChangeOps.Insertion, i, j))
+                i -= 1
+            elif j > jStart:
+                ops.append((ChangeOps.Deletion, i, j))
+                j -= 1
+            else:  # pragma: no cover
+                raise AlignmentTracebackException(
+                    'Traceback of best alignment did not end properly')
+        return ops
+
+    def _changesFromOps(self, ops):
+        '''
+        Sets self.changes from a list of (op, i, j) tuples in order.
+        '''
+        self.changes = [(self.hashedTargetStream[i - 1].reference,
+                         self.hashedSourceStream[j - 1].reference,
+                         op) for op, i, j in ops]
+        self._countChanges()
+
+    def _checkLengths(self):
+        self.n = len(self.hashedTargetStream)
+        self.m = len(self.hashedSourceStream)
+        if self.n == 0:
+            raise AlignerException('Cannot perform alignment with empty target stream.')
+        if self.m == 0:
+            raise AlignerException('Cannot perform alignment with empty source stream.')
+        if not self._usesDefaultCosts():
+            raise AlignerException(
+                f'The {self.mode!r} mode cannot be used with custom cost methods.')
+
+    def alignBanded(self):
+        '''
+        Align the hashed streams, computing only a band of the distance matrix around
+        the diagonal, widening the band until the alignment is certainly optimal.
+
+        A path through the matrix that strays more than w cells outside the band
+        between the diagonals through (0, 0) and (n, m) must include at least
+        abs(n - m) + 2 * (w + 1) insertions and deletions, so if the best alignment
+        within a band of width w costs less than that, nothing outside can be better.
+
+        >>> target = converter.parse('tinyNotation: c4 d e f g a b')
+        >>> source = converter.parse('tinyNotation: c4 e f g a b')
+        >>> sa = alpha.analysis.aligner.StreamAligner(target, source, bandWidth=1)
+        >>> sa.makeHashedStreams()
+        >>> sa.alignBanded()
+        >>> sa.alignmentCost
+        2
+        >>> [op.name for unused_t, unused_s, op in sa.changes]
+        ['NoChange', 'Insertion', 'NoChange', 'NoChange', 'NoChange', 'NoChange', 'NoChange']
+        >>> sa.bandWidth
+        1
+        '''
+        import numpy as np
+
+        self._checkLengths()
+        n = self.n
+        m = self.m
+        insertCost = self.insertCost(self.hashedSourceStream[0])
+        deleteCost = self.deleteCost(self.hashedSourceStream[0])
+        codes = self._hashCodes()
+        targetCodes, sourceCodes = codes
+        numKeys = targetCodes.shape[1]
+        infinity = np.int64(1) << 50
+        minIndelCost = min(insertCost, deleteCost)
+
+        width = max(int(self.bandWidth), 1)
+        while True:
+            # column j of row i is stored at band[i, j - i - lowDiagonal]
+            lowDiagonal = min(0, m - n) - width
+            highDiagonal = max(0, m - n) + width
+            bandSize = highDiagonal - lowDiagonal + 1
+            band = np.full((n + 1, bandSize), infinity, dtype=np.int64)
+            offsets = np.arange(bandSize, dtype=np.int64)
+            deletes = offsets * deleteCost
+
+            columns = lowDiagonal + offsets
+            valid = (columns >= 0) & (columns <= m)
+            band[0, valid] = columns[valid] * deleteCost
+
+            for i in range(1, n + 1):
+                previous = band[i - 1]
+                columns = i + lowDiagonal + offsets
+                best = np.full(bandSize, infinity, dtype=np.int64)
+                # from above: the same column is one place to the right in the previous row
+                best[:-1] = previous[1:] + insertCost
+                # from the upper left
+                hasDiagonal = (columns >= 1) & (columns <= m)
+                diagonalColumns = columns[hasDiagonal] - 1
+                substitution = numKeys - (sourceCodes[diagonalColumns]
+                                          == targetCodes[i - 1]).sum(axis=1)
+                best[hasDiagonal] = np.minimum(best[hasDiagonal],
+                                               previous[hasDiagonal] + substitution)
+                best[(columns < 0) | (columns > m)] = infinity
+                row = np.minimum.accumulate(best - deletes) + deletes
+                row[(columns < 0) | (columns > m)] = infinity
+                band[i] = np.minimum(row, infinity)
+
+            cost = int(band[n, m - n - lowDiagonal])
+            if (cost < minIndelCost * (abs(n - m) + 2 * (width + 1))
+                    or width >= max(n, m)):
+                break
+            width *= 2
+
+        def getCost(i, j):
+            k = j - i - lowDiagonal
+            if 0 <= k < bandSize:
+                return int(band[i, k])
+            return int(infinity)
+
+        self.bandWidth = width
+        self.alignmentCost = cost
+        ops = self._traceback(getCost, codes, n, m)
+        ops.reverse()
+        self._changesFromOps(ops)
+
+    def _lastRow(self, codes, iStart, iEnd, jStart, jEnd, insertCost, deleteCost):
+        '''
+        The last row of the distance matrix for target items iStart to iEnd and source items
+        jStart to jEnd, computed keeping only one row at a time.
+        '''
+        row = self._firstRow(jEnd - jStart, deleteCost)
+        for i in range(iStart, iEnd):
+            row = self._nextRow(row, codes, i, jStart, jEnd, insertCost, deleteCost)
+        return row
+
+    def alignHirschberg(self, maximumCells=100_000):
+        '''
+        Align the hashed streams in memory proportional to n + m: find the column where
+        an optimal path crosses the middle row of the distance matrix, from the costs
+        of aligning the first half of the target forwards and the second half backwards,
+        then align each quarter of the matrix that the path goes through in the same way.
+        Pieces with fewer than `maximumCells` cells are aligned with a full matrix.
+
+        >>> target = converter.parse('tinyNotation: c4 d e f g a b')
+        >>> source = converter.parse('tinyNotation: c4 e f g a b')
+        >>> sa = alpha.analysis.aligner.StreamAligner(target, source)
+        >>> sa.makeHashedStreams()
+        >>> sa.alignHirschberg(maximumCells=4)
+        >>> sa.alignmentCost
+        2
+        >>> [op.name for unused_t, unused_s, op in sa.changes]
+        ['NoChange', 'Insertion', 'NoChange', 'NoChange', 'NoChange', 'NoChange', 'NoChange']
+        '''
+        import numpy as np
+
+        self._checkLengths()
+        insertCost = self.insertCost(self.hashedSourceStream[0])
+        deleteCost = self.deleteCost(self.hashedSourceStream[0])
+        codes = self._hashCodes()
+        targetCodes, sourceCodes = codes
+        reversedCodes = (targetCodes[::-1], sourceCodes[::-1])
+        n = self.n
+        m = self.m
+
+        ops = []
+        totalCost = 0
+        # a stack of pieces of the matrix, processed first-piece-first
+        pieces = [(0, n, 0, m)]
+        while pieces:
+            iStart, iEnd, jStart, jEnd = pieces.pop()
+            if ((iEnd - iStart + 1) * (jEnd - jStart + 1) <= maximumCells
+                    or iEnd - iStart <= 1):
+                matrix = np.empty((iEnd - iStart + 1, jEnd - jStart + 1), dtype=np.int64)
+                matrix[0] = self._firstRow(jEnd - jStart, deleteCost)
+                for i in range(iStart, iEnd):
+                    matrix[i - iStart + 1] = self._nextRow(matrix[i - iStart], codes, i,
+                                                           jStart, jEnd, insertCost, deleteCost)
+                totalCost += int(matrix[-1, -1])
+                pieceOps = self._traceback(
+                    lambda i, j: int(matrix[i - iStart, j - jStart]),
+                    codes, iEnd, jEnd, iStart, jStart)
+                pieceOps.reverse()
+                ops.extend(pieceOps)
+                continue
+
+            iMiddle = (iStart + iEnd) // 2
+            forward = self._lastRow(codes, iStart, iMiddle, jStart, jEnd,
+                                    insertCost, deleteCost)
+            backward = self._lastRow(reversedCodes, n - iEnd, n - iMiddle, m - jEnd, m - jStart,
+                                     insertCost, deleteCost)
+            jMiddle = jStart + int(np.argmin(forward + backward[::-1]))
+            # the second half goes on the stack first, so that it is done second
+            pieces.append((iMiddle, iEnd, jMiddle, jEnd))
+            pieces.append((iStart, iMiddle, jStart, jMiddle))
+
+        self.alignmentCost = totalCost
+        self._changesFromOps(ops)
+
     def showChanges(self, show=False):
         '''
         Visual and debugging feature to display which notes are changed.
@@ -1147,6 +1501,73 @@ class Test(unittest.TestCase):
         self.assertEqual(source.getElementById(sa.changes[2][1].id).style.color, 'purple')
         self.assertEqual(source.getElementById(sa.changes[2][1].id).lyric, '2')
 
+    def testModesAgree(self):
+        '''
+        the vectorized matrix is the same as the one computed cell by cell, and the
+        banded and Hirschberg modes find alignments of the same cost.
+        '''
+        import random
+        from music21 import stream
+        from music21 import note
+
+        class CellByCellAligner(StreamAligner):
+            def insertCost(self, tup):
+                return super().insertCost(tup)
+
+        rand = random.Random(5)
+
+        def randomStream(length):
+            s = stream.Stream()
+            for _ in range(length):
+                s.append(note.Note(rand.choice(range(60, 65)),
+                                   quarterLength=rand.choice([0.5, 1, 2])))
+            return s
+
+        for _ in range(20):
+            target = randomStream(rand.randint(1, 30))
+            source = randomStream(rand.randint(1, 30))
+            sa = StreamAligner(target, source)
+            sa.align()
+            saCells = CellByCellAligner(target, source)
+            saCells.align()
+            self.assertEqual(sa.distanceMatrix.tolist(), saCells.distanceMatrix.tolist())
+            self.assertEqual(sa.changes, saCells.changes)
+
+            saBanded = StreamAligner(target, source, mode='banded', bandWidth=1)
+            saBanded.align()
+            saHirschberg = StreamAligner(target, source, mode='hirschberg')
+            saHirschberg.makeHashedStreams()
+            saHirschberg.alignHirschberg(maximumCells=6)
+            for other in (saBanded, saHirschberg):
+                self.assertEqual(other.alignmentCost, sa.alignmentCost)
+                counts = other.changesCount
+                usesTarget = len(other.changes) - counts[ChangeOps.Deletion]
+                usesSource = len(other.changes) - counts[ChangeOps.Insertion]
+                self.assertEqual((usesTarget, usesSource), (len(target), len(source)))
+
+    def testAlignAfterNotesChange(self):
+        '''
+        notes changed in place (as the fixers do) are hashed again when realigned.
+        '''
+        from music21 import converter
+        from music21 import pitch
+
+        target = converter.parse('tinyNotation: 4/4 c4 d e f')
+        source = converter.parse('tinyNotation: 4/4 c4 d e g')
+        lastNote = source.recurse().notes.last()
+        sa = StreamAligner(target, source)
+        sa.align()
+        self.assertEqual(sa.similarityScore, 0.75)
+
+        lastNote.pitch = pitch.Pitch('F4')
+        sa = StreamAligner(target, source)
+        sa.align()
+        self.assertEqual(sa.similarityScore, 1.0)
+
+    def testBadMode(self):
+        with self.assertRaises(AlignerException):
+            StreamAligner(mode='quadratic')
+
 
 if __name__ == '__main__':
     import music21
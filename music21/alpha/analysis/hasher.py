@@ -14,11 +14,17 @@ import unittest
 import collections
 import difflib
 
+from music21 import base
+from music21 import exceptions21
 from music21 import note, chord, key
 from music21 import interval
 from music21 import stream
 
 
+class HasherException(exceptions21.Music21Exception):
+    pass
+
+
 class Hasher:
     '''
     This is a modular hashing object that can hash notes, chords, and rests, and some of their
@@ -111,6 +117,12 @@ class Hasher:
         self.stateVars = {}
         self.hashingFunctions = {}
 
+        # for hashStreamCodes: the code for each value of each property (for the
+        # current settings, and by settings), and the values for each code
+        self.codeTables = {}
+        self._codeTablesBySettings = {}
+        self._decodeTables = {}
+
     def setupValidTypesAndStateVars(self):
         '''
         Sets up the self.stateVars dictionary depending on how the flags for
@@ -430,6 +442,182 @@ class Hasher:
         # TODO: don't finalHash back and forth, return it in the smaller functions
         return finalHash
 
+    def _elementsToHash(self, s):
+        '''
+        Returns a list of (element, thisChord, reference) triples for each item
+        that hashStream makes a hash for, where element and thisChord are the
+        arguments to the hashing functions.  Keeps track of key signatures as
+        hashStream does.
+        '''
+        self.setupValidTypesAndStateVars()
+        tupValidTypes = tuple(self.validTypes)
+        self.setupTupleList()
+
+        toHash = []
+        for elt in s.recurse():
+            if not isinstance(elt, tupValidTypes):
+                continue
+            if self.hashIsAccidental and isinstance(elt, key.KeySignature):
+                self.stateVars['currKeySig'] = elt
+            elif isinstance(elt, chord.Chord):
+                if self.hashChordsAsNotes:
+                    toHash.extend((n, elt, n) for n in elt)
+                elif self.hashChordsAsChords:
+                    toHash.append((None, elt, elt))
+            else:
+                toHash.append((elt, None, elt))
+        return toHash
+
+    def _hashColumn(self, hashProperty, toHash):
+        '''
+        Returns the values of one property for every item in `toHash`, as a numpy
+        array for the common properties, which are computed together without
+        changing the elements (hashStream rounds durations and offsets in place),
+        or else as a list made by calling the hashing function for each item.
+        '''
+        import numpy as np
+
+        func = getattr(self.hashingFunctions[hashProperty], '__func__', None)
+        if func is Hasher._hashMIDIPitchName:
+            return np.array(
+                [1 if (thisChord is not None and self.hashChordsAsChords)
+                 else (0 if isinstance(e, note.Rest) else e.pitch.midi)
+                 for e, thisChord, unused_ref in toHash],
+                dtype=np.int64)
+        if func in (Hasher._hashDuration, Hasher._hashRoundedDuration):
+            values = [(thisChord if thisChord is not None else e).duration.quarterLength
+                      for e, thisChord, unused_ref in toHash]
+        elif func in (Hasher._hashOffset, Hasher._hashRoundedOffset):
+            values = [(thisChord if thisChord is not None else e).offset
+                      for e, thisChord, unused_ref in toHash]
+        else:
+            return [self.hashingFunctions[hashProperty](e, thisChord=thisChord)
+                    if thisChord is not None
+                    else self.hashingFunctions[hashProperty](e)
+                    for e, thisChord, unused_ref in toHash]
+
+        if func in (Hasher._hashRoundedDuration, Hasher._hashRoundedOffset):
+            values = np.array(values, dtype=np.float64)
+            return np.round(values * self.granularity) / self.granularity
+        return values
+
+    def _encodeColumn(self, hashProperty, column):
+        '''
+        Turn a column of values into integer codes from self.codeTables.
+        '''
+        import numpy as np
+
+        table = self.codeTables.setdefault(hashProperty, {})
+        if isinstance(column, np.ndarray):
+            if not len(column):
+                return np.zeros(0, dtype=np.int64)
+            distinct, inverse = np.unique(column, return_inverse=True)
+            distinctCodes = np.array([table.setdefault(v, len(table))
+                                      for v in distinct.tolist()], dtype=np.int64)
+            return distinctCodes[inverse.reshape(-1)]
+        return np.array([table.setdefault(v, len(table)) for v in column], dtype=np.int64)
+
+    def hashStreamCodes(self, s, useCache=True):
+        '''
+        Hashes the same items of a stream as :meth:`hashStream`, but returns a
+        :class:`HashCodes` object, with a numpy array of integer codes that has a row
+        for each item and a column for each hashed property.  Two items get the
+        same code in a column exactly when hashStream would give them the same value,
+        so codes can be compared all at once, but only with codes from the same Hasher.
+
+        The common properties (MIDI pitch, duration, and offset) are computed for
+        all items together, and unlike hashStream, rounding durations and offsets does
+        not change the notes.
+
+        >>> s = converter.parse('tinyNotation: 4/4 c4 d e c')
+        >>> h = alpha.analysis.hasher.Hasher()
+        >>> hc = h.hashStreamCodes(s)
+        >>> hc.keys
+        ('Pitch', 'Duration', 'Offset')
+        >>> hc.codes.tolist()
+        [[0, 0, 0], [1, 0, 1], [2, 0, 2], [0, 0, 3]]
+        >>> hc.values(1)
+        (62, 1.0, 1.0)
+        >>> [tuple(nh) for nh in hc.noteHashes()] == [tuple(nh) for nh in h.hashStream(s)]
+        True
+
+        Unless `useCache` is False, the codes are stored on the stream, so hashing
+        it again with the same settings is almost free.  They are forgotten whenever
+        elements are added to or removed from the stream (but not if the elements
+        themselves change).
+
+        >>> hc = h.hashStreamCodes(s)
+        >>> h.hashStreamCodes(s) is hc
+        True
+        >>> s.measure(1).append(note.Note('G4'))
+        >>> len(h.hashStreamCodes(s).codes)
+        5
+
+        Another Hasher with the same settings reuses the stored result, translated
+        into its own codes:
+
+        >>> h2 = alpha.analysis.hasher.Hasher()
+        >>> h2.hashStreamCodes(converter.parse('tinyNotation: 4/4 g4')).codes.tolist()
+        [[0, 0, 0]]
+        >>> hc2 = h2.hashStreamCodes(s)
+        >>> hc2 is h.hashStreamCodes(s)
+        False
+        >>> hc2.codes.tolist()
+        [[1, 0, 0], [2, 0, 1], [3, 0, 2], [1, 0, 3], [0, 0, 4]]
+        >>> [tuple(nh) for nh in hc2.noteHashes()] == [tuple(nh) for nh in h.hashStream(s)]
+        True
+        '''
+        if 'numpy' in base._missingImport:
+            raise HasherException('Cannot hash to codes without numpy.')
+        import numpy as np
+
+        self.setupTupleList()
+        settingsKey = self._settingsKey()
+        self.codeTables = self._codeTablesBySettings.setdefault(settingsKey, {})
+        cacheKey = ('hasherCodes', settingsKey)
+        if useCache and cacheKey in s._cache:
+            cached = s._cache[cacheKey]
+            if cached.codeTables is self.codeTables:
+                return cached
+            return self._translateCodes(cached)
+
+        toHash = self._elementsToHash(s)
+        keys = tuple(self.tupleList)
+        columns = [self._encodeColumn(hashProperty, self._hashColumn(hashProperty, toHash))
+                   for hashProperty in keys]
+        if columns:
+            codes = np.stack(columns, axis=1)
+        else:
+            codes = np.zeros((len(toHash), 0), dtype=np.int64)
+        references = [ref for unused_e, unused_chord, ref in toHash]
+        hashCodes = HashCodes(self, keys, codes, references, self.codeTables)
+        if useCache:
+            s._cache[cacheKey] = hashCodes
+        return hashCodes
+
+    def _translateCodes(self, hashCodes):
+        '''
+        Returns a new HashCodes with the same values as `hashCodes`, which was
+        made by another Hasher with the same settings, but with this Hasher's codes.
+        '''
+        import numpy as np
+
+        codes = np.empty_like(hashCodes.codes)
+        for j, hashProperty in enumerate(hashCodes.keys):
+            table = self.codeTables.setdefault(hashProperty, {})
+            otherTable = hashCodes.codeTables[hashProperty]
+            translation = np.empty(len(otherTable), dtype=np.int64)
+            for value, code in otherTable.items():
+                translation[code] = table.setdefault(value, len(table))
+            codes[:, j] = translation[hashCodes.codes[:, j]]
+        return HashCodes(self, hashCodes.keys, codes, hashCodes.references, self.codeTables)
+
+    def _settingsKey(self):
+        return (tuple(self.tupleList), self.includeReference, tuple(self.validTypes),
+                self.hashMIDI, self.hashNoteNameOctave, self.roundDurationAndOffset,
+                self.granularity, self.hashChordsAsNotes, self.hashChordsAsChords,
+                self.hashNormalOrderString, self.hashPrimeFormString)
+
     def addHashToFinalHash(self, singleNoteHash, finalHash, reference):
         tupleHash = (self.tupleClass._make(singleNoteHash))
         if self.includeReference:
@@ -579,6 +767,73 @@ class NoteHash(tuple):
         return super(NoteHash, cls).__new__(cls, tuple(tupEls))
 
 
+class HashCodes:
+    '''
+    The hashes of a stream as integer codes, made by :meth:`Hasher.hashStreamCodes`.
+
+    `keys` are the names of the hashed properties, `codes` is a numpy array
+    with one row for each hashed item and one column for each key, `references`
+    is the note, chord, or rest that each row was made from, and `codeTables`
+    gives the code of each value of each property.
+    '''
+    def __init__(self, hasher, keys, codes, references, codeTables):
+        self.hasher = hasher
+        self.keys = keys
+        self.codes = codes
+        self.references = references
+        self.codeTables = codeTables
+        self._noteHashes = None
+
+    def __len__(self):
+        return len(self.references)
+
+    def values(self, index):
+        '''
+        Returns the hashed values of the item in row `index`.
+        '''
+        decoded = []
+        for hashProperty, code in zip(self.keys, self.codes[index].tolist()):
+            decoded.append(self._decodeTable(hashProperty)[code])
+        return tuple(decoded)
+
+    def _decodeTable(self, hashProperty):
+        '''
+        Returns a list of the value for each code of `hashProperty`.
+        Kept on the Hasher until the code table grows.
+        '''
+        table = self.codeTables[hashProperty]
+        cache = self.hasher._decodeTables
+        cacheKey = (id(self.codeTables), hashProperty)
+        decoded = cache.get(cacheKey)
+        if decoded is None or len(decoded) != len(table):
+            decoded = [None] * len(table)
+            for value, code in table.items():
+                decoded[code] = value
+            cache[cacheKey] = decoded
+        return decoded
+
+    def noteHashes(self):
+        '''
+        Returns the same list of NoteHash or NoteHashWithReference objects as
+        Hasher.hashStream, made from the codes.
+        '''
+        if self._noteHashes is not None:
+            return self._noteHashes
+        tupleClass = collections.namedtuple('NoteHash', self.keys)
+        decodeTables = [self._decodeTable(k) for k in self.keys]
+        finalHash = []
+        for row, reference in zip(self.codes.tolist(), self.references):
+            tupleHash = tupleClass._make(table[code] for table, code in zip(decodeTables, row))
+            if self.hasher.includeReference:
+                nhwr = NoteHashWithReference(tupleHash)
+                nhwr.reference = reference
+                finalHash.append(nhwr)
+            else:
+                finalHash.append(NoteHash(tupleHash))
+        self._noteHashes = finalHash
+        return finalHash
+
+
 class Test(unittest.TestCase):
 
     def _approximatelyEqual(self, a, b, sig_fig=2):
@@ -753,6 +1008,39 @@ class Test(unittest.TestCase):
         h.hashIntervalFromLastNote = True
         unused_hashes = h.hashStream(s)
 
+    def testCodesMatchHashStream(self):
+        from music21 import converter
+
+        def settings(h):
+            h.hashChordsAsNotes = False
+            h.hashChordsAsChords = True
+            h.hashPrimeFormString = True
+
+        def noRounding(h):
+            h.roundDurationAndOffset = False
+            h.hashMIDI = False
+
+        for changeSettings in (None, settings, noRounding):
+            h1 = Hasher()
+            h2 = Hasher()
+            for h in (h1, h2):
+                h.includeReference = True
+                if changeSettings:
+                    changeSettings(h)
+            s = converter.parse('tinyNotation: 3/4 c4 d8 r8 e8.. f32 B2 c#4')
+            s.measure(2).insert(2.0, chord.Chord('G4 B4 D5'))
+            codes = h2.hashStreamCodes(s)
+            hashes = h1.hashStream(s)
+            self.assertEqual([tuple(nh) for nh in codes.noteHashes()],
+                             [tuple(nh) for nh in hashes])
+            self.assertEqual([id(nh.reference) for nh in codes.noteHashes()],
+                             [id(nh.reference) for nh in hashes])
+            # equal values, equal codes
+            for i in range(len(hashes)):
+                for j in range(len(hashes)):
+                    self.assertEqual((codes.codes[i] == codes.codes[j]).tolist(),
+                                     [a == b for a, b in zip(hashes[i], hashes[j])])
+
 
 class TestExternal(unittest.TestCase):
 
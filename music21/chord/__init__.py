@@ -3940,10 +3940,28 @@ class Chord(note.NotRest):
         >>> chord.Chord().chordTablesAddress
         ChordTableAddress(cardinality=0, forteClass=0, inversion=0, pcOriginal=0)
         '''
-        try:
-            return chordTables.seekChordTablesAddress(self)
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return chordTables.ChordTableAddress(0, 0, 0, 0)
+        return entry.address
+
+    @property
+    @cacheMethod
+    def _setClassEntry(self):
+        '''
+        The :class:`~music21.chord.tables.SetClassEntry` for the pitch classes of this
+        Chord, or None if it has no pitches.  Entries are shared by all Chords
+        with the same pitch classes, so the tables are searched only once per set.
+
+        >>> chord.Chord('E4 G4 C5')._setClassEntry.forteName
+        '3-11B'
+        >>> chord.Chord()._setClassEntry is None
+        True
+        '''
+        bitmask = chordTables.pitchClassesToBitmask(self.orderedPitchClasses)
+        if bitmask == 0:
+            return None
+        return chordTables.setClassEntry(bitmask)
 
 
     @property
@@ -4240,10 +4258,10 @@ class Chord(note.NotRest):
         >>> chord.Chord('c~4 d`4').forteClass
         '2-2'
         '''
-        try:
-            return chordTables.addressToForteName(self.chordTablesAddress, 'tn')
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return 'N/A'
+        return entry.forteName
 
     @property
     def forteClassNumber(self):
@@ -4304,10 +4322,10 @@ class Chord(note.NotRest):
         >>> chord.Chord('c~4 d`4').forteClassTnI
         '2-2'
         '''
-        try:
-            return chordTables.addressToForteName(self.chordTablesAddress, 'tni')
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return 'N/A'
+        return entry.forteNameTnI
 
     @property
     def fullName(self):
@@ -4350,15 +4368,10 @@ class Chord(note.NotRest):
         >>> chord.Chord().hasZRelation
         False
         '''
-        try:
-            post = chordTables.addressToZAddress(self.chordTablesAddress)
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return False  # empty chords have no z-relations
-
-        # environLocal.printDebug(['got post', post])
-        if post is not None:
-            return True
-        return False
+        return entry.zAddress is not None
 
     @property
     def intervalVector(self):
@@ -4382,10 +4395,10 @@ class Chord(note.NotRest):
         >>> chord.Chord().intervalVector
         [0, 0, 0, 0, 0, 0]
         '''
-        try:
-            return list(chordTables.addressToIntervalVector(self.chordTablesAddress))
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return [0, 0, 0, 0, 0, 0]
+        return list(entry.intervalVector)
 
     @property
     def intervalVectorString(self):
@@ -4561,20 +4574,13 @@ class Chord(note.NotRest):
         >>> chord.Chord().normalOrder
         []
         '''
-        cta = self.chordTablesAddress
-        try:
-            transposedNormalForm = chordTables.addressToTransposedNormalForm(cta)
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return []
-
-        orderedPCs = self.orderedPitchClasses
-        mustBePresentPCs = set(orderedPCs)
-        for transposeAmount in orderedPCs:
-            possibleNormalOrder = [(pc + transposeAmount) % 12 for pc in transposedNormalForm]
-            if set(possibleNormalOrder) == mustBePresentPCs:
-                return possibleNormalOrder
-        raise ChordException('Could not find a normalOrder for chord: '
-                             + str(self.orderedPitchClassesString))
+        if entry.normalOrder is None:  # pragma: no cover
+            raise ChordException('Could not find a normalOrder for chord: '
+                                 + str(self.orderedPitchClassesString))
+        return list(entry.normalOrder)
 
     @property
     def normalOrderString(self):
@@ -4875,10 +4881,10 @@ class Chord(note.NotRest):
         >>> chord.Chord().primeForm
         []
         '''
-        try:
-            return list(chordTables.addressToPrimeForm(self.chordTablesAddress))
-        except chordTables.ChordTablesException:
+        entry = self._setClassEntry
+        if entry is None:
             return []
+        return list(entry.primeForm)
 
     @property
     def primeFormString(self) -> str:
@@ -2851,11 +2851,22 @@ def seekChordTablesAddress(c):
         for Chord with 0 pitches
     '''
     pcSet = c.orderedPitchClasses
-    index = 0
-    inversion = 0
     if not pcSet:
         raise ChordTablesException(
             f'cannot access chord tables address for Chord with {len(pcSet)} pitches')
+    return setClassEntry(pitchClassesToBitmask(pcSet)).address
+
+
+def _seekAddressForPitchClasses(pcSet):
+    '''
+    Search the Forte tables for the address of `pcSet`, a non-empty, sorted
+    list of unique pitch classes.  Called once per set by :func:`setClassEntry`.
+
+    >>> chord.tables._seekAddressForPitchClasses([2, 7, 11])
+    ChordTableAddress(cardinality=3, forteClass=11, inversion=-1, pcOriginal=7)
+    '''
+    index = 0
+    inversion = 0
 
     # environLocal.printDebug(['calling seekChordTablesAddress:', pcSet])
 
@@ -2917,6 +2928,131 @@ def seekChordTablesAddress(c):
     return ChordTableAddress(card, index, inversion, matchedPCOriginal)
 
 
+# ------------------------------------------------------------------------------
+# Everything about every one of the 4096 sets of pitch classes, indexed by bitmask
+# (bit n is set if pitch class n is present), filled in as each set is first seen.
+
+SetClassEntry = namedtuple('SetClassEntry',
+                           'address primeForm normalOrder intervalVector '
+                           + 'forteName forteNameTnI zAddress commonNames')
+
+_SET_CLASS_INDEX = [None] * 4096
+
+
+def pitchClassesToBitmask(pitchClasses):
+    '''
+    Return an int from 0 to 4095 where bit n is set if pitch class n
+    is among `pitchClasses`.  Repeated pitch classes are ignored.
+
+    >>> chord.tables.pitchClassesToBitmask([0, 4, 7])
+    145
+    >>> chord.tables.pitchClassesToBitmask([7, 4, 0, 12])
+    145
+    >>> chord.tables.pitchClassesToBitmask([])
+    0
+    '''
+    bitmask = 0
+    for pc in pitchClasses:
+        bitmask |= 1 << (pc % 12)
+    return bitmask
+
+
+def bitmaskToPitchClasses(bitmask):
+    '''
+    Return the sorted list of pitch classes in a bitmask.
+
+    >>> chord.tables.bitmaskToPitchClasses(145)
+    [0, 4, 7]
+    '''
+    return [pc for pc in range(12) if bitmask & (1 << pc)]
+
+
+def setClassEntry(bitmask):
+    '''
+    Return a SetClassEntry for the set of pitch classes represented by `bitmask`
+    (see :func:`pitchClassesToBitmask`), with its chord table address,
+    prime form, normal order, interval vector, Forte names (Tn and TnI),
+    Z-related address (or None) and common names (or None).
+
+    The search through the tables is done only the first time a set is seen;
+    after that the same SetClassEntry is returned immediately.
+
+    >>> entry = chord.tables.setClassEntry(chord.tables.pitchClassesToBitmask([2, 7, 11]))
+    >>> entry.address
+    ChordTableAddress(cardinality=3, forteClass=11, inversion=-1, pcOriginal=7)
+    >>> entry.primeForm
+    (0, 3, 7)
+    >>> entry.normalOrder
+    (7, 11, 2)
+    >>> entry.intervalVector
+    (0, 0, 1, 1, 1, 0)
+    >>> entry.forteName, entry.forteNameTnI
+    ('3-11B', '3-11')
+    >>> entry.zAddress is None
+    True
+    >>> entry.commonNames
+    ('major triad',)
+
+    >>> chord.tables.setClassEntry(145) is chord.tables.setClassEntry(145)
+    True
+
+    >>> chord.tables.setClassEntry(0)
+    Traceback (most recent call last):
+    music21.chord.tables.ChordTablesException: cannot access chord tables address
+        for Chord with 0 pitches
+    '''
+    entry = _SET_CLASS_INDEX[bitmask]
+    if entry is not None:
+        return entry
+    if bitmask == 0:
+        raise ChordTablesException(
+            'cannot access chord tables address for Chord with 0 pitches')
+
+    pcSet = bitmaskToPitchClasses(bitmask)
+    address = _seekAddressForPitchClasses(pcSet)
+    transposedNormalForm = addressToTransposedNormalForm(address)
+    normalOrder = None
+    for transposeAmount in pcSet:
+        possibleNormalOrder = tuple((pc + transposeAmount) % 12 for pc in transposedNormalForm)
+        if pitchClassesToBitmask(possibleNormalOrder) == bitmask:
+            normalOrder = possibleNormalOrder
+            break
+    commonNames = addressToCommonNames(address)
+    if commonNames is not None:
+        commonNames = tuple(commonNames)
+
+    entry = SetClassEntry(
+        address=address,
+        primeForm=addressToPrimeForm(address),
+        normalOrder=normalOrder,
+        intervalVector=addressToIntervalVector(address),
+        forteName=addressToForteName(address, 'tn'),
+        forteNameTnI=addressToForteName(address, 'tni'),
+        zAddress=addressToZAddress(address),
+        commonNames=commonNames,
+    )
+    _SET_CLASS_INDEX[bitmask] = entry
+    return entry
+
+
+def setClassIndex():
+    '''
+    Return a tuple of 4096 SetClassEntry objects, one for each bitmask, computing
+    any that have not been seen yet.  Position 0 (the empty set) is None.
+
+    >>> index = chord.tables.setClassIndex()
+    >>> len(index)
+    4096
+    >>> index[0] is None
+    True
+    >>> index[4095].forteName
+    '12-1'
+    >>> len({entry.forteNameTnI for entry in index[1:]})
+    223
+    '''
+    return (None,) + tuple(setClassEntry(bitmask) for bitmask in range(1, 4096))
+
+
 # ------------------------------------------------------------------------------
 class Test(unittest.TestCase):
 
@@ -2962,6 +3098,16 @@ class Test(unittest.TestCase):
             # index values
             self.assertEqual(len(FORTE[setSize]) - 1, setCount)
 
+    def testSetClassIndex(self):
+        index = setClassIndex()
+        for bitmask in range(1, 4096):
+            entry = index[bitmask]
+            pcSet = bitmaskToPitchClasses(bitmask)
+            self.assertEqual(entry.address, _seekAddressForPitchClasses(pcSet))
+            self.assertEqual(sorted(entry.normalOrder), pcSet)
+            self.assertEqual(entry.primeForm, addressToPrimeForm(entry.address))
+            self.assertEqual(entry.address.cardinality, len(pcSet))
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
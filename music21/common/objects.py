@@ -17,6 +17,7 @@ __all__ = [
     'EqualSlottedObjectMixin',
     'Iterator',
     'Timer',
+    'LRUCache',
 ]
 
 import collections
@@ -364,6 +365,106 @@ class Timer:
         return str(round(t, 3))
 
 
+class LRUCache:
+    '''
+    A dictionary-like cache which holds at most `maxSize` entries, discarding
+    the least recently used entry when it is full, and which keeps count of
+    how often a lookup found what it was looking for.
+
+    >>> cache = common.LRUCache(maxSize=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+
+    'b' was used least recently, so it is gone:
+
+    >>> cache.get('b') is None
+    True
+    >>> 'a' in cache
+    True
+    >>> len(cache)
+    2
+    >>> cache.hits, cache.misses
+    (1, 1)
+    >>> cache.hitRate
+    0.5
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'hitRate': 0.5, 'size': 2, 'maxSize': 2}
+
+    Looking up with `in` does not count as a hit or a miss.
+    A `maxSize` of None makes the cache unbounded.
+
+    `clear` empties the cache and resets the counts:
+
+    >>> cache.clear()
+    >>> len(cache), cache.hits, cache.misses
+    (0, 0, 0)
+    >>> cache.hitRate
+    0.0
+    '''
+    def __init__(self, maxSize=1024):
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __setitem__(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if self.maxSize is not None and len(data) > self.maxSize:
+            data.popitem(last=False)
+
+    def get(self, key, default=None):
+        '''
+        Return the value for `key` (marking it as recently used) or `default`
+        if it is not in the cache.
+        '''
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hitRate(self):
+        '''
+        The fraction of lookups with `get` which were found in the cache.
+        '''
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return self.hits / lookups
+
+    def stats(self):
+        '''
+        Return a dictionary of the hits, misses, hitRate, size, and maxSize of the cache.
+        '''
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hitRate': self.hitRate,
+                'size': len(self._data),
+                'maxSize': self.maxSize,
+                }
+
+
 if __name__ == '__main__':
     import music21
     music21.mainTest()
@@ -975,6 +975,32 @@ class ConverterMusicXML(SubConverter):
             defaults.author = ''
 
         generalExporter = m21ToXml.GeneralObjectExporter(obj)
+
+        if not subformats:
+            # no other program needs the file: write (and compress) a measure at a time.
+            if fp is None:
+                fp = self.getTemporaryFile()
+                if compress:
+                    fp.unlink()  # only the .mxl file is written
+            else:
+                if subformats is not None:
+                    fp = os.path.splitext(str(fp))[0] + '.xml'
+                fp = common.cleanpath(fp)
+            if not compress:
+                with open(fp, 'wb') as f:
+                    generalExporter.write(f)
+                return fp
+
+            fp = pathlib.Path(fp)
+            if fp.suffix in ('.xml', '.musicxml'):
+                xmlName = fp.name
+            else:
+                xmlName = fp.with_suffix('.xml').name
+            outFp = fp.with_suffix('.mxl')
+            with open(outFp, 'wb') as f:
+                generalExporter.write(f, compress=True, xmlName=xmlName)
+            return outFp
+
         dataBytes: bytes = generalExporter.parse()
 
         writeDataStreamFp = fp
@@ -69,6 +69,7 @@ from music21.corpus import virtual
 from music21.corpus import work
 
 from music21.corpus.manager import search
+from music21.corpus.manager import melodicSearch
 from music21.exceptions21 import CorpusException
 
 from music21 import environment
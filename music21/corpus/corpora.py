@@ -225,6 +225,35 @@ class Corpus(prebase.ProtoM21Object):
         del metadataBundle
         return failingFilePaths
 
+    def cacheMelodicIndex(self, useMultiprocessing=True, verbose=True):
+        '''
+        Build or update the :class:`~music21.search.melodicIndex.MelodicIndex`
+        for this corpus, updating the metadata cache at the same time so that
+        each file is only parsed once.
+
+        Only files that are new or have changed since they were last indexed
+        are parsed.  Returns a list of the paths of files that could not be parsed.
+        '''
+        if verbose is True:
+            environLocal.warn(f'{self.name} melodic index: {self.melodicIndex.filePath}')
+        return self.metadataBundle.addFromPaths(
+            self.getPaths(),
+            parseUsingCorpus=self.parseUsingCorpus,
+            useMultiprocessing=useMultiprocessing,
+            verbose=verbose,
+            melodicIndex=self.melodicIndex,
+        )
+
+    def melodicSearch(self, query, matchRhythm=False):
+        '''
+        Find a melody anywhere in this corpus without parsing any scores, using the
+        index built by :meth:`cacheMelodicIndex`.  Returns a list of
+        :class:`~music21.search.melodicIndex.MelodicIndexMatch` objects.
+
+        See :meth:`music21.search.melodicIndex.MelodicIndex.search` for the arguments.
+        '''
+        return self.melodicIndex.search(query, matchRhythm=matchRhythm)
+
     @abc.abstractmethod
     def getPaths(self, fileExtensions=None, expandExtensions=True):
         r'''
@@ -424,6 +453,29 @@ class Corpus(prebase.ProtoM21Object):
         mdb.corpus = self
         return mdb
 
+    @property
+    def melodicIndexFilePath(self):
+        '''
+        The path to the SQLite file for the melodic index of this corpus,
+        in the music21 scratch directory.
+
+        >>> corpus.corpora.CoreCorpus().melodicIndexFilePath.name
+        'm21MelodicIndex-core.sqlite'
+        '''
+        return environLocal.getRootTempDir() / f'm21MelodicIndex-{self.name}.sqlite'
+
+    @property
+    def melodicIndex(self):
+        '''
+        The :class:`~music21.search.melodicIndex.MelodicIndex` for this corpus,
+        which is empty until :meth:`cacheMelodicIndex` has been run.
+
+        Like the metadata bundle, it is stored in corpus.manager, so that it
+        is opened only once.
+        '''
+        from music21.corpus import manager
+        return manager.getMelodicIndexByCorpus(self)
+
     def all(self):
         '''
         This is a synonym for the metadataBundle property, but easier to understand
@@ -34,6 +34,8 @@ _metadataBundles = {
     # 'virtual': None,
 }
 
+_melodicIndices = {}
+
 # -----------------------------------------------------------------------------
 
 
@@ -313,6 +315,53 @@ def getMetadataBundleByCorpus(corpusObject):
             corpusObject, corpusName))
 
 
+def melodicSearch(query, corpusNames=None, matchRhythm=False):
+    '''
+    Search the melodic indices of the corpora for a melody (in any transposition),
+    returning a list of
+    :class:`~music21.search.melodicIndex.MelodicIndexMatch` objects.
+    No scores are parsed.
+
+    `query` can be a Stream, a list of notes and rests, or anything that
+    `converter.parse` accepts (such as a tinyNotation string).
+
+    A corpus can only be searched after its index has been built with
+    :meth:`~music21.corpus.corpora.Corpus.cacheMelodicIndex`; corpora without
+    an index give no results.
+
+    >>> #_DOCS_SHOW corpus.corpora.CoreCorpus().cacheMelodicIndex()  # once; slow
+    >>> #_DOCS_SHOW corpus.melodicSearch("tinyNotation: 3/4 d'4 c'8 b a g", matchRhythm=True)
+    [<MelodicIndexMatch bach/bwv169.7.mxl part 0, m. 4>, ...]
+
+    If ``corpusNames`` is None, all corpora known to music21 will be searched.
+    '''
+    if corpusNames is None:
+        corpusNames = list(iterateCorpora(returnObjects=False))
+
+    matches = []
+    for corpusName in corpusNames:
+        c = fromName(corpusName)
+        matches.extend(c.melodicSearch(query, matchRhythm=matchRhythm))
+    return matches
+
+
+def getMelodicIndexByCorpus(corpusObject):
+    '''
+    Return the melodic index for a single Corpus object, opening it the
+    first time it is needed.
+
+    >>> cc = corpus.corpora.CoreCorpus()
+    >>> corpus.manager.getMelodicIndexByCorpus(cc) is cc.melodicIndex
+    True
+    '''
+    from music21.search import melodicIndex
+    corpusName = corpusObject.name
+    if corpusName not in _melodicIndices:
+        _melodicIndices[corpusName] = melodicIndex.MelodicIndex(
+            corpusObject.melodicIndexFilePath)
+    return _melodicIndices[corpusName]
+
+
 def cacheMetadataBundleFromDisk(corpusObject):
     r'''
     Update a corpus' metadata bundle from its stored JSON file on disk.
@@ -8,12 +8,13 @@
 # Copyright:    Copyright © 2011 Michael Scott Cuthbert and the music21 Project
 # License:      BSD, see license.txt
 # ------------------------------------------------------------------------------
-__all__ = ['base', 'outputFormats', 'jSymbolic', 'native']
+__all__ = ['base', 'cache', 'outputFormats', 'jSymbolic', 'native']
 
 # __init__ can wildcard import base; it's how it is designed.
 from music21.features.base import *  # pylint: disable=wildcard-import
 
 from music21.features import base
+from music21.features import cache
 from music21.features import outputFormats
 
 from music21.features import jSymbolic
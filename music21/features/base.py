@@ -23,6 +23,7 @@ from music21 import exceptions21
 from music21 import stream
 from music21 import text
 
+from music21.base import _missingImport
 from music21.metadata.bundles import MetadataEntry
 
 from music21 import environment
@@ -136,7 +137,15 @@ class FeatureExtractor:
     All Streams are internally converted to a DataInstance if necessary.
     Usage of a DataInstance offers significant performance advantages, as common forms of
     the Stream are cached for easy processing.
+
+    Subclasses whose feature depends only on the pitch histograms of a score
+    may also define a staticmethod `processBatch` that takes a
+    :class:`~music21.features.base.FeatureBatch` and returns a NumPy array with one
+    row (of length `dimensions`) per DataInstance, already normalized if
+    `normalize` is True.  The :class:`~music21.features.base.FeatureEngine` uses it
+    in place of calling `extract()` once per score.
     '''
+    processBatch = None
 
     def __init__(self, dataOrStream=None, *arguments, **keywords):
         self.stream = None  # the original Stream, or None
@@ -484,6 +493,18 @@ class StreamForms:
         # environLocal.printDebug(['contourList', cList])
         return cList
 
+    def formNoteTable(self, pitches):
+        '''
+        A columnar form of a list of pitches: a dictionary of equal-length
+        NumPy arrays keyed by 'midi', 'ps', and 'pitchClass'.
+        '''
+        import numpy as np
+        return {
+            'midi': np.array([p.midi for p in pitches], dtype=np.int64),
+            'ps': np.array([p.ps for p in pitches], dtype=np.float64),
+            'pitchClass': np.array([p.pitchClass for p in pitches], dtype=np.int64),
+        }
+
     def formSecondsMap(self, prepared):
         post = []
         secondsMap = prepared.secondsMap
@@ -519,6 +540,7 @@ class StreamForms:
         'pitchClassSetHistogram': formPitchClassSetHistogram,
         'midiPitchHistogram': formMidiPitchHistogram,
         'midiIntervalHistogram': formMidiIntervalHistogram,
+        'noteTable': formNoteTable,
         'contourList': formContourList,
         'analyzedKey': lambda unused, f: f.analyze(method='key'),
         'tonalCertainty': lambda unused, foundKey: foundKey.tonalCertainty(),
@@ -739,6 +761,10 @@ class DataSet:
     Set ds.failFast = True to not catch them.
 
     Set ds.quiet = False to print them regardless of debug mode.
+
+    Set ds.featureCache to a :class:`~music21.features.cache.FeatureCache`
+    (or call `.useFeatureCache()`) to store features on disk and compute
+    only those not already stored.
     '''
 
     def __init__(self, classLabel=None, featureExtractors=()):
@@ -757,6 +783,8 @@ class DataSet:
         self.quiet = True
 
         self.runParallel = True
+        # a features.cache.FeatureCache or None
+        self.featureCache = None
         # set extractors
         self.addFeatureExtractors(featureExtractors)
 
@@ -924,11 +952,25 @@ class DataSet:
         di.setClassLabel(self._classLabel, classValue)
         self.dataInstances.append(di)
 
+    def useFeatureCache(self, fp=None):
+        '''
+        Store the features of all data added from a file or corpus path in a
+        :class:`~music21.features.cache.FeatureCache` at `fp` (by default in the
+        music21 scratch directory), so that later runs of `process()` only
+        compute features not already stored, and do not parse scores whose features
+        are all stored.
+        '''
+        from music21.features import cache
+        self.featureCache = cache.FeatureCache(fp)
+        return self.featureCache
+
     def process(self):
         '''
         Process all Data with all FeatureExtractors.
         Processed data is stored internally as numerous Feature objects.
         '''
+        if self.featureCache is not None:
+            return self._processCached()
         if self.runParallel:
             return self._processParallel()
         else:
@@ -950,7 +992,7 @@ class DataSet:
                                            updateMultiply=1,
                                            unpackIterable=True
                                         )
-        featureData, errors, classValues, ids = zip(*outputData)
+        featureData, errors, classValues, ids, unusedFailed = zip(*outputData)
         errors = common.flattenList(errors)
         for e in errors:
             if self.quiet is True:
@@ -994,6 +1036,67 @@ class DataSet:
             # rows will align with data the order of DataInstances
             self.features.append(row)
 
+    def _processCached(self):
+        '''
+        Fill features from self.featureCache, then run only the missing
+        FeatureExtractors (in parallel if self.runParallel) and store their results.
+        '''
+        cache = self.featureCache
+        cachedVectors = []
+        toRun = []
+        for di in self.dataInstances:
+            vectors = cache.getVectors(di, self._featureExtractors)
+            cachedVectors.append(vectors)
+            di.featureExtractorClassesForParallelRunning = [
+                fe for fe, v in zip(self._featureExtractors, vectors) if v is None]
+            if di.featureExtractorClassesForParallelRunning:
+                toRun.append(di)
+
+        argList = [(di, self.failFast) for di in toRun]
+        if self.runParallel:
+            outputData = common.runParallel(argList,
+                                            _dataSetParallelSubprocess,
+                                            updateFunction=not self.quiet,
+                                            updateMultiply=1,
+                                            unpackIterable=True)
+        else:
+            outputData = [_dataSetParallelSubprocess(*args) for args in argList]
+        computedById = {id(di): output for di, output in zip(toRun, outputData)}
+
+        self.features = []
+        for di, vectors in zip(self.dataInstances, cachedVectors):
+            computed = []
+            if id(di) in computedById:
+                computed, errors, classValue, diId, failed = computedById[id(di)]
+                for e in errors:
+                    if self.quiet is True:
+                        environLocal.printDebug(e)
+                    else:
+                        environLocal.warn(e)
+                if callable(di._classValue):
+                    di._classValue = classValue
+                if callable(di._id):
+                    di._id = diId
+                # blank features from failed extractors are not stored
+                succeeded = [(feClass, f.vector) for feClass, f
+                             in zip(di.featureExtractorClassesForParallelRunning, computed)
+                             if feClass not in failed]
+                if succeeded:
+                    cache.setVectors(di,
+                                     [feClass for feClass, unused in succeeded],
+                                     [vector for unused, vector in succeeded])
+
+            computedIter = iter(computed)
+            row = []
+            for fe, v in zip(self._instantiatedFeatureExtractors, vectors):
+                if v is None:
+                    row.append(next(computedIter))
+                else:
+                    f = fe.getBlankFeature()
+                    f.vector = v
+                    row.append(f)
+            self.features.append(row)
+
     def getFeaturesAsList(self, includeClassLabel=True, includeId=True, concatenateLists=True):
         '''
         Get processed data as a list of lists, merging any sub-lists
@@ -1085,10 +1188,36 @@ class DataSet:
 
         outputFormat.write(fp=fp, includeClassLabel=includeClassLabel)
 
+    def getFeaturesAsArray(self):
+        '''
+        Process all Data with all FeatureExtractors using a
+        :class:`~music21.features.base.FeatureEngine` and return a two-dimensional
+        NumPy array with one row per DataInstance and one column per attribute
+        label (without the identifier or class label).
+
+        Requires numpy.
+
+        >>> f = [features.jSymbolic.PitchClassDistributionFeature,
+        ...      features.jSymbolic.ChangesOfMeterFeature]
+        >>> ds = features.DataSet(classLabel='Composer', featureExtractors=f)
+        >>> ds.addData('bwv66.6', classValue='Bach')
+        >>> ds.addData('bach/bwv324.xml', classValue='Bach')
+        >>> arr = ds.getFeaturesAsArray()
+        >>> arr.shape
+        (2, 13)
+        >>> [round(float(x), 3) for x in arr[0][:3]]
+        [0.196, 0.074, 0.006]
+        '''
+        engine = FeatureEngine(self._featureExtractors)
+        engine.failFast = self.failFast
+        engine.quiet = self.quiet
+        return engine.process(self.dataInstances)
+
 
 def _dataSetParallelSubprocess(dataInstance, failFast):
     row = []
     errors = []
+    failed = []  # FeatureExtractor classes that raised
     # howBigWeCopied = len(pickle.dumps(dataInstance))
     # print('Starting ', dataInstance, ' Size: ', howBigWeCopied)
     for feClass in dataInstance.featureExtractorClassesForParallelRunning:
@@ -1104,10 +1233,11 @@ def _dataSetParallelSubprocess(dataInstance, failFast):
                 raise e
             # provide a blank feature extractor
             fReturned = fe.getBlankFeature()
+            failed.append(feClass)
 
         row.append(fReturned)  # get feature and store
     # rows will align with data the order of DataInstances
-    return row, errors, dataInstance.getClassValue(), dataInstance.getId()
+    return row, errors, dataInstance.getClassValue(), dataInstance.getId(), failed
 
 
 def allFeaturesAsList(streamInput):
@@ -1137,6 +1267,124 @@ def allFeaturesAsList(streamInput):
     return allData
 
 
+# ------------------------------------------------------------------------------
+class FeatureBatch:
+    '''
+    The histograms of many DataInstances, stacked into NumPy matrices
+    so that a FeatureExtractor's `processBatch` can compute its feature
+    for all of them at once.
+
+    Built from the 'pitches.noteTable' form of each DataInstance, so each
+    score's pitches are read only once no matter how many features use them.
+
+    >>> di = features.DataInstance('bach/bwv66.6')
+    >>> batch = features.FeatureBatch([di])
+    >>> batch.midiPitchHistogram.shape
+    (1, 128)
+    >>> [int(x) for x in batch.pitchClassHistogram[0]]
+    [0, 32, 12, 1, 16, 6, 29, 0, 14, 22, 3, 28]
+    >>> [int(x) for x in batch.noteCounts]
+    [163]
+    '''
+
+    def __init__(self, dataInstances=()):
+        import numpy as np
+
+        self.dataInstances = list(dataInstances)
+        n = len(self.dataInstances)
+        self.noteTables = []
+        self.midiPitchHistogram = np.zeros((n, 128), dtype=np.int64)
+        self.pitchClassHistogram = np.zeros((n, 12), dtype=np.int64)
+        for i, di in enumerate(self.dataInstances):
+            table = di['pitches.noteTable']
+            self.noteTables.append(table)
+            midi = table['midi']
+            if midi.size:
+                self.midiPitchHistogram[i] = np.bincount(np.clip(midi, 0, 127),
+                                                         minlength=128)
+                self.pitchClassHistogram[i] = np.bincount(table['pitchClass'],
+                                                          minlength=12)
+        self.noteCounts = self.midiPitchHistogram.sum(axis=1)
+
+    def __len__(self):
+        return len(self.dataInstances)
+
+
+class FeatureEngine:
+    '''
+    Computes many FeatureExtractors over many DataInstances and returns the
+    result as one two-dimensional NumPy array, with one row per DataInstance and
+    the columns in the order of :meth:`~music21.features.base.DataSet.getAttributeLabels`.
+
+    FeatureExtractors that define `processBatch` are computed once for all the
+    DataInstances from a :class:`~music21.features.base.FeatureBatch`.  The others
+    are run through `extract()`, sharing the forms cached on each DataInstance.
+    Failed extractors give a row of zeros, as they do in a DataSet.
+
+    >>> f = [features.jSymbolic.PitchVarietyFeature,
+    ...      features.jSymbolic.InitialTimeSignatureFeature]
+    >>> engine = features.FeatureEngine(f)
+    >>> di1 = features.DataInstance('bach/bwv66.6')
+    >>> di2 = features.DataInstance(converter.parse('tinynotation: 3/4 c4 d e'))
+    >>> engine.process([di1, di2]).tolist()
+    [[24.0, 4.0, 4.0], [3.0, 3.0, 4.0]]
+    '''
+
+    def __init__(self, featureExtractors=()):
+        if not common.isIterable(featureExtractors):
+            featureExtractors = [featureExtractors]
+        self.featureExtractors = list(featureExtractors)
+        self.failFast = False
+        self.quiet = True
+        self.errors = []
+
+    def process(self, dataInstances):
+        '''
+        Parse (if necessary) each DataInstance (or Stream) in `dataInstances`
+        and return the matrix of all features.
+        '''
+        if 'numpy' in _missingImport:
+            raise FeatureException('Cannot run FeatureEngine without numpy.')
+        import numpy as np
+
+        dataInstances = [DataInstance(di) if isinstance(di, stream.Stream) else di
+                         for di in dataInstances]
+        for di in dataInstances:
+            di.parseStream()
+
+        self.errors = []
+        batch = FeatureBatch(dataInstances)
+        columns = []
+        for feClass in self.featureExtractors:
+            fe = feClass()
+            if fe.processBatch is not None:
+                block = np.asarray(fe.processBatch(batch), dtype=np.float64)
+            else:
+                block = np.zeros((len(dataInstances), fe.dimensions), dtype=np.float64)
+                for i, di in enumerate(dataInstances):
+                    block[i] = self._extractOne(fe, di)
+            columns.append(block.reshape(len(dataInstances), fe.dimensions))
+
+        if not columns:
+            return np.zeros((len(dataInstances), 0), dtype=np.float64)
+        return np.hstack(columns)
+
+    def _extractOne(self, fe, dataInstance):
+        fe.setData(dataInstance)
+        try:
+            return fe.extract().vector
+        except Exception as e:  # pylint: disable=broad-except
+            msg = 'failed feature extractor:' + str(fe) + ': ' + str(e)
+            self.errors.append(msg)
+            if self.quiet is True:
+                environLocal.printDebug(msg)
+            else:
+                environLocal.warn(msg)
+            if self.failFast:
+                raise e
+            return fe.getBlankFeature().vector
+
+
 # ------------------------------------------------------------------------------
 def extractorsById(idOrList, library=('jSymbolic', 'native')):
     '''
@@ -1482,6 +1730,32 @@ class Test(unittest.TestCase):
                         analysis.discrete.DiscreteAnalysisException):
                     pass
 
+    def testFeatureEngineMatchesExtract(self):
+        from music21.features import jSymbolic
+
+        batchable = [fe for fe in jSymbolic.featureExtractors
+                     if fe.processBatch is not None]
+        self.assertGreater(len(batchable), 10)
+
+        sources = [corpus.parse('bwv66.6'),
+                   corpus.parse('corelli/opus3no1/1grave'),
+                   converter.parse('tinynotation: 4/4 c4 c d e2'),
+                   stream.Stream()]
+        ds = DataSet(classLabel='')
+        ds.addFeatureExtractors(batchable)
+        for s in sources:
+            ds.addData(s)
+        ds.runParallel = False
+        ds.process()
+        # drop the identifier column
+        expected = [row[1:] for row in ds.getFeaturesAsList(includeClassLabel=False)]
+
+        arr = FeatureEngine(batchable).process(ds.dataInstances)
+        self.assertEqual(arr.shape, (len(sources), len(expected[0])))
+        for row, expectedRow in zip(arr.tolist(), expected):
+            for got, want in zip(row, expectedRow):
+                self.assertAlmostEqual(got, want)
+
     # --------------------------------------------------------------------------
     # silent tests
 
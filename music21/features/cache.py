@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         features/cache.py
+# Purpose:      Persistent on-disk storage of extracted features
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2021 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+A content-addressed store of feature vectors, kept in a local SQLite database,
+so that re-running a :class:`~music21.features.base.DataSet` only computes
+the features that have not been computed before.
+
+Vectors are keyed by the hash of the source file's contents (plus the opus number
+if any), the id of the FeatureExtractor, and the music21 version, so editing a
+file or upgrading music21 silently invalidates old entries.
+
+Only DataInstances created from a file path, corpus path, or MetadataEntry can be
+cached; in-memory Streams are always recomputed.
+'''
+import hashlib
+import json
+import numbers
+import os
+import pathlib
+import sqlite3
+import unittest
+
+from music21 import exceptions21
+from music21.base import VERSION_STR
+from music21.metadata.bundles import MetadataEntry
+
+from music21 import environment
+_MOD = 'features.cache'
+environLocal = environment.Environment(_MOD)
+
+
+class FeatureCacheException(exceptions21.Music21Exception):
+    pass
+
+
+def _jsonNumber(x):
+    '''
+    Convert a number in a feature vector, which may be a numpy scalar,
+    to a Python int or float that json can store.
+
+    >>> import numpy
+    >>> features.cache._jsonNumber(numpy.int64(3))
+    3
+    >>> features.cache._jsonNumber(numpy.float32(0.5))
+    0.5
+    >>> features.cache._jsonNumber(True)
+    True
+    '''
+    if isinstance(x, (bool, int, float)):
+        return x
+    if isinstance(x, numbers.Integral):
+        return int(x)
+    return float(x)
+
+
+def extractorId(feClass):
+    '''
+    Return the string used to identify a FeatureExtractor class in the cache:
+    its `id` if it has one, otherwise its module and class name.
+
+    >>> features.cache.extractorId(features.jSymbolic.PitchClassDistributionFeature)
+    'P20'
+    '''
+    feId = getattr(feClass, 'id', None)
+    if feId:
+        return feId
+    return feClass.__module__ + '.' + feClass.__name__
+
+
+class FeatureCache:
+    '''
+    An SQLite-backed store of feature vectors.
+
+    If `fp` is None, the store is kept in the music21 scratch directory.
+    Pass ':memory:' for a store that lasts only as long as this object.
+
+    >>> fc = features.cache.FeatureCache(':memory:')
+    >>> di = features.DataInstance('bach/bwv66.6')
+    >>> fe = features.jSymbolic.PitchVarietyFeature
+    >>> fc.getVectors(di, [fe])
+    [None]
+    >>> fc.setVectors(di, [fe], [[24]])
+    >>> fc.getVectors(di, [fe])
+    [[24]]
+    >>> len(fc)
+    1
+
+    In-memory streams have no hash and are never stored:
+
+    >>> fc.sourceHash(features.DataInstance(stream.Stream())) is None
+    True
+    '''
+    def __init__(self, fp=None):
+        if fp is None:
+            fp = environLocal.getRootTempDir() / 'm21FeatureCache.sqlite'
+        self.filePath = fp
+        self.version = VERSION_STR
+        self._hashesByPath = {}
+        self._connection = sqlite3.connect(str(fp))
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS features ('
+            'sourceHash TEXT NOT NULL, '
+            'extractorId TEXT NOT NULL, '
+            'version TEXT NOT NULL, '
+            'vector TEXT NOT NULL, '
+            'PRIMARY KEY (sourceHash, extractorId, version))'
+        )
+        self._connection.commit()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM features').fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def clear(self):
+        '''
+        Remove all stored vectors, for all versions of music21.
+        '''
+        self._connection.execute('DELETE FROM features')
+        self._connection.commit()
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _sourceFilePath(dataInstance):
+        '''
+        Return the pathlib.Path to the file that a DataInstance will be parsed from
+        and the opus number (or None) within it, or (None, None) if there is no file.
+        '''
+        from music21 import corpus
+
+        source = dataInstance.streamPath
+        number = None
+        if source is None:  # created from a Stream
+            return None, None
+        if isinstance(source, MetadataEntry):
+            number = source.number
+            source = source.sourcePath
+        if isinstance(source, str) and source.startswith('http'):
+            return None, None
+
+        fp = pathlib.Path(source)
+        if not fp.exists():
+            try:
+                fp = corpus.getWork(str(source))
+            except corpus.CorpusException:
+                return None, None
+            if isinstance(fp, list):
+                fp = fp[0]
+        return fp, number
+
+    def sourceHash(self, dataInstance):
+        '''
+        Return a hex digest of the contents of the source file of `dataInstance`
+        (plus its opus number), or None if it was not created from a file.
+
+        Digests are remembered for as long as the file's size and modification time
+        do not change.
+        '''
+        fp, number = self._sourceFilePath(dataInstance)
+        if fp is None:
+            return None
+        stat = os.stat(fp)
+        pathKey = (str(fp), stat.st_size, stat.st_mtime_ns)
+        if pathKey not in self._hashesByPath:
+            h = hashlib.sha256()
+            with open(fp, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 16), b''):
+                    h.update(block)
+            self._hashesByPath[pathKey] = h.hexdigest()
+        digest = self._hashesByPath[pathKey]
+        if number is not None:
+            digest += f':{number}'
+        return digest
+
+    def getVectors(self, dataInstance, featureExtractors):
+        '''
+        Return a list with the stored vector for each FeatureExtractor class
+        in `featureExtractors`, or None where nothing is stored.
+        '''
+        sourceHash = self.sourceHash(dataInstance)
+        if sourceHash is None:
+            return [None] * len(featureExtractors)
+
+        rows = self._connection.execute(
+            'SELECT extractorId, vector FROM features WHERE sourceHash = ? AND version = ?',
+            (sourceHash, self.version)
+        ).fetchall()
+        stored = {feId: json.loads(vector) for feId, vector in rows}
+        return [stored.get(extractorId(fe)) for fe in featureExtractors]
+
+    def setVectors(self, dataInstance, featureExtractors, vectors):
+        '''
+        Store one vector for each FeatureExtractor class in `featureExtractors`.
+        Does nothing if `dataInstance` was not created from a file.
+        '''
+        if len(featureExtractors) != len(vectors):
+            raise FeatureCacheException(
+                'featureExtractors and vectors must have the same length')
+        sourceHash = self.sourceHash(dataInstance)
+        if sourceHash is None:
+            return
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?)',
+            [(sourceHash, extractorId(fe), self.version,
+              json.dumps([_jsonNumber(x) for x in v]))
+             for fe, v in zip(featureExtractors, vectors)]
+        )
+        self._connection.commit()
+
+
+# ------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def testDataSetOnlyComputesMissing(self):
+        from music21 import features
+        from music21.features import jSymbolic
+
+        fc = FeatureCache(':memory:')
+        ds = features.DataSet(classLabel='Composer')
+        ds.runParallel = False
+        ds.featureCache = fc
+        ds.addFeatureExtractors([jSymbolic.PitchVarietyFeature])
+        ds.addData('bwv66.6', classValue='Bach')
+        ds.process()
+        self.assertEqual(ds.getFeaturesAsList()[0], ['bwv66.6', 24, 'Bach'])
+        self.assertEqual(len(fc), 1)
+
+        # a new DataSet with one more extractor never parses the score
+        # for the feature it already has
+        ds2 = features.DataSet(classLabel='Composer')
+        ds2.runParallel = False
+        ds2.featureCache = fc
+        ds2.addFeatureExtractors([jSymbolic.PitchVarietyFeature,
+                                  jSymbolic.PitchClassVarietyFeature])
+        ds2.addData('bwv66.6', classValue='Bach')
+        ds2.process()
+        self.assertEqual(ds2.getFeaturesAsList()[0], ['bwv66.6', 24, 10, 'Bach'])
+        self.assertEqual(len(fc), 2)
+
+        # everything is stored: nothing is parsed
+        ds3 = features.DataSet(classLabel='Composer')
+        ds3.runParallel = False
+        ds3.featureCache = fc
+        ds3.addFeatureExtractors([jSymbolic.PitchClassVarietyFeature])
+        ds3.addData('bwv66.6', classValue='Bach')
+        ds3.process()
+        self.assertIsNone(ds3.dataInstances[0].stream)
+        self.assertEqual(ds3.getFeaturesAsList()[0], ['bwv66.6', 10, 'Bach'])
+
+    def testVersionInvalidates(self):
+        from music21 import features
+        from music21.features import jSymbolic
+
+        fc = FeatureCache(':memory:')
+        di = features.DataInstance('bach/bwv66.6')
+        fc.setVectors(di, [jSymbolic.PitchVarietyFeature], [[24]])
+        fc.version = '0.0.1'
+        self.assertEqual(fc.getVectors(di, [jSymbolic.PitchVarietyFeature]), [None])
+
+    def testNumpyVectors(self):
+        import numpy as np
+        from music21 import features
+        from music21.features import jSymbolic
+
+        fc = FeatureCache(':memory:')
+        di = features.DataInstance('bach/bwv66.6')
+        fc.setVectors(di, [jSymbolic.PitchVarietyFeature], [np.array([24, 3])])
+        self.assertEqual(fc.getVectors(di, [jSymbolic.PitchVarietyFeature]), [[24, 3]])
+
+    def testFailedExtractorNotStored(self):
+        from music21 import features
+        from music21.features import jSymbolic
+
+        class FailingFeature(jSymbolic.PitchVarietyFeature):
+            id = 'failing'
+
+            def process(self):
+                raise ValueError('cannot extract')
+
+        fc = FeatureCache(':memory:')
+        ds = features.DataSet(classLabel='Composer')
+        ds.runParallel = False
+        ds.quiet = True
+        ds.failFast = False
+        ds.featureCache = fc
+        ds.addFeatureExtractors([jSymbolic.PitchVarietyFeature, FailingFeature])
+        ds.addData('bwv66.6', classValue='Bach')
+        ds.process()
+        di = ds.dataInstances[0]
+        self.assertEqual(fc.getVectors(di, [jSymbolic.PitchVarietyFeature, FailingFeature]),
+                         [[24], None])
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
@@ -804,6 +804,27 @@ class SizeOfMelodicArcsFeature(featuresModule.FeatureExtractor):
 # ------------------------------------------------------------------------------
 # pitch
 
+def _normalizeRows(histo):
+    '''
+    Vectorized equivalent of Feature.normalize() for each row of a
+    FeatureBatch histogram; rows summing to zero stay zero.
+    '''
+    import numpy as np
+    totals = histo.sum(axis=1)
+    scalars = np.divide(1.0, totals, out=np.zeros(len(totals)), where=totals > 0)
+    return histo * scalars[:, np.newaxis]
+
+
+def _registerFraction(batch, low, high):
+    '''
+    Fraction of the notes of each row of a FeatureBatch with MIDI
+    pitches from `low` to `high` inclusive.
+    '''
+    import numpy as np
+    histo = batch.midiPitchHistogram
+    return np.divide(histo[:, low:high + 1].sum(axis=1), histo.sum(axis=1),
+                     out=np.zeros(len(batch)), where=batch.noteCounts > 0)
+
 
 class MostCommonPitchPrevalenceFeature(featuresModule.FeatureExtractor):
     '''
@@ -825,6 +846,14 @@ class MostCommonPitchPrevalenceFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        histo = batch.midiPitchHistogram
+        totals = histo.sum(axis=1)
+        return np.divide(histo.max(axis=1), totals,
+                         out=np.zeros(len(batch)), where=totals > 0)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -859,6 +888,14 @@ class MostCommonPitchClassPrevalenceFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        histo = batch.pitchClassHistogram
+        totals = histo.sum(axis=1)
+        return np.divide(histo.max(axis=1), totals,
+                         out=np.zeros(len(batch)), where=totals > 0)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -894,6 +931,13 @@ class RelativeStrengthOfTopPitchesFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        top = -np.sort(-batch.midiPitchHistogram, axis=1)[:, :2]
+        return np.divide(top[:, 1], top[:, 0],
+                         out=np.zeros(len(batch)), where=top[:, 0] > 0)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -929,6 +973,13 @@ class RelativeStrengthOfTopPitchClassesFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        top = -np.sort(-batch.pitchClassHistogram, axis=1)[:, :2]
+        return np.divide(top[:, 1], top[:, 0],
+                         out=np.zeros(len(batch)), where=top[:, 0] > 0)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1037,6 +1088,13 @@ class NumberOfCommonPitchesFeature(featuresModule.FeatureExtractor):
         self.isSequential = True
         self.dimensions = 1
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        histo = batch.midiPitchHistogram
+        totals = np.maximum(histo.sum(axis=1), 1)[:, np.newaxis]
+        return ((histo > 0) & (histo / totals >= 0.09)).sum(axis=1)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1068,6 +1126,10 @@ class PitchVarietyFeature(featuresModule.FeatureExtractor):
         self.isSequential = True
         self.dimensions = 1
 
+    @staticmethod
+    def processBatch(batch):
+        return (batch.midiPitchHistogram > 0).sum(axis=1)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1098,6 +1160,10 @@ class PitchClassVarietyFeature(featuresModule.FeatureExtractor):
         self.isSequential = True
         self.dimensions = 1
 
+    @staticmethod
+    def processBatch(batch):
+        return (batch.pitchClassHistogram > 0).sum(axis=1)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1128,6 +1194,14 @@ class RangeFeature(featuresModule.FeatureExtractor):
         self.isSequential = True
         self.dimensions = 1
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        used = batch.midiPitchHistogram > 0
+        lowest = used.argmax(axis=1)
+        highest = 127 - used[:, ::-1].argmax(axis=1)
+        return np.where(used.any(axis=1), highest - lowest, 0)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1221,6 +1295,10 @@ class ImportanceOfBassRegisterFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        return _registerFraction(batch, 0, 54)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1257,6 +1335,10 @@ class ImportanceOfMiddleRegisterFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        return _registerFraction(batch, 55, 72)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1293,6 +1375,10 @@ class ImportanceOfHighRegisterFeature(featuresModule.FeatureExtractor):
         self.dimensions = 1
         self.discrete = False
 
+    @staticmethod
+    def processBatch(batch):
+        return _registerFraction(batch, 73, 127)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1328,6 +1414,10 @@ class MostCommonPitchClassFeature(featuresModule.FeatureExtractor):
         self.isSequential = True
         self.dimensions = 1
 
+    @staticmethod
+    def processBatch(batch):
+        return batch.pitchClassHistogram.argmax(axis=1)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1416,6 +1506,10 @@ class BasicPitchHistogramFeature(featuresModule.FeatureExtractor):
         self.dimensions = 128
         self.normalize = True
 
+    @staticmethod
+    def processBatch(batch):
+        return _normalizeRows(batch.midiPitchHistogram)
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1452,6 +1546,14 @@ class PitchClassDistributionFeature(featuresModule.FeatureExtractor):
         self.discrete = False
         self.normalize = True
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        histo = batch.pitchClassHistogram
+        # rotate each row so that the most common pitch class is first
+        indices = (np.arange(12) + histo.argmax(axis=1)[:, np.newaxis]) % 12
+        return _normalizeRows(np.take_along_axis(histo, indices, axis=1))
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -1500,6 +1602,12 @@ class FifthsPitchHistogramFeature(featuresModule.FeatureExtractor):
         for i in range(12):
             self._mapping[i] = (7 * i) % 12
 
+    @staticmethod
+    def processBatch(batch):
+        import numpy as np
+        # bin i of the fifths histogram holds pitch class (7 * i) % 12
+        return _normalizeRows(batch.pitchClassHistogram[:, (7 * np.arange(12)) % 12])
+
     def process(self):
         '''Do processing necessary, storing result in feature.
         '''
@@ -5,6 +5,7 @@ __all__ = [
     'examples',
     'notation',
     'possibility',
+    'possibilityArrays',
     'realizer',
     'realizerScale',
     'resolution',
@@ -16,6 +17,7 @@ from music21.figuredBass import checker
 from music21.figuredBass import examples
 from music21.figuredBass import notation
 from music21.figuredBass import possibility
+from music21.figuredBass import possibilityArrays
 from music21.figuredBass import realizer
 from music21.figuredBass import realizerScale
 from music21.figuredBass import resolution
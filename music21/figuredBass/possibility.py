@@ -68,6 +68,7 @@ The application of these methods is controlled by corresponding instance variabl
 .. note:: The number of parts and maxPitch are universal for a
     :class:`~music21.figuredBass.realizer.FiguredBassLine`.
 '''
+import copy
 import unittest
 
 from music21 import chord
@@ -281,6 +282,80 @@ hiddenFifthsTable = {}
 hiddenOctavesTable = {}
 
 
+def quartetHasParallelFifth(pitchQuartet):
+    '''
+    Returns True if the pitchQuartet (lowerPitchA, lowerPitchB, higherPitchA, higherPitchB)
+    forms parallel fifths, using and updating parallelFifthsTable.
+
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, G3, A3 = [pitch.Pitch(p) for p in ('C3', 'D3', 'G3', 'A3')]
+    >>> possibility.quartetHasParallelFifth((C3, D3, G3, A3))
+    True
+    >>> possibility.quartetHasParallelFifth((C3, C3, G3, A3))
+    False
+    '''
+    try:
+        return parallelFifthsTable[pitchQuartet]
+    except KeyError:
+        hasParallelFifth = voiceLeading.VoiceLeadingQuartet(*pitchQuartet).parallelFifth()
+        parallelFifthsTable[pitchQuartet] = hasParallelFifth
+        return hasParallelFifth
+
+
+def quartetHasParallelOctave(pitchQuartet):
+    '''
+    Returns True if the pitchQuartet (lowerPitchA, lowerPitchB, higherPitchA, higherPitchB)
+    forms parallel octaves, using and updating parallelOctavesTable.
+
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, C4, D4 = [pitch.Pitch(p) for p in ('C3', 'D3', 'C4', 'D4')]
+    >>> possibility.quartetHasParallelOctave((C3, D3, C4, D4))
+    True
+    '''
+    try:
+        return parallelOctavesTable[pitchQuartet]
+    except KeyError:
+        hasParallelOctave = voiceLeading.VoiceLeadingQuartet(*pitchQuartet).parallelOctave()
+        parallelOctavesTable[pitchQuartet] = hasParallelOctave
+        return hasParallelOctave
+
+
+def quartetHasHiddenFifth(pitchQuartet):
+    '''
+    Returns True if the pitchQuartet (lowestPitchA, lowestPitchB, highestPitchA, highestPitchB)
+    forms a hidden fifth, using and updating hiddenFifthsTable.
+
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, E5, A5 = [pitch.Pitch(p) for p in ('C3', 'D3', 'E5', 'A5')]
+    >>> possibility.quartetHasHiddenFifth((C3, D3, E5, A5))
+    True
+    '''
+    try:
+        return hiddenFifthsTable[pitchQuartet]
+    except KeyError:
+        hasHiddenFifth = voiceLeading.VoiceLeadingQuartet(*pitchQuartet).hiddenFifth()
+        hiddenFifthsTable[pitchQuartet] = hasHiddenFifth
+        return hasHiddenFifth
+
+
+def quartetHasHiddenOctave(pitchQuartet):
+    '''
+    Returns True if the pitchQuartet (lowestPitchA, lowestPitchB, highestPitchA, highestPitchB)
+    forms a hidden octave, using and updating hiddenOctavesTable.
+
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, A5, D6 = [pitch.Pitch(p) for p in ('C3', 'D3', 'A5', 'D6')]
+    >>> possibility.quartetHasHiddenOctave((C3, D3, A5, D6))
+    True
+    '''
+    try:
+        return hiddenOctavesTable[pitchQuartet]
+    except KeyError:
+        hasHiddenOctave = voiceLeading.VoiceLeadingQuartet(*pitchQuartet).hiddenOctave()
+        hiddenOctavesTable[pitchQuartet] = hasHiddenOctave
+        return hasHiddenOctave
+
+
 def parallelFifths(possibA, possibB):
     '''
     Returns True if there are parallel fifths between any
@@ -975,6 +1050,96 @@ def partPairs(possibA, possibB):
     '''
     return list(zip(possibA, possibB))
 
+
+# Table of every pitch seen in a possibility, so that possibilities can be
+# encoded as rows of integers (see music21.figuredBass.possibilityArrays).
+# Pitches with the same nameWithOctave (and microtone) share an index.
+# Cleared by clearPitchIndices at the start of each realization.
+_pitchIndices = {}
+_indexedPitches = []
+_indexedPitchSpaces = []
+_indexedPitchNames = []
+
+
+def pitchIndex(p):
+    '''
+    Returns an integer which identifies the pitch p. Pitches which are equal
+    (same spelling, octave, and microtone) get the same index until
+    :func:`clearPitchIndices` is called.
+
+    >>> from music21.figuredBass import possibility
+    >>> i = possibility.pitchIndex(pitch.Pitch('C#4'))
+    >>> possibility.pitchIndex(pitch.Pitch('C#4')) == i
+    True
+    >>> possibility.pitchIndex(pitch.Pitch('D-4')) == i
+    False
+    >>> possibility.pitchFromIndex(i)
+    <music21.pitch.Pitch C#4>
+    >>> possibility.pitchSpaceValues()[i]
+    61.0
+    >>> possibility.pitchNames()[i]
+    'C#'
+
+    The table keeps a copy of the pitch, so changing it later does not matter:
+
+    >>> p = pitch.Pitch('B-2')
+    >>> j = possibility.pitchIndex(p)
+    >>> p.octave = 3
+    >>> possibility.pitchFromIndex(j)
+    <music21.pitch.Pitch B-2>
+    '''
+    pitchKey = p.nameWithOctave
+    if p.microtone.cents:
+        pitchKey = str(p)
+    try:
+        return _pitchIndices[pitchKey]
+    except KeyError:
+        newIndex = len(_indexedPitches)
+        _pitchIndices[pitchKey] = newIndex
+        _indexedPitches.append(copy.deepcopy(p))
+        _indexedPitchSpaces.append(p.ps)
+        _indexedPitchNames.append(p.name)
+        return newIndex
+
+
+def clearPitchIndices():
+    '''
+    Forget every pitch given to :func:`pitchIndex`.  Indices given out
+    before calling this no longer identify any pitch.
+
+    >>> from music21.figuredBass import possibility
+    >>> i = possibility.pitchIndex(pitch.Pitch('F#5'))
+    >>> possibility.clearPitchIndices()
+    >>> possibility.pitchSpaceValues()
+    []
+    '''
+    _pitchIndices.clear()
+    _indexedPitches.clear()
+    _indexedPitchSpaces.clear()
+    _indexedPitchNames.clear()
+
+
+def pitchFromIndex(pIndex):
+    '''
+    Returns a copy of the first pitch given to :func:`pitchIndex`
+    which received the index pIndex.
+    '''
+    return _indexedPitches[pIndex]
+
+
+def pitchSpaceValues():
+    '''
+    Returns a list of the pitch space (ps) values of each indexed pitch, in index order.
+    '''
+    return _indexedPitchSpaces
+
+
+def pitchNames():
+    '''
+    Returns a list of the names of each indexed pitch, in index order.
+    '''
+    return _indexedPitchNames
+
 # apply a function to one pitch of possibA at a time
 # apply a function to two pitches of possibA at a time
 # apply a function to one partPair of possibA, possibB at a time
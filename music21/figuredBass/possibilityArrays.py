@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         possibilityArrays.py
+# Purpose:      rule checking for many figured bass possibilities at once,
+#                with possibilities encoded as integer arrays
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2021 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Versions of the rule-checking methods in :mod:`~music21.figuredBass.possibility`
+that check a whole list of possibilities, or every (possibA, possibB) pair from two
+lists of possibilities, at once using numpy.
+
+Each possibility is encoded as a row of an integer array, with one column per part.
+Every entry is an index into a table of all the pitches seen so far (see
+:func:`~music21.figuredBass.possibility.pitchIndex`), from which the pitch-space
+(MIDI) number and the pitch name are looked up as arrays.  Rules that only compare
+pitch-space numbers (voice crossing, voice overlap, part movements, etc.) are then
+computed directly on the arrays.  Parallel and hidden fifths and octaves depend on the
+spelling of the intervals, so the arrays are only used to find the few pitch quartets
+that could form them; each distinct quartet is then checked once with
+:class:`~music21.voiceLeading.VoiceLeadingQuartet`, just as the methods in
+:mod:`~music21.figuredBass.possibility` do.
+
+Rules which have no array version here are checked one possibility at a time, but only
+on the possibilities that passed all the other rules.  So the results are always the
+same as checking each possibility in turn.
+
+These functions are used by :class:`~music21.figuredBass.segment.Segment` whenever
+numpy is installed.
+
+>>> from music21.figuredBass import possibilityArrays
+>>> from music21.figuredBass import possibility
+>>> C3, E3, G3, C4, E4, G4 = [pitch.Pitch(p) for p in ('C3', 'E3', 'G3', 'C4', 'E4', 'G4')]
+>>> possibs = [(C4, G3, E3, C3), (G4, E4, C4, C3), (E3, G3, C4, C3)]
+>>> rulesToCheck = [(possibility.voiceCrossing, False, [])]
+>>> possibilityArrays.correctSingleMask(possibs, rulesToCheck)
+array([ True,  True, False])
+'''
+import itertools
+import unittest
+
+from music21.figuredBass import possibility
+
+
+def encodePossibilities(possibilities):
+    '''
+    Returns a numpy integer array with one row per possibility in `possibilities`
+    and one column per part, holding the
+    :func:`~music21.figuredBass.possibility.pitchIndex` of each pitch.
+
+    >>> from music21.figuredBass import possibilityArrays
+    >>> from music21.figuredBass import possibility
+    >>> possibs = [(pitch.Pitch('G4'), pitch.Pitch('C3')),
+    ...            (pitch.Pitch('C4'), pitch.Pitch('C3'))]
+    >>> encoded = possibilityArrays.encodePossibilities(possibs)
+    >>> encoded.shape
+    (2, 2)
+    >>> possibility.pitchFromIndex(int(encoded[1, 0]))
+    <music21.pitch.Pitch C4>
+    >>> bool(encoded[0, 1] == encoded[1, 1])
+    True
+    '''
+    import numpy as np
+
+    if not possibilities:
+        return np.zeros((0, 0), dtype=np.intp)
+
+    # possibilities nearly always share the same few Pitch objects,
+    # so look each object up only once.
+    indexById = {}
+    rows = []
+    for possib in possibilities:
+        row = []
+        for p in possib:
+            try:
+                row.append(indexById[id(p)])
+            except KeyError:
+                pIndex = possibility.pitchIndex(p)
+                indexById[id(p)] = pIndex
+                row.append(pIndex)
+        rows.append(row)
+    return np.array(rows, dtype=np.intp)
+
+
+def _pitchSpaceArray(encoded):
+    import numpy as np
+    return np.array(possibility.pitchSpaceValues(), dtype=np.float64)[encoded]
+
+
+# SINGLE POSSIBILITY RULES
+# ------------------------
+# Each takes the encoded possibilities and their pitch space values, plus the rule's
+# arguments, and returns an array of what the rule would return for each possibility.
+
+def _voiceCrossing(encoded, ps):
+    import numpy as np
+    result = np.zeros(len(encoded), dtype=bool)
+    numParts = ps.shape[1]
+    for part1Index in range(numParts):
+        for part2Index in range(part1Index + 1, numParts):
+            result |= ps[:, part1Index] < ps[:, part2Index]
+    return result
+
+
+def _isIncomplete(encoded, ps, pitchNamesToContain):
+    import numpy as np
+    names = np.array(possibility.pitchNames(), dtype=object)[encoded]
+    result = np.zeros(len(encoded), dtype=bool)
+    for pitchName in pitchNamesToContain:
+        result |= ~(names == pitchName).any(axis=1)
+    return result
+
+
+def _upperPartsWithinLimit(encoded, ps, maxSemitoneSeparation=12):
+    import numpy as np
+    if maxSemitoneSeparation is None or ps.shape[1] < 3:
+        return np.ones(len(encoded), dtype=bool)
+    upperParts = ps[:, :-1]
+    return (upperParts.max(axis=1) - upperParts.min(axis=1)) <= maxSemitoneSeparation
+
+
+_singleRuleArrays = {
+    possibility.voiceCrossing: _voiceCrossing,
+    possibility.isIncomplete: _isIncomplete,
+    possibility.upperPartsWithinLimit: _upperPartsWithinLimit,
+}
+
+
+def correctSingleMask(possibilities, rulesToCheck):
+    '''
+    Returns a numpy boolean array which is True for each possibility in `possibilities`
+    that passes every rule in `rulesToCheck`, a list of (method, isCorrect, args) tuples
+    as compiled from :meth:`~music21.figuredBass.segment.Segment.singlePossibilityRules`.
+
+    >>> from music21.figuredBass import possibilityArrays
+    >>> from music21.figuredBass import possibility
+    >>> C3, E3, G3, C4, E4, C5 = [pitch.Pitch(p) for p in ('C3', 'E3', 'G3', 'C4', 'E4', 'C5')]
+    >>> possibs = [(C4, G3, E3, C3), (C5, E4, C4, C3), (C5, C4, G3, C3)]
+    >>> rulesToCheck = [(possibility.isIncomplete, False, [['C', 'E', 'G']]),
+    ...                 (possibility.upperPartsWithinLimit, True, [12])]
+    >>> possibilityArrays.correctSingleMask(possibs, rulesToCheck)
+    array([ True, False, False])
+    '''
+    import numpy as np
+
+    mask = np.ones(len(possibilities), dtype=bool)
+    if not possibilities:
+        return mask
+    encoded = encodePossibilities(possibilities)
+    ps = _pitchSpaceArray(encoded)
+
+    otherRules = []
+    for (method, isCorrect, args) in rulesToCheck:
+        arrayMethod = _singleRuleArrays.get(method, None)
+        if arrayMethod is None:
+            otherRules.append((method, isCorrect, args))
+            continue
+        mask &= (arrayMethod(encoded, ps, *args) == isCorrect)
+
+    if otherRules:
+        for i in np.flatnonzero(mask).tolist():
+            possibA = possibilities[i]
+            for (method, isCorrect, args) in otherRules:
+                if not (method(possibA, *args) == isCorrect):
+                    mask[i] = False
+                    break
+    return mask
+
+
+# CONSECUTIVE POSSIBILITY RULES
+# -----------------------------
+# Each takes the encoded possibilities A and B and their pitch space values, plus the
+# rule's arguments, and returns an (len(A) x len(B)) array of what the rule would return
+# for each (possibA, possibB) pair.
+
+def _pairShape(encodedA, encodedB):
+    return (len(encodedA), len(encodedB))
+
+
+def _partsSame(encodedA, encodedB, psA, psB, partsToCheck=None):
+    import numpy as np
+    result = np.ones(_pairShape(encodedA, encodedB), dtype=bool)
+    if partsToCheck is None:
+        return result
+    for partNumber in partsToCheck:
+        result &= encodedA[:, partNumber - 1, None] == encodedB[None, :, partNumber - 1]
+    return result
+
+
+def _upperPartsSame(encodedA, encodedB, psA, psB):
+    return _partsSame(encodedA, encodedB, psA, psB,
+                      range(1, encodedA.shape[1]))
+
+
+def _voiceOverlap(encodedA, encodedB, psA, psB):
+    import numpy as np
+    result = np.zeros(_pairShape(encodedA, encodedB), dtype=bool)
+    numParts = psA.shape[1]
+    for higherIndex in range(numParts):
+        for lowerIndex in range(higherIndex + 1, numParts):
+            result |= psB[None, :, lowerIndex] > psA[:, higherIndex, None]
+            result |= psB[None, :, higherIndex] < psA[:, lowerIndex, None]
+    return result
+
+
+def _partMovementsWithinLimits(encodedA, encodedB, psA, psB, partMovementLimits=None):
+    import numpy as np
+    result = np.ones(_pairShape(encodedA, encodedB), dtype=bool)
+    if partMovementLimits is None:
+        return result
+    for (partNumber, maxSeparation) in partMovementLimits:
+        movement = np.abs(psB[None, :, partNumber - 1] - psA[:, partNumber - 1, None])
+        result &= movement <= maxSeparation
+    return result
+
+
+def _quartetsWhere(candidates, encodedA, encodedB, lowerIndex, higherIndex,
+                   quartetFunction, result):
+    '''
+    For each (a, b) where `candidates` is True, sets result[a, b] to True if
+    quartetFunction returns True for the pitches
+    (lowerA, lowerB, higherA, higherB).  Each distinct quartet is only checked once.
+    '''
+    import numpy as np
+    aIndices, bIndices = np.nonzero(candidates)
+    if not len(aIndices):
+        return
+    quartets = np.stack([encodedA[aIndices, lowerIndex],
+                         encodedB[bIndices, lowerIndex],
+                         encodedA[aIndices, higherIndex],
+                         encodedB[bIndices, higherIndex]], axis=1)
+    distinctQuartets, inverse = np.unique(quartets, axis=0, return_inverse=True)
+    pitchFromIndex = possibility.pitchFromIndex
+    isFound = np.array([
+        quartetFunction(tuple(pitchFromIndex(pIndex) for pIndex in quartet))
+        for quartet in distinctQuartets.tolist()
+    ], dtype=bool)
+    found = isFound[inverse.reshape(-1)]
+    result[aIndices[found], bIndices[found]] = True
+
+
+def _parallelIntervals(encodedA, encodedB, psA, psB, semitones, quartetFunction):
+    import numpy as np
+    result = np.zeros(_pairShape(encodedA, encodedB), dtype=bool)
+    numParts = psA.shape[1]
+    for higherIndex in range(numParts):
+        for lowerIndex in range(higherIndex + 1, numParts):
+            intervalA = np.abs(psA[:, higherIndex] - psA[:, lowerIndex]) % 12 == semitones
+            if not intervalA.any():
+                continue
+            intervalB = np.abs(psB[:, higherIndex] - psB[:, lowerIndex]) % 12 == semitones
+            candidates = intervalA[:, None] & intervalB[None, :] & ~result
+            _quartetsWhere(candidates, encodedA, encodedB, lowerIndex, higherIndex,
+                           quartetFunction, result)
+    return result
+
+
+def _hiddenIntervals(encodedA, encodedB, psA, psB, semitones, quartetFunction):
+    import numpy as np
+    result = np.zeros(_pairShape(encodedA, encodedB), dtype=bool)
+    intervalB = np.abs(psB[:, 0] - psB[:, -1]) % 12 == semitones
+    candidates = np.broadcast_to(intervalB[None, :], result.shape)
+    _quartetsWhere(candidates, encodedA, encodedB, -1, 0, quartetFunction, result)
+    return result
+
+
+def _parallelFifths(encodedA, encodedB, psA, psB):
+    return _parallelIntervals(encodedA, encodedB, psA, psB, 7,
+                              possibility.quartetHasParallelFifth)
+
+
+def _parallelOctaves(encodedA, encodedB, psA, psB):
+    return _parallelIntervals(encodedA, encodedB, psA, psB, 0,
+                              possibility.quartetHasParallelOctave)
+
+
+def _hiddenFifth(encodedA, encodedB, psA, psB):
+    return _hiddenIntervals(encodedA, encodedB, psA, psB, 7,
+                            possibility.quartetHasHiddenFifth)
+
+
+def _hiddenOctave(encodedA, encodedB, psA, psB):
+    return _hiddenIntervals(encodedA, encodedB, psA, psB, 0,
+                            possibility.quartetHasHiddenOctave)
+
+
+_consecutiveRuleArrays = {
+    possibility.partsSame: _partsSame,
+    possibility.upperPartsSame: _upperPartsSame,
+    possibility.voiceOverlap: _voiceOverlap,
+    possibility.partMovementsWithinLimits: _partMovementsWithinLimits,
+    possibility.parallelFifths: _parallelFifths,
+    possibility.parallelOctaves: _parallelOctaves,
+    possibility.hiddenFifth: _hiddenFifth,
+    possibility.hiddenOctave: _hiddenOctave,
+}
+
+# rules in the order of cheapest first, so that the expensive ones
+# can skip pairs that have already failed.
+_consecutiveRuleOrder = (
+    possibility.partsSame,
+    possibility.upperPartsSame,
+    possibility.partMovementsWithinLimits,
+    possibility.voiceOverlap,
+    possibility.hiddenFifth,
+    possibility.hiddenOctave,
+    possibility.parallelOctaves,
+    possibility.parallelFifths,
+)
+
+
+def correctConsecutiveMask(possibilitiesA, possibilitiesB, rulesToCheck):
+    '''
+    Returns a (len(possibilitiesA) x len(possibilitiesB)) numpy boolean array which is True
+    for each (possibA, possibB) pair that passes every rule in `rulesToCheck`, a list of
+    (method, isCorrect, args) tuples as compiled from
+    :meth:`~music21.figuredBass.segment.Segment.consecutivePossibilityRules`.
+
+    >>> from music21.figuredBass import possibilityArrays
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, G3, A3, F3, C4, D4 = [pitch.Pitch(p)
+    ...                               for p in ('C3', 'D3', 'G3', 'A3', 'F3', 'C4', 'D4')]
+    >>> possibsA = [(C4, G3, C3)]
+    >>> possibsB = [(D4, A3, D3), (D4, F3, D3)]
+    >>> rulesToCheck = [(possibility.parallelFifths, False, []),
+    ...                 (possibility.parallelOctaves, False, [])]
+    >>> possibilityArrays.correctConsecutiveMask(possibsA, possibsB, rulesToCheck)
+    array([[False, False]])
+    >>> possibilityArrays.correctConsecutiveMask(possibsA, possibsB, rulesToCheck[:1])
+    array([[False,  True]])
+    '''
+    import numpy as np
+
+    mask = np.ones((len(possibilitiesA), len(possibilitiesB)), dtype=bool)
+    if not possibilitiesA or not possibilitiesB:
+        return mask
+    encodedA = encodePossibilities(possibilitiesA)
+    encodedB = encodePossibilities(possibilitiesB)
+    psA = _pitchSpaceArray(encodedA)
+    psB = _pitchSpaceArray(encodedB)
+
+    arrayRules = []
+    otherRules = []
+    for (method, isCorrect, args) in rulesToCheck:
+        if method in _consecutiveRuleArrays:
+            arrayRules.append((_consecutiveRuleOrder.index(method), method, isCorrect, args))
+        else:
+            otherRules.append((method, isCorrect, args))
+    arrayRules.sort(key=lambda rule: rule[0])
+
+    for unused_order, method, isCorrect, args in arrayRules:
+        # only check rows and columns that still have a pair which could be correct
+        rows = np.flatnonzero(mask.any(axis=1))
+        columns = np.flatnonzero(mask.any(axis=0))
+        if not len(rows):
+            break
+        ruleResult = _consecutiveRuleArrays[method](encodedA[rows], encodedB[columns],
+                                                    psA[rows], psB[columns], *args)
+        mask[np.ix_(rows, columns)] &= (ruleResult == isCorrect)
+
+    if otherRules:
+        aIndices, bIndices = np.nonzero(mask)
+        for a, b in zip(aIndices.tolist(), bIndices.tolist()):
+            possibA = possibilitiesA[a]
+            possibB = possibilitiesB[b]
+            for (method, isCorrect, args) in otherRules:
+                if not (method(possibA, possibB, *args) == isCorrect):
+                    mask[a, b] = False
+                    break
+    return mask
+
+
+def correctConsecutivePairs(possibilitiesA, possibilitiesB, rulesToCheck):
+    '''
+    Returns a list of the (possibA, possibB) pairs which pass every rule in
+    `rulesToCheck`, in the same order as filtering
+    itertools.product(possibilitiesA, possibilitiesB).
+
+    >>> from music21.figuredBass import possibilityArrays
+    >>> from music21.figuredBass import possibility
+    >>> C3, D3, G3, A3, F3, C4, D4 = [pitch.Pitch(p)
+    ...                               for p in ('C3', 'D3', 'G3', 'A3', 'F3', 'C4', 'D4')]
+    >>> pairs = possibilityArrays.correctConsecutivePairs(
+    ...     [(C4, G3, C3)], [(D4, A3, D3), (D4, F3, D3)],
+    ...     [(possibility.parallelFifths, False, [])])
+    >>> for possibA, possibB in pairs:
+    ...     print(possibA, possibB)
+    (<music21.pitch.Pitch C4>, <music21.pitch.Pitch G3>, <music21.pitch.Pitch C3>)
+    (<music21.pitch.Pitch D4>, <music21.pitch.Pitch F3>, <music21.pitch.Pitch D3>)
+    '''
+    import numpy as np
+
+    mask = correctConsecutiveMask(possibilitiesA, possibilitiesB, rulesToCheck)
+    aIndices, bIndices = np.nonzero(mask)
+    return [(possibilitiesA[a], possibilitiesB[b])
+            for a, b in zip(aIndices.tolist(), bIndices.tolist())]
+
+
+# ------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def testSingleMatchesPossibility(self):
+        from music21.figuredBass import segment
+        from music21.figuredBass import rules
+        from music21 import note
+
+        fbRules = rules.Rules()
+        for bassPitch, notationString in (('C3', ''), ('D3', '4,3'), ('E3', '6')):
+            for forbidCrossing in (True, False):
+                fbRules.forbidVoiceCrossing = forbidCrossing
+                seg = segment.Segment(note.Note(bassPitch), notationString, fbRules=fbRules)
+                rulesToCheck = segment._compileRules(seg.singlePossibilityRules(seg.fbRules))
+                allA = list(seg.allSinglePossibilities())
+                mask = correctSingleMask(allA, rulesToCheck[True])
+                expected = [all(method(possibA, *args) == isCorrect
+                                for (method, isCorrect, args) in rulesToCheck[True])
+                            for possibA in allA]
+                self.assertEqual(mask.tolist(), expected)
+
+    def testConsecutiveMatchesPossibility(self):
+        from music21.figuredBass import segment
+        from music21.figuredBass import rules
+        from music21 import note
+
+        fbRules = rules.Rules()
+        fbRules.forbidVoiceOverlap = False
+        fbRules.partMovementLimits = [(1, 4)]
+        pairs = ((('C3', ''), ('G2', '')),
+                 (('A2', ''), ('B-2', '6')),
+                 (('F#3', '6,5'), ('G3', '')))
+        for (bassA, notationA), (bassB, notationB) in pairs:
+            segA = segment.Segment(note.Note(bassA), notationA, fbRules=fbRules)
+            segB = segment.Segment(note.Note(bassB), notationB, fbRules=fbRules)
+            correctA = segA.allCorrectSinglePossibilities()
+            correctB = segB.allCorrectSinglePossibilities()
+            rulesToCheck = segment._compileRules(segA.consecutivePossibilityRules(segA.fbRules))
+            pairsFound = correctConsecutivePairs(correctA, correctB, rulesToCheck[True])
+            expected = [(possibA, possibB)
+                        for possibA, possibB in itertools.product(correctA, correctB)
+                        if all(method(possibA, possibB, *args) == isCorrect
+                               for (method, isCorrect, args) in rulesToCheck[True])]
+            self.assertEqual(pairsFound, expected)
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
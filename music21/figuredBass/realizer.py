@@ -58,6 +58,7 @@ from music21 import pitch
 from music21 import stream
 from music21.figuredBass import checker
 from music21.figuredBass import notation
+from music21.figuredBass import possibility
 from music21.figuredBass import realizerScale
 from music21.figuredBass import rules
 from music21.figuredBass import segment
@@ -418,6 +419,8 @@ class FiguredBassLine:
             fbRules = rules.Rules()
         if maxPitch is None:
             maxPitch = pitch.Pitch('B5')
+        # the pitches of earlier realizations are not needed to encode this one
+        possibility.clearPitchIndices()
 
         segmentList = []
 
@@ -575,27 +578,40 @@ class Realization:
         if len(self._segmentList) == 1:
             return len(self._segmentList[0].correctA)
         # What if there's only one (bassNote, notationString)?
-        self._segmentList.reverse()
-        pathList = {}
-        for segmentIndex in range(1, len(self._segmentList)):
-            segmentA = self._segmentList[segmentIndex]
-            newPathList = {}
-            if not pathList:
-                for possibA in segmentA.movements:
-                    newPathList[possibA] = len(segmentA.movements[possibA])
-            else:
-                for possibA in segmentA.movements:
-                    prevValue = 0
-                    for possibB in segmentA.movements[possibA]:
-                        prevValue += pathList[possibB]
-                    newPathList[possibA] = prevValue
-            pathList = newPathList
-
-        numSolutions = 0
-        for possibA in pathList:
-            numSolutions += pathList[possibA]
-        self._segmentList.reverse()
-        return numSolutions
+        pathCounts = self._getPathCounts()
+        return sum(pathCounts[0].values())
+
+    def _getPathCounts(self):
+        '''
+        Returns a list with one dictionary for every Segment which resolves to another
+        (that is, all but the last).  The dictionary for a Segment maps each possibility
+        in its movements to the number of possibility progressions which start from
+        that possibility and continue to the end of the Segment list.
+
+        Counts are Python ints, since the number of solutions to a long figured bass line
+        quickly becomes larger than any fixed-size integer.
+
+        >>> from music21.figuredBass import examples
+        >>> fbRealization = examples.exampleB().realize()
+        >>> pathCounts = fbRealization._getPathCounts()
+        >>> len(pathCounts) == len(fbRealization._segmentList) - 1
+        True
+        >>> sum(pathCounts[0].values())
+        422
+        '''
+        pathCounts = []
+        nextPathCount = None
+        for segmentA in reversed(self._segmentList[:-1]):
+            pathCount = {}
+            for possibA, possibBList in segmentA.movements.items():
+                if nextPathCount is None:
+                    pathCount[possibA] = len(possibBList)
+                else:
+                    pathCount[possibA] = sum(nextPathCount[possibB] for possibB in possibBList)
+            pathCounts.append(pathCount)
+            nextPathCount = pathCount
+        pathCounts.reverse()
+        return pathCounts
 
     def getAllPossibilityProgressions(self):
         '''
@@ -633,22 +649,38 @@ class Realization:
     def getRandomPossibilityProgression(self):
         '''
         Returns a random unique possibility progression.
+
+        Every possibility progression is equally likely to be returned: each possibility
+        is chosen in proportion to the number of progressions which continue from it
+        (see :meth:`~music21.figuredBass.realizer.Realization.getNumSolutions`).
+
+        >>> from music21.figuredBass import examples
+        >>> fbRealization = examples.exampleB().realize()
+        >>> progression = fbRealization.getRandomPossibilityProgression()
+        >>> len(progression) == len(fbRealization._segmentList)
+        True
+        >>> progression in fbRealization.getAllPossibilityProgressions()
+        True
         '''
         progression = []
         if len(self._segmentList) == 1:
-            possibA = random.sample(self._segmentList[0].correctA, 1)[0]
+            possibA = random.choice(self._segmentList[0].correctA)
             progression.append(possibA)
             return progression
 
-        currMovements = self._segmentList[0].movements
-        if self.getNumSolutions() == 0:
+        pathCounts = self._getPathCounts()
+        if sum(pathCounts[0].values()) == 0:
             raise FiguredBassLineException('Zero solutions')
-        prevPossib = random.sample(currMovements.keys(), 1)[0]
+        prevPossib = _weightedChoice(list(pathCounts[0]), pathCounts[0])
         progression.append(prevPossib)
 
         for segmentIndex in range(len(self._segmentList) - 1):
             currMovements = self._segmentList[segmentIndex].movements
-            nextPossib = random.sample(currMovements[prevPossib], 1)[0]
+            if segmentIndex + 1 < len(pathCounts):
+                nextPossib = _weightedChoice(currMovements[prevPossib],
+                                             pathCounts[segmentIndex + 1])
+            else:
+                nextPossib = random.choice(currMovements[prevPossib])
             progression.append(nextPossib)
             prevPossib = nextPossib
 
@@ -782,6 +814,25 @@ class Realization:
         return allSols
 
 
+def _weightedChoice(possibilities, pathCount):
+    '''
+    Chooses one of `possibilities` at random, weighted by its (possibly very large)
+    integer count in the dictionary pathCount.
+
+    >>> from music21.figuredBass import realizer
+    >>> realizer._weightedChoice(['a', 'b', 'c'], {'a': 0, 'b': 10**30, 'c': 0})
+    'b'
+    '''
+    # random.randrange is exact for ints of any size, unlike the float weights
+    # of random.choices.
+    target = random.randrange(sum(pathCount[possib] for possib in possibilities))
+    for possib in possibilities:
+        target -= pathCount[possib]
+        if target < 0:
+            return possib
+    return possibilities[-1]
+
+
 _DOC_ORDER = [figuredBassFromStream, addLyricsToBassNote,
               FiguredBassLine, Realization]
 
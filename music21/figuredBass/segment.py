@@ -15,6 +15,7 @@ import unittest
 
 from typing import Dict, Optional, Union
 
+from music21 import base
 from music21 import chord
 from music21 import environment
 from music21 import exceptions21
@@ -22,12 +23,17 @@ from music21 import note
 from music21 import pitch
 from music21 import scale
 from music21.figuredBass import possibility
+from music21.figuredBass import possibilityArrays
 from music21.figuredBass import realizerScale
 from music21.figuredBass import resolution
 from music21.figuredBass import rules
 
 _MOD = 'figuredBass.segment'
 
+# check rules on whole lists of possibilities at once
+# (see music21.figuredBass.possibilityArrays) whenever numpy is available.
+USE_POSSIBILITY_ARRAYS = 'numpy' not in base._missingImport
+
 _defaultRealizerScale: Dict[str, Optional[realizerScale.FiguredBassScale]] = {
     'scale': None,  # singleton
 }
@@ -718,6 +724,11 @@ class Segment:
         self._singlePossibilityRuleChecking = _compileRules(
             self.singlePossibilityRules(self.fbRules))
         allA = self.allSinglePossibilities()
+        if USE_POSSIBILITY_ARRAYS:
+            allA = list(allA)
+            mask = possibilityArrays.correctSingleMask(
+                allA, self._singlePossibilityRuleChecking[True])
+            return [allA[i] for i in mask.nonzero()[0].tolist()]
         return [possibA for possibA in allA if self._isCorrectSinglePossibility(possibA)]
 
     def allCorrectConsecutivePossibilities(self, segmentB):
@@ -837,6 +848,9 @@ class Segment:
             self.consecutivePossibilityRules(self.fbRules))
         correctA = self.allCorrectSinglePossibilities()
         correctB = segmentB.allCorrectSinglePossibilities()
+        if USE_POSSIBILITY_ARRAYS:
+            return iter(possibilityArrays.correctConsecutivePairs(
+                correctA, correctB, self._consecutivePossibilityRuleChecking[True]))
         correctAB = itertools.product(correctA, correctB)
         return filter(lambda possibAB: self._isCorrectConsecutivePossibility(possibA=possibAB[0],
                                                                               possibB=possibAB[1]),
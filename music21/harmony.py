@@ -15,6 +15,8 @@ An object representation of harmony, a subclass of chord, as encountered as chor
 roman numerals, or other chord representations with a defined root.
 '''
 import collections
+import copy
+import numbers
 import re
 import unittest
 
@@ -714,6 +716,7 @@ def addNewChordSymbol(chordTypeName, fbNotationString, AbbreviationList):
     >>> harmony.removeChordSymbols('BethChord')
     '''
     CHORD_TYPES[chordTypeName] = [fbNotationString, AbbreviationList]
+    clearCaches()
 
 
 def changeAbbreviationFor(chordType, changeTo):
@@ -733,6 +736,7 @@ def changeAbbreviationFor(chordType, changeTo):
     >>> harmony.changeAbbreviationFor('minor', 'm')  # must change it back for the rest of doctests
     '''
     CHORD_TYPES[chordType][1].insert(0, changeTo)
+    clearCaches()
 
 
 def chordSymbolFigureFromChord(inChord, includeChordType=False):
@@ -1313,6 +1317,106 @@ def chordSymbolFromChord(inChord):
     return cs
 
 
+def _chordFigureCacheKey(chordObj):
+    '''
+    Return a key for `_chordFigureCache` describing everything about `chordObj`
+    that :func:`~music21.harmony.chordSymbolFigureFromChord` uses,
+    or None if the figure should not be cached.
+
+    Octaves do not matter when every pitch name is different and the bass is
+    the only lowest note:
+
+    >>> key1 = harmony._chordFigureCacheKey(chord.Chord('E3 C4 G4 B-4'))
+    >>> key1
+    ('names', ('E', 'C', 'G', 'B-'), 'E', None)
+    >>> key1 == harmony._chordFigureCacheKey(chord.Chord('E2 C5 G3 B-4'))
+    True
+
+    Otherwise the octaves are part of the key:
+
+    >>> harmony._chordFigureCacheKey(chord.Chord('C4 E4 G4 C5'))
+    ('namesWithOctaves', ('C4', 'E4', 'G4', 'C5'), 'C4', None)
+    '''
+    overrides = chordObj._overrides
+    if any(overrideName != 'root' for overrideName in overrides):
+        return None
+    pitches = chordObj.pitches
+    if not pitches:
+        return None
+    for p in pitches:
+        if p._microtone is not None and p._microtone.cents != 0:
+            return None
+    rootOverride = overrides['root'].nameWithOctave if 'root' in overrides else None
+    bass = chordObj.bass()
+    names = tuple(p.name for p in pitches)
+    if (len(set(names)) == len(names)
+            and all(p is bass or p.ps > bass.ps for p in pitches)):
+        return ('names', names, bass.name, rootOverride)
+    return ('namesWithOctaves', tuple(p.nameWithOctave for p in pitches),
+            bass.nameWithOctave, rootOverride)
+
+
+def chordSymbolFiguresFromChords(chords, includeChordType=False):
+    '''
+    Return a list of what :func:`~music21.harmony.chordSymbolFigureFromChord`
+    returns for each of `chords`, analyzing each different chord only once,
+    so that long series of chords which repeat a small vocabulary,
+    such as those of a chordified score, are quick to label.
+
+    >>> chords = [chord.Chord('C3 E3 G3'), chord.Chord('G2 B3 D4 F4'), chord.Chord('C4 E4 G4')]
+    >>> harmony.chordSymbolFiguresFromChords(chords)
+    ['C', 'G7', 'C']
+
+    Besides Chord objects, items can be collections of pitch classes, such as
+    tuples, sets, or the rows of a numpy array, which are made into Chords as
+    the Chord constructor does.  Pitch classes have no octave, so the
+    lowest pitch class is the bass:
+
+    >>> harmony.chordSymbolFiguresFromChords([(0, 4, 7), {2, 5, 9}, [7, 11, 2, 5]],
+    ...                                      includeChordType=True)
+    [('C', 'major'), ('Dm', 'minor'), ('G7/D', 'dominant-seventh')]
+
+    or anything else the Chord constructor takes:
+
+    >>> harmony.chordSymbolFiguresFromChords(['E-3 G3 B-3', ['B-2', 'D4', 'F4', 'A-4']])
+    ['E-', 'B-7']
+
+    Unlike chordSymbolFigureFromChord, this function does not change the chords.
+    '''
+    post = []
+    for item in chords:
+        if isinstance(item, chord.Chord):
+            chordObj = item
+        else:
+            if isinstance(item, (set, frozenset)):
+                item = sorted(item)
+            elif not isinstance(item, str):
+                item = list(item)
+            if not isinstance(item, str) and all(isinstance(x, numbers.Integral) for x in item):
+                item = [int(x) for x in item]
+                cacheKey = ('pitchClasses', tuple(item))
+                found = _chordFigureCache.get(cacheKey)
+                if found is None:
+                    found = chordSymbolFigureFromChord(chord.Chord(item), includeChordType=True)
+                    _chordFigureCache[cacheKey] = found
+                post.append(found if includeChordType else found[0])
+                continue
+            chordObj = chord.Chord(item)
+
+        cacheKey = _chordFigureCacheKey(chordObj)
+        found = None
+        if cacheKey is not None:
+            found = _chordFigureCache.get(cacheKey)
+        if found is None:
+            # chordSymbolFigureFromChord can set the root of a chord, so work on a copy
+            chordCopy = copy.deepcopy(chordObj)
+            found = chordSymbolFigureFromChord(chordCopy, includeChordType=True)
+            if cacheKey is not None:
+                _chordFigureCache[cacheKey] = found
+        post.append(found if includeChordType else found[0])
+    return post
+
+
 def getAbbreviationListGivenChordType(chordType):
     '''
     Get the Abbreviation list (all allowed Abbreviations that map to this
@@ -1355,11 +1459,81 @@ def removeChordSymbols(chordType):
     can no longer be identified or parsed by harmony methods.
     '''
     del CHORD_TYPES[chordType]
+    clearCaches()
 
 
 # --------------------------------------------------------------------------
 realizerScaleCache = {}
 
+# LRU-bounded memos of realizing ChordSymbol figures (see ChordSymbol._parseFigure)
+# and of the figures that chordSymbolFiguresFromChords finds.  Figures in root
+# position share one entry for all roots, which is transposed to each new root.
+# Changing CHORD_TYPES through the functions above empties them; call clearCaches()
+# after changing CHORD_TYPES directly.
+USE_FIGURE_CACHE = True
+_figureCache = common.LRUCache(maxSize=2048)
+_chordFigureCache = common.LRUCache(maxSize=8192)
+
+# keywords to ChordSymbol which change how a figure is realized
+_FIGURE_CACHE_EXCLUDED_KEYWORDS = ('root', 'bass', 'inversion', 'kind')
+
+
+def _figureCacheKey(figure):
+    '''
+    Return a tuple of the key in _figureCache for the (whitespace-free)
+    ChordSymbol figure `figure` and the name of the root to transpose the
+    cached entry to, or (None, None) if the figure has no root.
+
+    Figures in root position are keyed by the figure without the root:
+
+    >>> harmony._figureCacheKey('E-m7')
+    (('root', 'm7'), 'E-')
+
+    Where the realization depends on more than the root (a bass, or a root
+    given before a comma), the whole figure is the key:
+
+    >>> harmony._figureCacheKey('Am7/G')
+    (('figure', 'Am7/G'), None)
+    '''
+    if ',' in figure or '/' in figure:
+        return ('figure', figure), None
+    m = re.match(r'[A-Ga-g][#-]*', figure)
+    if not m:
+        return None, None
+    return ('root', figure[m.end():]), m.group()
+
+
+def cacheStats():
+    '''
+    Return a dictionary of statistics (hits, misses, hitRate, size, maxSize)
+    for the caches of realized ChordSymbol figures (`'figure'`) and of the
+    figures found by :func:`~music21.harmony.chordSymbolFiguresFromChords` (`'chord'`).
+
+    >>> harmony.clearCaches()
+    >>> cs = harmony.ChordSymbol('Cm7')
+    >>> cs = harmony.ChordSymbol('F#m7')
+    >>> stats = harmony.cacheStats()
+    >>> stats['figure']['hits'], stats['figure']['misses']
+    (1, 1)
+    '''
+    return {'figure': _figureCache.stats(),
+            'chord': _chordFigureCache.stats(),
+            }
+
+
+def clearCaches():
+    '''
+    Empty the caches of realized ChordSymbol figures and of figures found from
+    chords, and reset their statistics.
+
+    >>> harmony.clearCaches()
+    >>> harmony.cacheStats()['figure']['size']
+    0
+    '''
+    _figureCache.clear()
+    _chordFigureCache.clear()
+
+
 # --------------------------------------------------------------------------
 
 
@@ -1558,7 +1732,20 @@ class ChordSymbol(Harmony):
             if kw == 'kindStr':
                 self.chordKindStr = keywords[kw]
 
+        # used only while initializing: whether _figureCache can be used, the key
+        # of this figure in it, the name of the root, and the entry found.
+        self._useFigureCache = (USE_FIGURE_CACHE
+                                and keywords.get('updatePitches', True)
+                                and not any(kw in keywords
+                                            for kw in _FIGURE_CACHE_EXCLUDED_KEYWORDS))
+        self._figureCacheKey = None
+        self._figureCacheRootName = None
+        self._figureCacheEntry = None
         super().__init__(figure, **keywords)
+        self._useFigureCache = False
+        self._figureCacheKey = None
+        self._figureCacheRootName = None
+        self._figureCacheEntry = None
         if 'duration' not in keywords and 'quarterLength' not in keywords:
             self.duration = duration.Duration(0)
 
@@ -1823,6 +2010,22 @@ class ChordSymbol(Harmony):
         # remove spaces from prelim Figure...
         prelimFigure = self.figure
         prelimFigure = re.sub(r'\s', '', prelimFigure)
+
+        # setting a figure again keeps earlier chord step modifications,
+        # so only newly initialized objects use the cache.
+        if self._useFigureCache:
+            cacheKey, rootName = _figureCacheKey(prelimFigure)
+            if cacheKey is not None:
+                cacheEntry = _figureCache.get(cacheKey)
+                self._figureCacheKey = cacheKey
+                self._figureCacheRootName = rootName
+                if cacheEntry is not None:
+                    self.chordKind = cacheEntry['chordKind']
+                    self.chordStepModifications = copy.deepcopy(
+                        cacheEntry['chordStepModifications'])
+                    self._figureCacheEntry = cacheEntry
+                    return
+
         # Get Root:
         if ',' in prelimFigure:
             root = prelimFigure[0:prelimFigure.index(',')]
@@ -1981,6 +2184,9 @@ class ChordSymbol(Harmony):
         'E2'
         '''
 
+        if self._figureCacheEntry is not None and self._updatePitchesFromCache():
+            return
+
         if 'root' not in self._overrides or 'bass' not in self._overrides or self.chordKind is None:
             return
 
@@ -2060,6 +2266,100 @@ class ChordSymbol(Harmony):
         self.bass(self.bass())
         self.root(self.root())
 
+        if self._figureCacheKey is not None:
+            self._storeInFigureCache()
+
+    def _storeInFigureCache(self):
+        '''
+        Store the realization of this newly initialized ChordSymbol in _figureCache.
+        '''
+        rootPitch = self._overrides['root']
+        bassPitch = self._overrides['bass']
+        rootIndex = bassIndex = None
+        for i, p in enumerate(self.pitches):
+            if p is rootPitch:
+                rootIndex = i
+            if p is bassPitch:
+                bassIndex = i
+        if rootIndex is None or bassIndex is None:
+            return
+        cachedPitches = copy.deepcopy(self.pitches)
+        for p in cachedPitches:
+            p._client = None
+        _figureCache[self._figureCacheKey] = {
+            'chordKind': self.chordKind,
+            'chordStepModifications': copy.deepcopy(self.chordStepModifications),
+            'degreesList': tuple(self._degreesList),
+            'pitches': cachedPitches,
+            'rootIndex': rootIndex,
+            'bassIndex': bassIndex,
+        }
+
+    def _updatePitchesFromCache(self):
+        '''
+        Set the pitches from the entry found in _figureCache, transposed to the
+        root of this figure if the entry is for a figure in root position,
+        and return True; or return False if the pitches cannot be transposed,
+        after setting the root and bass so that they can be realized anew.
+        '''
+        cacheEntry = self._figureCacheEntry
+        self._figureCacheEntry = None
+        self._degreesList = list(cacheEntry['degreesList'])
+        cachedPitches = cacheEntry['pitches']
+        rootName = self._figureCacheRootName
+        if rootName is not None:
+            # pitches of a figure in root position, by the name of their root.
+            transposedPitches = cacheEntry.setdefault('transposed', {})
+            if rootName in transposedPitches:
+                cachedPitches = transposedPitches[rootName]
+            else:
+                cachedPitches = self._transposeCachedPitches(cachedPitches,
+                                                             cacheEntry['rootIndex'],
+                                                             rootName)
+                if cachedPitches is None:
+                    newRoot = pitch.Pitch(rootName)
+                    newRoot.octave = 3
+                    self.root(newRoot)
+                    self.bass(newRoot)
+                    return False
+                transposedPitches[rootName] = cachedPitches
+
+        self.pitches = tuple(copy.deepcopy(cachedPitches))
+        self.bass(self.pitches[cacheEntry['bassIndex']])
+        self.root(self.pitches[cacheEntry['rootIndex']])
+        return True
+
+    def _transposeCachedPitches(self, cachedPitches, rootIndex, rootName):
+        '''
+        Return a tuple of new pitches for `cachedPitches`, the pitches of a
+        figure in root position with the root at `rootIndex`, as they are realized
+        on a root named `rootName`, or None if they cannot be transposed.
+
+        Pitches are realized with the root in the third octave, then moved by
+        octaves into the range of A1 to C4.
+
+        >>> cs = harmony.ChordSymbol('C9')
+        >>> cs._transposeCachedPitches(cs.pitches, 0, 'B-')
+        (<music21.pitch.Pitch B-2>, <music21.pitch.Pitch D3>, <music21.pitch.Pitch F3>,
+         <music21.pitch.Pitch A-3>, <music21.pitch.Pitch C4>)
+        '''
+        newRoot = pitch.Pitch(rootName)
+        newRoot.octave = 3
+        pitches = copy.deepcopy(cachedPitches)
+        try:
+            transposeInterval = interval.Interval(pitches[rootIndex], newRoot)
+            for p in pitches:
+                p.transpose(transposeInterval, inPlace=True)
+        except (pitch.PitchException, pitch.AccidentalException, interval.IntervalException):
+            return None
+        while self._hasPitchAboveC4(pitches):
+            for thisPitch in pitches:
+                thisPitch.octave -= 1
+        while self._hasPitchBelowA1(pitches):
+            for thisPitch in pitches:
+                thisPitch.octave += 1
+        return pitches
+
     # PUBLIC METHODS #
 
     def findFigure(self):
@@ -2905,6 +3205,61 @@ class Test(unittest.TestCase):
         self.assertEqual('C4', str(cs.root()))
         self.assertEqual('E3', str(cs.bass()))
 
+    def testFigureCache(self):
+        global USE_FIGURE_CACHE  # pylint: disable=global-statement
+        roots = ['C', 'F#', 'B-', 'B', 'E#', 'C-', 'e-']
+        suffixes = ['', 'm', 'dim7', 'm7b5', '9', 'Maj13', 'm11', 'sus2', 'pedal',
+                    'add9', '7omit3', '35b7b9#11b13', '/E', 'm7/G', '7omit5/G#']
+        figures = [r + suffix for r in roots for suffix in suffixes] + ['D,35b7b9#11b13']
+
+        def describe(cs):
+            return (tuple(p.nameWithOctave for p in cs.pitches),
+                    cs.root().nameWithOctave,
+                    cs.bass().nameWithOctave,
+                    cs.chordKind,
+                    cs._degreesList,
+                    repr(cs.chordStepModifications),
+                    cs.inversion())
+
+        USE_FIGURE_CACHE = False
+        try:
+            uncached = [describe(ChordSymbol(f)) for f in figures]
+        finally:
+            USE_FIGURE_CACHE = True
+        clearCaches()
+        # first from realizing or transposing, then from the transposed pitches
+        for unused_repeat in range(2):
+            self.assertEqual([describe(ChordSymbol(f)) for f in figures], uncached)
+
+        # the pitches of each ChordSymbol are its own
+        cs1 = ChordSymbol('Am7')
+        cs1.root().octave = 5
+        cs2 = ChordSymbol('Am7')
+        self.assertEqual(str(cs2.root()), 'A2')
+        self.assertIs(cs2.root(), cs2.pitches[0])
+        # chord step modifications are, too
+        cs1 = ChordSymbol('C7omit3')
+        cs1.chordStepModifications[0].degree = 5
+        self.assertEqual(ChordSymbol('C7omit3').chordStepModifications[0].degree, 3)
+
+        # keywords which change the realization are not cached
+        cs = ChordSymbol('C', bass='E')
+        self.assertEqual(str(cs.bass()), 'E3')
+        self.assertEqual(str(ChordSymbol('C').bass()), 'C3')
+
+    def testChordSymbolFiguresFromChords(self):
+        chords = [chord.Chord('G3 C4 D4'), chord.Chord('C4 E4 G4'), chord.Chord('G3 C4 D4')]
+        figures = chordSymbolFiguresFromChords(chords, includeChordType=True)
+        self.assertEqual(figures, [('Gsus', 'suspended-fourth'), ('C', 'major'),
+                                   ('Gsus', 'suspended-fourth')])
+        # chordSymbolFigureFromChord would have set the root
+        self.assertEqual(chords[0]._overrides, {})
+
+        expected = [chordSymbolFigureFromChord(chord.Chord(pcs))
+                    for pcs in ([0, 4, 7], [9, 0, 4], [7, 11, 2, 5], [0, 4, 7])]
+        self.assertEqual(chordSymbolFiguresFromChords(
+            [(0, 4, 7), (9, 0, 4), (7, 11, 2, 5), (0, 4, 7)]), expected)
+
 
     def x_testChordStepFromFigure(self):
         '''To make this work, will need some regex work.
@@ -43,6 +43,7 @@ SpineParsing consists of several steps.
 * Stream elements are moved into their measures within a Stream
 * Measures are searched for elements with voice groups and Voice objects are created
 '''
+import collections
 import copy
 import math
 import re
@@ -186,8 +187,11 @@ class HumdrumDataCollection(prebase.ProtoM21Object):
             assert(self.parsePositionInStream == self.fileLength)
         except AssertionError:  # pragma: no cover
             raise HumdrumException('getEventListFromDataStream failed: did not parse entire file')
-        self.parseProtoSpinesAndEventCollections()
-        self.spineCollection = self.createHumdrumSpines()
+        if self.hasSpinePathChanges():
+            self.parseProtoSpinesAndEventCollections()
+            self.spineCollection = self.createHumdrumSpines()
+        else:
+            self.spineCollection = self.createHumdrumSpinesFromColumns()
         self.spineCollection.createMusic21Streams()
         self.insertGlobalEvents()
         for thisSpine in self.spineCollection:
@@ -391,9 +395,9 @@ class HumdrumDataCollection(prebase.ProtoM21Object):
             line = line.rstrip()
             if line == '':
                 continue  # technically forbidden by Humdrum but the source of so many errors!
-            elif re.match(r'!!!', line):
+            elif line.startswith('!!!'):
                 self.eventList.append(GlobalReferenceLine(self.parsePositionInStream, line))
-            elif re.match(r'!!', line):  # find global comments at the top of the line
+            elif line.startswith('!!'):  # find global comments at the top of the line
                 self.eventList.append(GlobalCommentLine(self.parsePositionInStream, line))
             else:
                 thisLine = SpineLine(self.parsePositionInStream, line)
@@ -538,6 +542,100 @@ class HumdrumDataCollection(prebase.ProtoM21Object):
 
         return (returnProtoSpines, returnEventCollections)
 
+    def hasSpinePathChanges(self):
+        r'''
+        Returns True unless every spine runs from top to bottom of self.eventList
+        in the same column: that is, unless each line has the same number of spines,
+        and no line has a spine path indicator that adds, splits, joins, or exchanges
+        spines (\*+, \*^, \*v, or \*x), or terminates one (\*-) before the last line.
+
+        Files without spine path changes can be parsed with
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.createHumdrumSpinesFromColumns`.
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(
+        ...     '**kern\t**dynam\n4c\tp\n*-\t*-')
+        >>> hdc.maxSpines = 2
+        >>> eventList = hdc.parseEventListFromDataStream()
+        >>> hdc.hasSpinePathChanges()
+        False
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(
+        ...     '**kern\n*^\n4c\t4e\n*v\t*v\n*-')
+        >>> hdc.maxSpines = 2
+        >>> eventList = hdc.parseEventListFromDataStream()
+        >>> hdc.hasSpinePathChanges()
+        True
+        '''
+        if not self.eventList:
+            self.parseEventListFromDataStream()
+
+        spineLines = [line for line in self.eventList if line.isSpineLine]
+        for i, line in enumerate(spineLines):
+            if line.numSpines != self.maxSpines:
+                return True
+            if '*' not in line.contents:
+                continue
+            for contents in line.spineData:
+                if contents in ('*+', '*^', '*v', '*x'):
+                    return True
+                if contents == '*-' and i != len(spineLines) - 1:
+                    return True
+        return False
+
+    def createHumdrumSpinesFromColumns(self):
+        r'''
+        A faster alternative to running
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.parseProtoSpinesAndEventCollections`
+        and
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.createHumdrumSpines`
+        for files where
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.hasSpinePathChanges`
+        is False.  Each column of self.eventList becomes one HumdrumSpine, so
+        no ProtoSpines or EventCollections are needed (self.protoSpines and
+        self.eventCollections are left as None).
+
+        Returns the same :class:`~music21.humdrum.spineParser.SpineCollection`
+        as createHumdrumSpines would.
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(
+        ...     '!! comment\n**kern\t**dynam\n4c\tp\n*-\t*-')
+        >>> hdc.maxSpines = 2
+        >>> eventList = hdc.parseEventListFromDataStream()
+        >>> spineCollection = hdc.createHumdrumSpinesFromColumns()
+        >>> spineCollection.spines
+        [<music21.humdrum.spineParser.HumdrumSpine: 0>,
+         <music21.humdrum.spineParser.HumdrumSpine: 1>]
+        >>> spineCollection.spines[1].eventList
+        [<music21.humdrum.spineParser.SpineEvent **dynam>,
+         <music21.humdrum.spineParser.SpineEvent p>,
+         <music21.humdrum.spineParser.SpineEvent *->]
+        >>> spineCollection.spines[1].insertPoint, spineCollection.spines[1].endingPosition
+        (1, 3)
+        '''
+        if not self.eventList:
+            self.parseEventListFromDataStream()
+
+        spineCollection = SpineCollection()
+        spines = None
+        for i, line in enumerate(self.eventList):
+            if not line.isSpineLine:
+                continue
+            if spines is None:
+                # Humdrum does not require *+ at the beginning
+                spines = []
+                for unused_j in range(self.maxSpines):
+                    thisSpine = spineCollection.addSpine()
+                    thisSpine.insertPoint = i
+                    spines.append(thisSpine)
+            for thisSpine, contents in zip(spines, line.spineData):
+                thisEvent = SpineEvent(contents, i)
+                thisEvent.protoSpineId = thisSpine.id
+                thisSpine.eventList.append(thisEvent)
+                if contents == '*-':  # terminate spine
+                    thisSpine.endingPosition = i
+
+        return spineCollection
+
     def createHumdrumSpines(self, protoSpines=None, eventCollections=None):
         '''
         Takes the data from the object's protoSpines and eventCollections
@@ -860,7 +958,10 @@ class SpineLine(HumdrumLine):
     def __init__(self, position=0, contents=''):
         self.position = position
         contents = contents.rstrip()
-        returnList = re.split('\t+', contents)
+        if '\t\t' in contents:
+            returnList = re.split('\t+', contents)
+        else:
+            returnList = contents.split('\t')
         self.numSpines = len(returnList)
         self.contents = contents
         self.spineData = returnList
@@ -1067,6 +1168,8 @@ class HumdrumSpine(prebase.ProtoM21Object):
         self.isFirstVoice = None
         self.iterIndex = None
 
+        self._streamHighestTime = None
+
     def _reprInternal(self):
         representation = ': ' + str(self.id)
         if self.parentSpine:
@@ -1084,6 +1187,23 @@ class HumdrumSpine(prebase.ProtoM21Object):
         '''
         self.eventList.append(event)
 
+    def _appendToStream(self, thisObject):
+        '''
+        coreAppend `thisObject` to the end of self.stream while parsing.
+
+        Parsing appends everything to a spine's stream in order, so the stream's
+        highest time is always the one left by the previous append.  It is restored
+        here because setting the right barline of the previous Measure (in
+        hdStringToMeasure) clears the stream's cache, and recomputing the highest
+        time for every new Measure made parsing quadratic in the length of the spine.
+        '''
+        spineStream = self.stream
+        if (self._streamHighestTime is not None
+                and spineStream._cache.get('HighestTime') is None):
+            spineStream._setHighestTime(self._streamHighestTime)
+        spineStream.coreAppend(thisObject)
+        self._streamHighestTime = spineStream.highestTime
+
     def __iter__(self):
         '''
         Resets the counter to 0 so that iteration is correct
@@ -1259,6 +1379,7 @@ class HumdrumSpine(prebase.ProtoM21Object):
         specific Spine subclasses.
         '''
         lastContainer = hdStringToMeasure('=0')
+        self._streamHighestTime = None
 
         for event in self.eventList:
             eventC = str(event.contents)
@@ -1280,7 +1401,7 @@ class HumdrumSpine(prebase.ProtoM21Object):
                 thisObject.humdrumPosition = event.position
 
             if thisObject is not None:
-                self.stream.coreAppend(thisObject)
+                self._appendToStream(thisObject)
         self.stream.coreElementsChanged()
 
 
@@ -1307,6 +1428,7 @@ class KernSpine(HumdrumSpine):
         self.currentBeamNumbers = 0
         self.currentTupletDuration = 0.0
         self.desiredTupletDuration = 0.0
+        self._streamHighestTime = None
 
         for event in self.eventList:
             # event is a SpineEvent object
@@ -1336,7 +1458,7 @@ class KernSpine(HumdrumSpine):
                     # pylint: disable=attribute-defined-outside-init
                     thisObject.humdrumPosition = event.position
                     thisObject.priority = event.position
-                    self.stream.coreAppend(thisObject)
+                    self._appendToStream(thisObject)
             except Exception as e:  # pylint: disable=broad-except  # pragma: no cover
                 import traceback
                 environLocal.warn(
@@ -1491,6 +1613,7 @@ class HarmSpine(HumdrumSpine):
     def parse(self):
         lastContainer = hdStringToMeasure('=0')
         currentKey = key.Key('C')
+        self._streamHighestTime = None
         for event in self.eventList:
             eventC = event.contents
             thisObject = None
@@ -1526,7 +1649,7 @@ class HarmSpine(HumdrumSpine):
                 # pylint: disable=attribute-defined-outside-init
                 thisObject.humdrumPosition = event.position
                 thisObject.priority = event.position
-                self.stream.coreAppend(thisObject)
+                self._appendToStream(thisObject)
         self.stream.coreElementsChanged()
 
 # END HUMDRUM SPINES
@@ -2193,18 +2316,67 @@ def hdStringToNote(contents):
 
     '''
 
+    JRP = flavors['JRP']
+    recipe = _kernTokenCache.get((contents, JRP))
+    if recipe is None:
+        recipe = kernTokenRecipe(contents, JRP)
+        _kernTokenCache[(contents, JRP)] = recipe
+    return kernRecipeToNote(recipe)
+
+
+# kern files repeat the same few tokens constantly, so the string analysis of each
+# token is done once and stored here, keyed on (token, flavors['JRP'])
+_kernTokenCache = common.LRUCache(maxSize=4096)
+
+
+def _connectedTurn():
+    t1 = expressions.Turn()
+    t1.connectedToPrevious = True  # true by default, but explicitly
+    return t1
+
+
+KernTokenRecipe = collections.namedtuple('KernTokenRecipe', [
+    'isRest', 'step', 'octave', 'accidental', 'tieType',
+    'expressions', 'articulations', 'stemDirection',
+    'durationSteps', 'grace', 'beams'])
+
+
+def kernTokenRecipe(contents, JRP=False):
+    r'''
+    Analyze a single \*\*kern note or rest token and return a
+    :class:`~music21.humdrum.spineParser.KernTokenRecipe`, an immutable
+    description of the object that :func:`~music21.humdrum.spineParser.hdStringToNote`
+    makes from it.  Recipes are cached by hdStringToNote, so each distinct
+    token in a file only needs to be analyzed once.
+
+    >>> recipe = humdrum.spineParser.kernTokenRecipe("8cc#'L")
+    >>> recipe.step, recipe.octave, recipe.accidental
+    ('c', 5, '#')
+    >>> recipe.durationSteps
+    ('type', 'eighth', 0)
+    >>> recipe.articulations
+    (<class 'music21.articulations.Staccato'>,)
+    >>> recipe.beams
+    (('start',),)
+
+    >>> humdrum.spineParser.kernTokenRecipe('6r').durationSteps
+    ('tuplet', 'quarter', 3, 2, 0, 0)
+    >>> humdrum.spineParser.kernTokenRecipe('3%2r').durationSteps
+    ('quarterLength', 2.6666666666666665, 0)
+    '''
     # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
 
     # 3.2.1 Pitches and 3.3 Rests
 
     matchedNote = re.search('([a-gA-G]+)', contents)
-    thisObject = None
+    step = None
+    octave = None
 
     # Detect rests first, because rests can contain manual positioning information,
     # which is also detected by the `matchedNote` variable above.
-    if contents.count('r'):
-        thisObject = note.Rest()
-
+    isRest = 'r' in contents
+    if isRest:
+        pass
     elif matchedNote:
         kernNoteName = matchedNote.group(1)
         step = kernNoteName[0].lower()
@@ -2212,116 +2384,100 @@ def hdStringToNote(contents):
             octave = 3 + len(kernNoteName)
         else:  # below middle C
             octave = 4 - len(kernNoteName)
-        thisObject = note.Note(octave=octave)
-        thisObject.step = step
-
     else:
         raise HumdrumException(f'Could not parse {contents} for note information')
 
     matchedSharp = re.search(r'(#+)', contents)
     matchedFlat = re.search(r'(-+)', contents)
 
+    accidental = None
     if matchedSharp:
-        thisObject.pitch.accidental = matchedSharp.group(0)
+        accidental = matchedSharp.group(0)
     elif matchedFlat:
-        thisObject.pitch.accidental = matchedFlat.group(0)
-    elif contents.count('n'):
-        thisObject.pitch.accidental = 'n'
+        accidental = matchedFlat.group(0)
+    elif 'n' in contents:
+        accidental = 'n'
 
     # 3.2.2 -- Slurs, Ties, Phrases
-    # TODO: add music21 phrase information
-    if contents.count('{'):
-        for i in range(contents.count('{')):
-            pass  # phraseMark start
-    if contents.count('}'):
-        for i in range(contents.count('}')):
-            pass  # phraseMark end
-    if contents.count('('):
-        for i in range(contents.count('(')):
-            pass  # slur start
-    if contents.count(')'):
-        for i in range(contents.count(')')):
-            pass  # slur end
-    if contents.count('['):
-        thisObject.tie = tie.Tie('start')
-    elif contents.count(']'):
-        thisObject.tie = tie.Tie('stop')
-    elif contents.count('_'):
-        thisObject.tie = tie.Tie('continue')
+    # TODO: add music21 phrase information and slurs ({, }, (, and ))
+    tieType = None
+    if '[' in contents:
+        tieType = 'start'
+    elif ']' in contents:
+        tieType = 'stop'
+    elif '_' in contents:
+        tieType = 'continue'
 
     # 3.2.3 Ornaments
-    if contents.count('t'):
-        thisObject.expressions.append(expressions.HalfStepTrill())
-    elif contents.count('T'):
-        thisObject.expressions.append(expressions.WholeStepTrill())
-
-    if contents.count('w'):
-        thisObject.expressions.append(expressions.HalfStepInvertedMordent())
-    elif contents.count('W'):
-        thisObject.expressions.append(expressions.WholeStepInvertedMordent())
-    elif contents.count('m'):
-        thisObject.expressions.append(expressions.HalfStepMordent())
-    elif contents.count('M'):
-        thisObject.expressions.append(expressions.WholeStepMordent())
-
-    if contents.count('S'):
-        thisObject.expressions.append(expressions.Turn())
-    elif contents.count('$'):
-        thisObject.expressions.append(expressions.InvertedTurn())
-    elif contents.count('R'):
-        t1 = expressions.Turn()
-        t1.connectedToPrevious = True  # true by default, but explicitly
-        thisObject.expressions.append(t1)
-
-    if contents.count(':'):
-        # TODO: deal with arpeggiation -- should have been in a
-        #  chord structure
-        pass
-
-    if contents.count('O'):
-        thisObject.expressions.append(expressions.Ornament())
+    expressionList = []
+    if 't' in contents:
+        expressionList.append(expressions.HalfStepTrill)
+    elif 'T' in contents:
+        expressionList.append(expressions.WholeStepTrill)
+
+    if 'w' in contents:
+        expressionList.append(expressions.HalfStepInvertedMordent)
+    elif 'W' in contents:
+        expressionList.append(expressions.WholeStepInvertedMordent)
+    elif 'm' in contents:
+        expressionList.append(expressions.HalfStepMordent)
+    elif 'M' in contents:
+        expressionList.append(expressions.WholeStepMordent)
+
+    if 'S' in contents:
+        expressionList.append(expressions.Turn)
+    elif '$' in contents:
+        expressionList.append(expressions.InvertedTurn)
+    elif 'R' in contents:
+        expressionList.append(_connectedTurn)
+
+    # TODO: deal with arpeggiation (:) -- should have been in a
+    #  chord structure
+
+    if 'O' in contents:
+        expressionList.append(expressions.Ornament)
         # generic ornament
 
     # 3.2.4 Articulation Marks
-    if contents.count('\''):
-        thisObject.articulations.append(articulations.Staccato())
-    if contents.count('"'):
-        thisObject.articulations.append(articulations.Pizzicato())
-    if contents.count('`'):
+    articulationList = []
+    if '\'' in contents:
+        articulationList.append(articulations.Staccato)
+    if '"' in contents:
+        articulationList.append(articulations.Pizzicato)
+    if '`' in contents:
         # called 'attacca' mark but means staccatissimo:
         # http://www.music-cog.ohio-state.edu/Humdrum/representations/kern.rep.html
-        thisObject.articulations.append(articulations.Staccatissimo())
-    if contents.count('~'):
-        thisObject.articulations.append(articulations.Tenuto())
-    if contents.count('^'):
-        thisObject.articulations.append(articulations.Accent())
-    if contents.count(';'):
-        thisObject.expressions.append(expressions.Fermata())
+        articulationList.append(articulations.Staccatissimo)
+    if '~' in contents:
+        articulationList.append(articulations.Tenuto)
+    if '^' in contents:
+        articulationList.append(articulations.Accent)
+    if ';' in contents:
+        expressionList.append(expressions.Fermata)
 
     # 3.2.5 Up & Down Bows
-    if contents.count('v'):
-        thisObject.articulations.append(articulations.UpBow())
-    elif contents.count('u'):
-        thisObject.articulations.append(articulations.DownBow())
+    if 'v' in contents:
+        articulationList.append(articulations.UpBow)
+    elif 'u' in contents:
+        articulationList.append(articulations.DownBow)
 
     # 3.2.6 Stem Directions
-    if contents.count('/'):
-        thisObject.stemDirection = 'up'
-    elif contents.count('\\'):
-        thisObject.stemDirection = 'down'
+    stemDirection = None
+    if '/' in contents:
+        stemDirection = 'up'
+    elif '\\' in contents:
+        stemDirection = 'down'
 
     # 3.2.7 Duration +
     # 3.2.8 N-Tuplets
-
-    # TODO: SPEEDUP -- only search for rational after foundNumber...
-    foundRational = re.search(r'(\d+)%(\d+)', contents)
+    dots = contents.count('.')
+    durationSteps = None
     foundNumber = re.search(r'(\d+)', contents)
+    foundRational = re.search(r'(\d+)%(\d+)', contents) if foundNumber else None
     if foundRational:
         durationFirst = int(foundRational.group(1))
         durationSecond = float(foundRational.group(2))
-        thisObject.duration.quarterLength = 4 * durationSecond / durationFirst
-        if contents.count('.'):
-            thisObject.duration.dots = contents.count('.')
+        durationSteps = ('quarterLength', 4 * durationSecond / durationFirst, dots)
 
     elif foundNumber:
         durationType = int(foundNumber.group(1))
@@ -2329,71 +2485,123 @@ def hdStringToNote(contents):
             durationString = foundNumber.group(1)
             if durationString == '000':
                 # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-                thisObject.duration.type = 'maxima'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationSteps = ('type', 'maxima', dots)
             elif durationString == '00':
                 # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-                thisObject.duration.type = 'longa'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationSteps = ('type', 'longa', dots)
             else:
-                thisObject.duration.type = 'breve'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
+                durationSteps = ('type', 'breve', dots)
         elif durationType in duration.typeFromNumDict:
-            thisObject.duration.type = duration.typeFromNumDict[durationType]
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+            durationSteps = ('type', duration.typeFromNumDict[durationType], dots)
         else:
             dT = int(durationType) + 0.0
             (unused_remainder, exponents) = math.modf(math.log2(dT))
             baseValue = 2 ** exponents
-            thisObject.duration.type = duration.typeFromNumDict[int(baseValue)]
-            newTup = duration.Tuplet()
-            newTup.durationActual = duration.durationTupleFromTypeDots(thisObject.duration.type, 0)
-            newTup.durationNormal = duration.durationTupleFromTypeDots(thisObject.duration.type, 0)
+            durationTypeName = duration.typeFromNumDict[int(baseValue)]
 
             gcd = common.euclidGCD(int(dT), baseValue)
-            newTup.numberNotesActual = int(dT / gcd)
-            newTup.numberNotesNormal = int(float(baseValue) / gcd)
+            numberNotesActual = int(dT / gcd)
+            numberNotesNormal = int(float(baseValue) / gcd)
 
             # The Josquin Research Project uses an incorrect definition of
             # humdrum tuplets that breaks normal usage.  TODO: Refactor adding a Flavor = 'JRP'
             # code that uses this other method...
-            JRP = flavors['JRP']
-            if JRP is False and contents.count('.'):
-                newTup.durationNormal = duration.durationTupleFromTypeDots(
-                    newTup.durationNormal.type, contents.count('.'))
-
-            thisObject.duration.appendTuplet(newTup)
-            if JRP is True and contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+            if JRP is False:
+                durationSteps = ('tuplet', durationTypeName,
+                                 numberNotesActual, numberNotesNormal, dots, 0)
+            else:
+                durationSteps = ('tuplet', durationTypeName,
+                                 numberNotesActual, numberNotesNormal, 0, dots)
             # call Duration.TupletFixer after to correct this.
 
     # 3.2.9 Grace Notes and Groupettos
-    if contents.count('q'):
+    grace = None
+    if 'q' in contents:
+        grace = 'q'
+    elif 'Q' in contents:
+        grace = 'Q'
+    elif 'P' in contents:
+        grace = 'P'
+    # p -- end appoggiatura duration -- not needed in music21...
+
+    # 3.2.10 Beaming
+    # TODO: Support really complex beams
+    beams = ((('start',),) * contents.count('L')
+             + (('stop',),) * contents.count('J')
+             + (('partial', 'right'),) * (contents.count('k') + contents.count('K')))
+
+    return KernTokenRecipe(isRest, step, octave, accidental, tieType,
+                           tuple(expressionList), tuple(articulationList), stemDirection,
+                           durationSteps, grace, beams)
+
+
+def kernRecipeToNote(recipe):
+    '''
+    Make a new :class:`~music21.note.Note`, :class:`~music21.note.Rest`, or
+    grace note from a :class:`~music21.humdrum.spineParser.KernTokenRecipe`.
+
+    >>> recipe = humdrum.spineParser.kernTokenRecipe('4.AA-[')
+    >>> n = humdrum.spineParser.kernRecipeToNote(recipe)
+    >>> n
+    <music21.note.Note A->
+    >>> n.octave, n.duration.quarterLength, n.tie
+    (2, 1.5, <music21.tie.Tie start>)
+    >>> humdrum.spineParser.kernRecipeToNote(recipe) is n
+    False
+    '''
+    if recipe.isRest:
+        thisObject = note.Rest()
+    else:
+        thisObject = note.Note(octave=recipe.octave)
+        thisObject.step = recipe.step
+
+    if recipe.accidental is not None:
+        thisObject.pitch.accidental = recipe.accidental
+    if recipe.tieType is not None:
+        thisObject.tie = tie.Tie(recipe.tieType)
+    for expressionClass in recipe.expressions:
+        thisObject.expressions.append(expressionClass())
+    for articulationClass in recipe.articulations:
+        thisObject.articulations.append(articulationClass())
+    if recipe.stemDirection is not None:
+        thisObject.stemDirection = recipe.stemDirection
+
+    durationSteps = recipe.durationSteps
+    if durationSteps is None:
+        pass
+    elif durationSteps[0] == 'quarterLength':
+        thisObject.duration.quarterLength = durationSteps[1]
+        if durationSteps[2]:
+            thisObject.duration.dots = durationSteps[2]
+    elif durationSteps[0] == 'type':
+        thisObject.duration.type = durationSteps[1]
+        if durationSteps[2]:
+            thisObject.duration.dots = durationSteps[2]
+    else:  # tuplet
+        unused, durationType, numberNotesActual, numberNotesNormal, normalDots, dots = (
+            durationSteps)
+        thisObject.duration.type = durationType
+        newTup = duration.Tuplet()
+        newTup.durationActual = duration.durationTupleFromTypeDots(durationType, 0)
+        newTup.durationNormal = duration.durationTupleFromTypeDots(durationType, normalDots)
+        newTup.numberNotesActual = numberNotesActual
+        newTup.numberNotesNormal = numberNotesNormal
+        thisObject.duration.appendTuplet(newTup)
+        if dots:
+            thisObject.duration.dots = dots
+
+    if recipe.grace == 'q':
         thisObject = thisObject.getGrace()
         thisObject.duration.type = 'eighth'
-    elif contents.count('Q'):
+    elif recipe.grace == 'Q':
         thisObject = thisObject.getGrace()
         thisObject.duration.slash = False
         thisObject.duration.type = 'eighth'
-    elif contents.count('P'):
+    elif recipe.grace == 'P':
         thisObject = thisObject.getGrace(appoggiatura=True)
-    elif contents.count('p'):
-        pass  # end appoggiatura duration -- not needed in music21...
 
-    # 3.2.10 Beaming
-    # TODO: Support really complex beams
-    for i in range(contents.count('L')):
-        thisObject.beams.append('start')
-    for i in range(contents.count('J')):
-        thisObject.beams.append('stop')
-    for i in range(contents.count('k')):
-        thisObject.beams.append('partial', 'right')
-    for i in range(contents.count('K')):
-        thisObject.beams.append('partial', 'right')
+    for beamArguments in recipe.beams:
+        thisObject.beams.append(*beamArguments)
 
     return thisObject
 
@@ -3116,6 +3324,38 @@ class Test(unittest.TestCase):
                          "DurationTuple(type='eighth', dots=0, quarterLength=0.5)")
         self.assertEqual(dn.duration.tuplets[0].durationNormal.dots, 0)
 
+    def testSpinesFromColumnsMatchProtoSpines(self):
+        for testFile in (testFiles.schubert, testFiles.dottedTuplet, testFiles.harmSevenths):
+            hdc = HumdrumDataCollection(testFile)
+            hdc.maxSpines = 0
+            hdc.parseEventListFromDataStream()
+            self.assertFalse(hdc.hasSpinePathChanges())
+            fromColumns = hdc.createHumdrumSpinesFromColumns()
+            hdc.parseProtoSpinesAndEventCollections()
+            fromProtoSpines = hdc.createHumdrumSpines()
+            self.assertEqual(len(fromColumns.spines), len(fromProtoSpines.spines))
+            for colSpine, protoSpine in zip(fromColumns.spines, fromProtoSpines.spines):
+                self.assertEqual([(e.contents, e.position) for e in colSpine.eventList],
+                                 [(e.contents, e.position) for e in protoSpine.eventList])
+                self.assertEqual(colSpine.insertPoint, protoSpine.insertPoint)
+                self.assertEqual(colSpine.endingPosition, protoSpine.endingPosition)
+
+        hdc = HumdrumDataCollection(testFiles.splitLots)
+        hdc.maxSpines = 0
+        hdc.parseEventListFromDataStream()
+        self.assertTrue(hdc.hasSpinePathChanges())
+
+    def testKernTokenCache(self):
+        n1 = hdStringToNote('8.cc#L')
+        n2 = hdStringToNote('8.cc#L')
+        self.assertIsNot(n1, n2)
+        self.assertIsNot(n1.duration, n2.duration)
+        self.assertEqual(n1.nameWithOctave, 'C#5')
+        self.assertEqual(n2.duration.quarterLength, 0.75)
+        self.assertEqual(n2.beams.getTypes(), ['start'])
+        n2.pitch.octave = 3
+        self.assertEqual(hdStringToNote('8.cc#L').pitch.octave, 5)
+
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
 
@@ -721,7 +721,8 @@ class MetadataBundle(prebase.ProtoM21Object):
         parseUsingCorpus=False,
         useMultiprocessing=True,
         storeOnDisk=True,
-        verbose=False
+        verbose=False,
+        melodicIndex=None,
     ):
         '''
         Parse and store metadata from numerous files.
@@ -746,6 +747,11 @@ class MetadataBundle(prebase.ProtoM21Object):
         1
 
         Set Verbose to True to get updates even if debug is off.
+
+        If `melodicIndex` is a :class:`~music21.search.melodicIndex.MelodicIndex`,
+        the melodies of each file are stored in it while the file is parsed for
+        its metadata.  Files already in this bundle are parsed again only if they
+        are not yet in the index.
         '''
         from music21 import metadata
         jobs = []
@@ -769,7 +775,8 @@ class MetadataBundle(prebase.ProtoM21Object):
             key = self.corpusPathToKey(path)
             if key in self._metadataEntries:
                 pathModificationTime = path.stat().st_ctime
-                if pathModificationTime < metadataBundleModificationTime:
+                if (pathModificationTime < metadataBundleModificationTime
+                        and (melodicIndex is None or not melodicIndex.needsIndexing(path))):
                     skippedJobsCount += 1
                     continue
             currentJobNumber += 1
@@ -785,6 +792,7 @@ class MetadataBundle(prebase.ProtoM21Object):
                 jobNumber=currentJobNumber,
                 parseUsingCorpus=parseUsingCorpus,
                 corpusName=corpusName,
+                melodicIndex=melodicIndex is not None,
             )
             jobs.append(job)
         currentIteration = 0
@@ -815,6 +823,8 @@ class MetadataBundle(prebase.ProtoM21Object):
             accumulatedErrors.extend(result['errors'])
             for metadataEntry in result['metadataEntries']:
                 self._metadataEntries[metadataEntry.corpusPath] = metadataEntry
+            if melodicIndex is not None and not result['errors']:
+                melodicIndex.addEncodings(result['filePath'], result['melodicEncodings'])
             if (currentIteration % 50) and (storeOnDisk is True) == 0:
                 self.write()
         self.validate()
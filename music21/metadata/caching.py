@@ -106,21 +106,34 @@ class MetadataCachingJob:
     >>> results = job.getResults()
     >>> errors = job.getErrors()
 
+    If `melodicIndex` is True, the job also encodes the melodies of each score it
+    parses, for a :class:`~music21.search.melodicIndex.MelodicIndex`:
+
+    >>> job = metadata.caching.MetadataCachingJob('bach/bwv66.6', melodicIndex=True)
+    >>> results, errors = job.run()
+    >>> [(number, opusIndex, len(encodings))
+    ...     for number, opusIndex, encodings in job.getMelodicEncodings()]
+    [(None, None, 4)]
+
     TODO: error list, not just numbers needs to be reported back up.
     '''
     # INITIALIZER #
 
-    def __init__(self, filePath, jobNumber=0, parseUsingCorpus=True, corpusName=None):
+    def __init__(self, filePath, jobNumber=0, parseUsingCorpus=True, corpusName=None,
+                 melodicIndex=False):
         self.filePath = pathlib.Path(filePath)
         self.filePathErrors = []
         self.jobNumber = int(jobNumber)
         self.results = []
         self.parseUsingCorpus = bool(parseUsingCorpus)
         self.corpusName = corpusName
+        self.melodicIndex = melodicIndex
+        self.melodicEncodings = []
 
     def run(self):
         import gc
         self.results = []
+        self.melodicEncodings = []
         parsedObject = self.parseFilePath()
         environLocal.printDebug(
             f'Got ParsedObject from {self.filePath}: {parsedObject}')
@@ -129,6 +142,7 @@ class MetadataCachingJob:
                 self.parseOpus(parsedObject)
             else:
                 self.parseNonOpus(parsedObject)
+                self.encodeMelodies(parsedObject, None)
         del parsedObject
         gc.collect()
         return self.getResults(), self.getErrors()
@@ -191,6 +205,11 @@ class MetadataCachingJob:
         try:
             for scoreNumber, score in enumerate(parsedObject.scores):
                 self.parseScoreInsideOpus(score, scoreNumber)
+                if score.metadata is not None and score.metadata.number is not None:
+                    self.encodeMelodies(score, score.metadata.number)
+                else:
+                    # no work number: identify it by its (zero-indexed) place in the opus
+                    self.encodeMelodies(score, None, opusIndex=scoreNumber)
                 del score  # for memory conservation
         except Exception as exception:  # wide catch is fine. pylint: disable=broad-except
             environLocal.warn(
@@ -244,11 +263,31 @@ class MetadataCachingJob:
                     scoreNumber, self.filePath, str(exception)))
             environLocal.printDebug(traceback.format_exc())
 
+    def encodeMelodies(self, score, number, opusIndex=None):
+        '''
+        Store the encoded melodies of `score` (work `number` in an opus,
+        or, if it has no number, the work at the zero-indexed `opusIndex`)
+        if this job is also building a melodic index.
+        '''
+        if not self.melodicIndex:
+            return
+        from music21.search import melodicIndex
+        try:
+            self.melodicEncodings.append(
+                (number, opusIndex, melodicIndex.encodeScore(score)))
+        except Exception:  # wide catch is fine. pylint: disable=broad-except
+            environLocal.warn(
+                f'Had a problem with encoding melodies for {self.filePath}, ignored')
+            environLocal.printDebug(traceback.format_exc())
+
     # PUBLIC METHODS #
 
     def getErrors(self):
         return tuple(self.filePathErrors)
 
+    def getMelodicEncodings(self):
+        return tuple(self.melodicEncodings)
+
     def getResults(self):
         return tuple(self.results)
 
@@ -276,6 +315,7 @@ class JobProcessor:
 
     * MetadataEntry instances
     * failed file paths
+    * encoded melodies (if the jobs were asked for them)
     * the last processed file path
     * the number of remaining jobs
 
@@ -354,6 +394,7 @@ class JobProcessor:
                 yield {
                     'metadataEntries': results,
                     'errors': errors,
+                    'melodicEncodings': job.getMelodicEncodings(),
                     'filePath': job.filePath,
                     'remainingJobs': remainingJobs,
                 }
@@ -379,6 +420,7 @@ class JobProcessor:
             yield {
                 'metadataEntries': results,
                 'errors': errors,
+                'melodicEncodings': job.getMelodicEncodings(),
                 'filePath': job.filePath,
                 'remainingJobs': remainingJobs,
             }
@@ -420,7 +462,24 @@ class WorkerProcess(multiprocessing.Process):  # @UndefinedVariable pylint: disa
 
 
 class Test(unittest.TestCase):
-    pass
+
+    def testOpusScoresWithoutNumbers(self):
+        from music21 import converter
+        from music21 import metadata
+        from music21 import stream
+
+        o = stream.Opus()
+        for i, tinyNotation in enumerate(['c4 d e f g1', 'g4 f e d c1', 'e4 e e e c1']):
+            sc = stream.Score()
+            sc.insert(0, converter.parse('tinyNotation: 4/4 ' + tinyNotation))
+            if i == 1:
+                sc.insert(0, metadata.Metadata(number='7'))
+            o.append(sc)
+        job = MetadataCachingJob('opus.xml', melodicIndex=True)
+        job.parseOpus(o)
+        self.assertEqual([(number, opusIndex)
+                          for number, opusIndex, unused in job.getMelodicEncodings()],
+                         [(None, 0), ('7', None), (None, 2)])
 
 
 # -----------------------------------------------------------------------------
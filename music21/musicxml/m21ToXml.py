@@ -19,6 +19,7 @@ import fractions
 import io
 import math
 import unittest
+import zipfile
 import xml.etree.ElementTree as ET
 from xml.etree.ElementTree import Element, SubElement, ElementTree
 from typing import List, Optional, Union
@@ -385,6 +386,30 @@ class GeneralObjectExporter:
         scoreExporter.parse()
         return scoreExporter.asBytes()
 
+    def write(self, fileObj, obj=None, *, pretty=True, compress=False, xmlName='score.xml'):
+        '''
+        Like :meth:`parse`, but writes the MusicXML to `fileObj`, a file-like object
+        opened for writing bytes, a measure at a time, with
+        :meth:`ScoreExporter.writeXml`.  Set `pretty` to False to skip indenting.
+        Set `compress` to True to write a compressed .mxl archive instead, in which the
+        MusicXML file is called `xmlName` (see :meth:`ScoreExporter.writeMxl`).
+
+        >>> import io
+        >>> n = note.Note('D#4')
+        >>> fileObj = io.BytesIO()
+        >>> GEX = musicxml.m21ToXml.GeneralObjectExporter(n)
+        >>> GEX.write(fileObj, pretty=False)
+        >>> b'<step>D</step><alter>1</alter><octave>4</octave>' in fileObj.getvalue()
+        True
+        '''
+        if obj is None:
+            obj = self.generalObj
+        scoreExporter = ScoreExporter(self.fromGeneralObject(obj))
+        if compress:
+            scoreExporter.writeMxl(fileObj, pretty=pretty, xmlName=xmlName)
+        else:
+            scoreExporter.writeXml(fileObj, pretty=pretty)
+
     def fromGeneralObject(self, obj):
         '''
         Converts any Music21Object (or a duration or a pitch) to something that
@@ -420,11 +445,74 @@ class GeneralObjectExporter:
     def fromScore(self, sc):
         '''
         the best one of all -- a perfectly made Score (or something like that)
+
+        Returns a copy of the Score with makeNotation run on it, or, if
+        :meth:`isWellformedForExport` finds that makeNotation has nothing to do,
+        just a copy.  Exporting changes the Score it is given (filling in instrument
+        ids and displaying accidentals, for instance), so it is never the original.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> GEX = musicxml.m21ToXml.GeneralObjectExporter()
+        >>> bOut = GEX.fromScore(b)
+        >>> bOut is b
+        False
+        >>> bOut.derivation.origin is b
+        True
         '''
+        if self.isWellformedForExport(sc):
+            return sc.coreCopyAsDerivation('makeNotation')
         scOut = sc.makeNotation(inPlace=False)
         # scOut.makeImmutable()
         return scOut
 
+    @staticmethod
+    def isWellformedForExport(sc) -> bool:
+        '''
+        Returns True if makeNotation would not change `sc`: all of its steps
+        are already done (see
+        :meth:`~music21.stream.streamStatus.StreamStatus.notationStatus`) and
+        the export needs nothing else fixed up before it starts.
+        That is, it is a Score of parts with measures, all of the same length and all
+        starting at the start of the score, without clefs, keys, or meters outside of
+        their measures, and it contains all of its spanners.
+
+        This is usually true of a score just parsed from MusicXML.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> musicxml.m21ToXml.GeneralObjectExporter.isWellformedForExport(b)
+        True
+        >>> b.parts[0].getElementsByClass('Measure')[1].notes[0].quarterLength = 8
+        >>> musicxml.m21ToXml.GeneralObjectExporter.isWellformedForExport(b)
+        False
+
+        >>> s = stream.Score()
+        >>> s.insert(0, converter.parse('tinyNotation: 4/4 c4 d e f'))
+        >>> s.insert(0, converter.parse('tinyNotation: 4/4 c4 d e f g1'))
+        >>> musicxml.m21ToXml.GeneralObjectExporter.isWellformedForExport(s)
+        False
+        '''
+        if not isinstance(sc, stream.Score) or not sc.isWellFormedNotation():
+            return False
+        if not all(sc.streamStatus.notationStatus().values()):
+            return False
+
+        # ScoreExporter.parsePartlikeScore calls makeRests() on each part.
+        highestTime = None
+        for p in sc.getElementsByClass('Stream'):
+            if sc.elementOffset(p) != 0 or p.lowestOffset != 0:
+                return False
+            if highestTime is None:
+                highestTime = p.highestTime
+            elif p.highestTime != highestTime:
+                return False
+            # PartExporter.fixupNotationMeasured moves these into the first measure.
+            if p.getElementsByClass(('Clef', 'KeySignature', 'TimeSignature')).first():
+                return False
+
+        if sc.coreGatherMissingSpanners(insert=False):
+            return False
+        return True
+
     def fromPart(self, p):
         '''
         from a part, put it in a score...
@@ -723,6 +811,17 @@ class XMLExporterBase:
           <accidental />
           </score-partwise>
         '''
+        self.xmlRoot.append(self.dividerComment(comment))
+
+    @staticmethod
+    def dividerComment(comment: str = ''):
+        '''
+        Returns the divider comment that :meth:`addDividerComment` adds.
+
+        >>> divider = musicxml.m21ToXml.XMLExporterBase.dividerComment('Part 1')
+        >>> divider.text
+        '=========================== Part 1 ==========================='
+        '''
         commentLength = len(comment)
         if commentLength > 60:
             commentLength = 60
@@ -731,8 +830,7 @@ class XMLExporterBase:
 
         commentText = ('=' * spacerLengthLow) + ' ' + comment + ' ' + ('=' * spacerLengthHigh)
 
-        divider = ET.Comment(commentText)
-        self.xmlRoot.append(divider)
+        return ET.Comment(commentText)
 
     # ------------------------------------------------------------------------------
     @staticmethod
@@ -1352,12 +1450,18 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
         self.refStreamOrTimeRange = [0.0, self.highestTime]
 
         self.partExporterList: List['PartExporter'] = []
+        # StaffGroups of PartStaffs joined into one <part>; see joinPartStaffs()
+        self.joinedStaffGroups = []
 
         self.instrumentList = []
         self.midiChannelList = []
 
         self.parts = []
 
+        # if True, parsePartlikeScore() exports the parts in several processes;
+        # see parsePartsInParallel()
+        self.parallelParts = False
+
     def parse(self):
         '''
         the main function to call.
@@ -1553,6 +1657,10 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
         for innerStream in sp:
             innerStream.makeRests(self.refStreamOrTimeRange, inPlace=True)
 
+        if self.parallelParts and len(sp) > 1 and common.cpus() > 1:
+            self.parsePartsInParallel()
+            return
+
         count = 0
         for innerStream in sp:
             count += 1
@@ -1564,6 +1672,77 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
             pp.parse()
             self.partExporterList.append(pp)
 
+    def parsePartsInParallel(self):
+        '''
+        Export the parts of the score in several processes, and append a PartExporter
+        for each part, in order, to self.partExporterList.  The result is the same as
+        exporting the parts one after another.
+
+        Part ids and MIDI channels depend on the parts before, so instruments are set
+        up here first, in order.  Then the score is frozen (see
+        :mod:`~music21.freezeThaw`) and each process thaws a copy of it and exports its
+        share of the parts.  Parts without measures are exported in this process,
+        since the measures made for them are needed when joining PartStaffs.
+
+        Called by :meth:`parsePartlikeScore` if `.parallelParts` is True and there is
+        more than one CPU to use.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.parallelParts = True
+        >>> mxScore = SX.parse()
+        >>> len(mxScore.findall('part'))
+        4
+
+        Called directly, the parts are exported from a frozen copy of the score even
+        if there is only one CPU:
+
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.scorePreliminaries()
+        >>> SX.parsePartsInParallel()
+        >>> len(SX.partExporterList)
+        4
+        >>> [len(pex.xmlRoot.findall('measure')) for pex in SX.partExporterList]
+        [10, 10, 10, 10]
+        >>> del SX.partExporterList[:]  # for garbage collection
+        '''
+        import functools
+        from music21 import freezeThaw
+
+        partExporters = []
+        processIndices = []
+        for i, innerStream in enumerate(self.parts):
+            pp = PartExporter(innerStream, parent=self)
+            pp.spannerBundle = self.spannerBundle
+            pp.instrumentSetup()
+            pp.xmlRoot.set('id', str(pp.firstInstrumentObject.partId))
+            partExporters.append(pp)
+            if innerStream.getElementsByClass('Stream').first() is not None:
+                processIndices.append(i)
+
+        if processIndices:
+            frozenScore = freezeThaw.StreamFreezer(self.stream).writeStr(fmt='pickle')
+            numProcesses = min(common.cpus(), len(processIndices))
+            jobs = []
+            for j in range(numProcesses):
+                jobIndices = processIndices[j::numProcesses]
+                jobs.append((jobIndices,
+                             [partExporters[i].xmlRoot.get('id') for i in jobIndices]))
+            # the frozen score is unpickled once per process rather than once per part
+            results = common.runParallel(
+                jobs,
+                functools.partial(_parseFrozenParts, frozenScore),
+                unpackIterable=True,
+            )
+            for (jobIndices, unused_ids), mxParts in zip(jobs, results):
+                for i, mxPart in zip(jobIndices, mxParts):
+                    partExporters[i].xmlRoot = mxPart
+
+        for i, pp in enumerate(partExporters):
+            if i not in processIndices:
+                pp.parseMeasures()
+            self.partExporterList.append(pp)
+
     def parseFlatScore(self):
         '''
         creates a single PartExporter for this Stream and parses it.
@@ -1606,6 +1785,175 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
             self.addDividerComment('Part ' + str(i + 1))
             self.xmlRoot.append(pex.xmlRoot)
 
+    def writeXml(self, fileObj, *, pretty=True) -> None:
+        r'''
+        Export the score as MusicXML to `fileObj`, a file-like object opened for writing
+        bytes.  Each <measure> is written out as soon as its MeasureExporter has finished
+        and is then dropped, so unlike calling :meth:`parse` and then
+        :meth:`~music21.musicxml.m21ToXml.XMLExporterBase.asBytes`, the
+        <score-partwise> tree for the whole score is never held in memory.
+
+        PartStaffs that are joined into a single <part> are the exception: joining them
+        needs all of their measures, so they are exported before anything is written.
+
+        With `pretty=True` (default) the output is the same as that of `.asBytes()`.
+        With `pretty=False` elements are written without indentation and their attributes
+        are not sorted, which is faster.
+
+        >>> import io
+        >>> b = corpus.parse('bwv66.6')
+        >>> fileObj = io.BytesIO()
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.writeXml(fileObj)
+        >>> print(fileObj.getvalue().decode('utf-8'))
+        <?xml version="1.0" encoding="utf-8"?>
+        <!DOCTYPE score-partwise
+          PUBLIC "-//Recordare//DTD MusicXML ... Partwise//EN"
+          "http://www.musicxml.org/dtds/partwise.dtd">
+        <score-partwise version="...">
+          <work>
+            <work-title>bwv66.6.mxl</work-title>
+          </work>
+          ...
+          <!--=========================== Part 1 ===========================-->
+          <part id="P1">
+            <!--========================= Measure 0 ==========================-->
+            <measure number="0">
+          ...
+        </score-partwise>
+
+        >>> fileObj = io.BytesIO()
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.writeXml(fileObj, pretty=False)
+        >>> fileObj.getvalue().count(b'\n')
+        2
+        >>> b'<part id="P1"><!--========================= Measure 0' in fileObj.getvalue()
+        True
+        '''
+        s = self.stream
+        if not s:
+            self.emptyObject()
+            self.writeXmlTree(fileObj, pretty=pretty)
+            return
+
+        self.scorePreliminaries()
+
+        joinableGroups = []
+        if s.hasPartLikeStreams():
+            joinableGroups = self.joinableGroups()
+            sp = list(self.parts)
+            for innerStream in sp:
+                innerStream.makeRests(self.refStreamOrTimeRange, inPlace=True)
+            for innerStream in sp:
+                pp = PartExporter(innerStream, parent=self)
+                pp.spannerBundle = self.spannerBundle
+                self.partExporterList.append(pp)
+        else:
+            self.partExporterList.append(PartExporter(s, parent=self))
+
+        for pp in self.partExporterList:
+            pp.instrumentSetup()
+            pp.xmlRoot.set('id', str(pp.firstInstrumentObject.partId))
+
+        if joinableGroups:
+            joinedStreams = {id(ps) for group in joinableGroups for ps in group}
+            for pp in self.partExporterList:
+                if id(pp.stream) in joinedStreams:
+                    pp.parseMeasures()
+            self.joinPartStaffs()
+        else:
+            joinedStreams = set()
+
+        self.setScoreHeader()
+
+        fileObj.write(self.xmlHeader())
+        fileObj.write(_xmlStartTag(self.xmlRoot))
+        for mxElement in self.xmlRoot:
+            _writeXmlElement(fileObj, mxElement, 1, pretty)
+        self.xmlRoot.clear()  # the score header has been written.
+
+        for i, pex in enumerate(self.partExporterList):
+            _writeXmlElement(fileObj, self.dividerComment('Part ' + str(i + 1)), 1, pretty)
+            if id(pex.stream) in joinedStreams:
+                _writeXmlElement(fileObj, pex.xmlRoot, 1, pretty)
+            else:
+                if pretty:
+                    fileObj.write(b'\n  ')
+                fileObj.write(_xmlStartTag(pex.xmlRoot))
+                for mxElement in pex.iterMeasureElements():
+                    _writeXmlElement(fileObj, mxElement, 2, pretty)
+                if pretty:
+                    fileObj.write(b'\n  ')
+                fileObj.write(b'</part>')
+            pex.xmlRoot = None  # for garbage collection
+
+        if pretty:
+            fileObj.write(b'\n')
+        fileObj.write(b'</score-partwise>')
+
+        # clean up for circular references.
+        self.partExporterList.clear()
+
+    def writeXmlTree(self, fileObj, *, pretty=True) -> None:
+        '''
+        Write a <score-partwise> tree that has already been made by :meth:`parse` to
+        `fileObj`, in the same way as :meth:`writeXml`.
+
+        >>> import io
+        >>> emptySX = musicxml.m21ToXml.ScoreExporter()
+        >>> mxScore = emptySX.parse()
+        >>> fileObj = io.BytesIO()
+        >>> emptySX.writeXmlTree(fileObj)
+        >>> fileObj.getvalue() == emptySX.asBytes()
+        True
+        '''
+        fileObj.write(self.xmlHeader())
+        fileObj.write(_xmlStartTag(self.xmlRoot))
+        for mxElement in self.xmlRoot:
+            _writeXmlElement(fileObj, mxElement, 1, pretty)
+        if pretty:
+            fileObj.write(b'\n')
+        fileObj.write(b'</score-partwise>')
+
+    def writeMxl(self, fileObj, *, pretty=True, xmlName='score.xml') -> None:
+        '''
+        Export the score as compressed MusicXML (.mxl) to `fileObj`, a file-like object
+        opened for writing bytes, or a path.  The MusicXML is compressed into the zip
+        archive by :meth:`writeXml` as it is made, so neither the uncompressed file nor
+        the whole <score-partwise> tree is ever made.  `xmlName` is the name of the
+        MusicXML file inside the archive.
+
+        >>> import io
+        >>> import zipfile
+        >>> b = corpus.parse('bwv66.6')
+        >>> fileObj = io.BytesIO()
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.writeMxl(fileObj)
+        >>> mxl = zipfile.ZipFile(fileObj)
+        >>> mxl.namelist()
+        ['META-INF/container.xml', 'score.xml']
+        >>> print(mxl.read('META-INF/container.xml').decode('utf-8'))
+        <?xml version="1.0" encoding="UTF-8"?>
+        <container>
+          <rootfiles>
+            <rootfile full-path="score.xml"/>
+          </rootfiles>
+        </container>
+        >>> b2 = converter.parse(mxl.read('score.xml'), format='musicxml')
+        >>> len(b2.parts), len(b2.flat.notes) == len(b.flat.notes)
+        (4, True)
+        '''
+        container = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                     + '<container>\n'
+                     + '  <rootfiles>\n'
+                     + f'    <rootfile full-path="{xmlName}"/>\n'
+                     + '  </rootfiles>\n'
+                     + '</container>\n')
+        with zipfile.ZipFile(fileObj, 'w', compression=zipfile.ZIP_DEFLATED) as mxlFile:
+            mxlFile.writestr('META-INF/container.xml', container)
+            with mxlFile.open(xmlName, 'w') as xmlFile:
+                self.writeXml(xmlFile, pretty=pretty)
+
     def setScoreHeader(self):
         '''
         Sets the group score-header in <score-partwise>.  Note that score-header is not
@@ -1944,6 +2292,8 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
         # first, find which parts are start/end of partGroups
         partGroupIndexRef = {}  # have id be key
         partGroupIndex = 1  # start by 1 by convention
+        # the <part> of a joined StaffGroup is both its first and its last part
+        joinedGroupIds = {id(sg) for sg in self.joinedStaffGroups}
         for pex in self.partExporterList:
             p = pex.stream
             # check for first
@@ -1961,7 +2311,7 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
             # check for last
             activeIndex = None
             for sg in staffGroups:
-                if sg.isLast(p):
+                if sg.isLast(p) or (id(sg) in joinedGroupIds and sg.isFirst(p)):
                     # find the spanner in the dictionary already-assigned
                     for key, value in partGroupIndexRef.items():
                         if value is sg:
@@ -2312,6 +2662,33 @@ class ScoreExporter(XMLExporterBase, PartStaffExporterMixin):
 # ------------------------------------------------------------------------------
 
 
+def _parseFrozenParts(frozenScore: bytes, partIndices: List[int], partIds: List[str]):
+    '''
+    Thaw a score frozen by :meth:`ScoreExporter.parsePartsInParallel` and return
+    a list of the <part> elements of its parts at `partIndices`, which get the ids `partIds`.
+
+    Instruments have already been set up before freezing, so this is all the rest of
+    :meth:`PartExporter.parse`.
+    '''
+    from music21 import freezeThaw
+
+    thawer = freezeThaw.StreamThawer()
+    thawer.openStr(frozenScore)
+    score = thawer.stream
+    parts = list(score.getElementsByClass('Stream'))
+    spannerBundle = score.spannerBundle
+
+    mxParts = []
+    for partIndex, partId in zip(partIndices, partIds):
+        pp = PartExporter(parts[partIndex])
+        pp.spannerBundle = spannerBundle
+        pp.instrumentStream = pp.stream.getInstruments(returnDefault=True, recurse=True)
+        pp.firstInstrumentObject = pp.instrumentStream[0]
+        pp.xmlRoot.set('id', partId)
+        mxParts.append(pp.parseMeasures())
+    return mxParts
+
+
 class PartExporter(XMLExporterBase):
     '''
     Object to convert one Part stream to a <part> tag on .parse()
@@ -2358,6 +2735,46 @@ class PartExporter(XMLExporterBase):
         self.instrumentSetup()
 
         self.xmlRoot.set('id', str(self.firstInstrumentObject.partId))
+        return self.parseMeasures()
+
+    def parseMeasures(self):
+        '''
+        Everything that :meth:`parse` does after the instruments have been set up:
+        fixes up the notation, sets idLocals on the spanner bundle, and appends the
+        output of each measure's MeasureExporter to the <part> object.
+
+        >>> p = converter.parse('tinyNotation: 4/4 c1 d1')
+        >>> PEX = musicxml.m21ToXml.PartExporter(p)
+        >>> PEX.instrumentSetup()
+        >>> mxPart = PEX.parseMeasures()
+        >>> len(mxPart.findall('measure'))
+        2
+        '''
+        for mxElement in self.iterMeasureElements():
+            self.xmlRoot.append(mxElement)
+        return self.xmlRoot
+
+    def iterMeasureElements(self):
+        '''
+        A generator that does the work of :meth:`parseMeasures` without appending
+        anything to the <part> object: yields a divider comment and then the <measure>
+        for each measure, each one as soon as its MeasureExporter has finished.
+
+        Used by :meth:`ScoreExporter.writeXml` to write out measures one at a time.
+
+        >>> p = converter.parse('tinyNotation: 4/4 c1 d1')
+        >>> PEX = musicxml.m21ToXml.PartExporter(p)
+        >>> PEX.instrumentSetup()
+        >>> from xml.etree.ElementTree import Comment
+        >>> for mxElement in PEX.iterMeasureElements():
+        ...     print(mxElement.tag is Comment, mxElement.get('number'))
+        True None
+        False 1
+        True None
+        False 2
+        >>> len(PEX.xmlRoot)
+        0
+        '''
         # Suppose that everything below this is a measure
         measureStream = self.stream.getElementsByClass('Stream').stream()
         if not measureStream:
@@ -2369,7 +2786,7 @@ class PartExporter(XMLExporterBase):
         # make sure that all instances of the same class have unique ids
         self.spannerBundle.setIdLocals()
         for m in measureStream:
-            self.addDividerComment('Measure ' + str(m.number))
+            yield self.dividerComment('Measure ' + str(m.number))
             measureExporter = MeasureExporter(m, parent=self)
             measureExporter.spannerBundle = self.spannerBundle
             try:
@@ -2378,9 +2795,7 @@ class PartExporter(XMLExporterBase):
                 e.measureNumber = str(m.number)
                 e.partName = self.stream.partName
                 raise e
-            self.xmlRoot.append(mxMeasure)
-
-        return self.xmlRoot
+            yield mxMeasure
 
     def instrumentSetup(self):
         '''
@@ -2503,14 +2918,15 @@ class PartExporter(XMLExporterBase):
             if outerTimeSignatures:
                 measureStream[0].timeSignature = outerTimeSignatures[0]
         # see if accidentals/beams can be processed
-        if not measureStream.streamStatus.haveAccidentalsBeenMade():
+        notationStatus = part.streamStatus.notationStatus()
+        if not notationStatus['accidentals']:
             measureStream.makeAccidentals(inPlace=True)
-        if not measureStream.streamStatus.beams:
+        if not notationStatus['beams']:
             try:
                 measureStream.makeBeams(inPlace=True)
             except exceptions21.StreamException:
                 pass
-        if measureStream.streamStatus.haveTupletBracketsBeenMade() is False:
+        if not notationStatus['tupletBrackets']:
             stream.makeNotation.makeTupletBrackets(measureStream, inPlace=True)
 
         if not self.spannerBundle:
@@ -6156,6 +6572,49 @@ class MeasureExporter(XMLExporterBase):
         return None
 
 
+# ------------------------------------------------------------------------------
+def _xmlStartTag(mxElement: Element) -> bytes:
+    '''
+    Returns the start tag of `mxElement`, with attributes as they are written by
+    :func:`~music21.musicxml.helpers.dumpString`.
+
+    >>> from music21.musicxml.m21ToXml import Element, _xmlStartTag
+    >>> _xmlStartTag(Element('part', id='P1'))
+    b'<part id="P1">'
+    '''
+    emptyElement = Element(mxElement.tag, dict(sorted(mxElement.attrib.items())))
+    return ET.tostring(emptyElement, encoding='utf-8')[:-3] + b'>'
+
+
+def _writeXmlElement(fileObj, mxElement: Element, level: int, pretty: bool) -> None:
+    '''
+    Write `mxElement`, a child of an element at `level - 1`, to `fileObj` for
+    :meth:`ScoreExporter.writeXml`.  If `pretty` is True, it is indented and its
+    attributes are sorted as :func:`~music21.musicxml.helpers.dumpString` would do
+    for the whole score.
+
+    >>> import io
+    >>> from music21.musicxml.m21ToXml import Element, SubElement, _writeXmlElement
+    >>> fileObj = io.BytesIO()
+    >>> mxMeasure = Element('measure', number='1', implicit='yes')
+    >>> mxNote = SubElement(mxMeasure, 'note')
+    >>> _writeXmlElement(fileObj, mxMeasure, 1, True)
+    >>> fileObj.getvalue()
+    b'\\n  <measure implicit="yes" number="1">\\n    <note />\\n  </measure>'
+    '''
+    if pretty:
+        helpers.indent(mxElement, level)
+        for el in mxElement.iter():
+            attrib = el.attrib
+            if len(attrib) > 1:
+                attribs = sorted(attrib.items())
+                attrib.clear()
+                attrib.update(attribs)
+        fileObj.write(b'\n' + b'  ' * level)
+    mxElement.tail = None
+    fileObj.write(ET.tostring(mxElement, encoding='utf-8'))
+
+
 # ------------------------------------------------------------------------------
 def indent(elem, level=0):
     i = '\n' + level * '  '
@@ -6446,6 +6905,121 @@ class Test(unittest.TestCase):
         for direction in tree.findall('.//direction'):
             self.assertIsNone(direction.find('offset'))
 
+    def testParallelParts(self):
+        from music21 import corpus
+
+        for s in (corpus.parse('bwv66.6'), corpus.parse('schoenberg/opus19', 2)):
+            # otherwise random ids are made for each export
+            for i, inst in enumerate(s.recurse().getElementsByClass('Instrument')):
+                inst.instrumentId = f'I{i}'
+            SX = ScoreExporter(copy.deepcopy(s))
+            SX.parse()
+            serialXml = SX.asBytes()
+
+            SX = ScoreExporter(copy.deepcopy(s))
+            SX.scorePreliminaries()
+            for p in SX.parts:
+                p.makeRests(SX.refStreamOrTimeRange, inPlace=True)
+            SX.parsePartsInParallel()
+            SX.postPartProcess()
+            self.assertEqual(SX.asBytes(), serialXml)
+
+    def testWriteXml(self):
+        from music21 import converter
+        from music21 import corpus
+        from music21.musicxml import testPrimitive
+
+        for s in (corpus.parse('bwv66.6'), converter.parse(testPrimitive.pianoStaff43a)):
+            sc = GeneralObjectExporter().fromGeneralObject(s)
+            for i, inst in enumerate(sc.recurse().getElementsByClass('Instrument')):
+                inst.instrumentId = f'I{i}'
+                inst.partId = f'P{i}'
+            SX = ScoreExporter(copy.deepcopy(sc))
+            SX.parse()
+            treeXml = SX.asBytes()
+
+            fileObj = io.BytesIO()
+            ScoreExporter(copy.deepcopy(sc)).writeXml(fileObj)
+            self.assertEqual(fileObj.getvalue(), treeXml)
+
+            # without indentation, the same tree is written
+            fileObj = io.BytesIO()
+            ScoreExporter(copy.deepcopy(sc)).writeXml(fileObj, pretty=False)
+            # (the default parser drops the comments of both)
+            self.assertEqual(helpers.dumpString(ET.fromstring(fileObj.getvalue())),
+                             helpers.dumpString(ET.fromstring(treeXml)))
+
+            fileObj = io.BytesIO()
+            ScoreExporter(copy.deepcopy(sc)).writeMxl(fileObj)
+            with zipfile.ZipFile(fileObj) as mxlFile:
+                self.assertEqual(mxlFile.read('score.xml'), treeXml)
+
+    def testExportWithoutCopy(self):
+        from music21 import converter
+        from music21 import corpus
+        from music21.musicxml import testPrimitive
+
+        for s in (corpus.parse('bwv66.6'), converter.parse(testPrimitive.pianoStaff43a)):
+            for i, inst in enumerate(s.recurse().getElementsByClass('Instrument')):
+                inst.instrumentId = f'I{i}'
+                inst.partId = f'P{i}'
+            self.assertTrue(GeneralObjectExporter.isWellformedForExport(s))
+            staffGroups = [list(sg) for sg in s.getElementsByClass('StaffGroup')]
+
+            SX = ScoreExporter(s.makeNotation(inPlace=False))
+            SX.parse()
+            copiedXml = SX.asBytes()
+
+            self.assertIsNot(GeneralObjectExporter().fromGeneralObject(s), s)
+            self.assertEqual(GeneralObjectExporter().parse(s), copiedXml)
+            # exporting again gives the same result
+            self.assertEqual(GeneralObjectExporter().parse(s), copiedXml)
+            self.assertEqual([list(sg) for sg in s.getElementsByClass('StaffGroup')],
+                             staffGroups)
+
+    def testExportDoesNotChangeScore(self):
+        from music21 import converter
+        from music21 import corpus
+
+        s = corpus.parse('bwv66.6')
+        for inst in s.recurse().getElementsByClass('Instrument'):
+            inst.instrumentId = None
+        GeneralObjectExporter().parse(s)
+        self.assertEqual([inst.instrumentId
+                          for inst in s.recurse().getElementsByClass('Instrument')],
+                         [None] * 4)
+
+        # a note edited after the first export is exported as edited
+        n = s.parts[0].getElementsByClass('Measure')[1].notes[0]
+        n.pitch = pitch.Pitch('B-4')
+        tree = ET.fromstring(GeneralObjectExporter().parse(s))
+        firstNote = tree.find('part/measure[@number="1"]/note')
+        self.assertEqual(firstNote.find('pitch/step').text, 'B')
+        self.assertEqual(firstNote.find('pitch/alter').text, '-1')
+        self.assertEqual(firstNote.find('accidental').text, 'flat')
+        self.assertIsNone(n.pitch.accidental.displayStatus)
+
+        n.quarterLength = 8
+        self.assertFalse(s.streamStatus.notationStatus()['ties'])
+        self.assertFalse(GeneralObjectExporter.isWellformedForExport(s))
+        tree = ET.fromstring(GeneralObjectExporter().parse(s))
+        firstNote = tree.find('part/measure[@number="1"]/note')
+        self.assertEqual(firstNote.find('tie').get('type'), 'start')
+        self.assertEqual(n.quarterLength, 8)
+
+        # notation status is not kept from the first export
+        s = stream.Score()
+        s.insert(0, converter.parse('tinyNotation: 4/4 c4 d e f g1').makeNotation())
+        self.assertTrue(GeneralObjectExporter.isWellformedForExport(s))
+        GeneralObjectExporter().parse(s)
+        n = s.recurse().notes.first()
+        n.pitch = pitch.Pitch('F#4')
+        self.assertFalse(s.streamStatus.notationStatus()['accidentals'])
+        self.assertFalse(GeneralObjectExporter.isWellformedForExport(s))
+        tree = ET.fromstring(GeneralObjectExporter().parse(s))
+        self.assertEqual(tree.find('part/measure/note/accidental').text, 'sharp')
+        self.assertIsNone(n.pitch.accidental.displayStatus)
+
 
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
@@ -275,12 +275,11 @@ class PartStaffExporterMixin:
           </note>
         </measure>
 
-        Fails if attempted a second time:
+        The StaffGroup is left unchanged, so the same score can be exported again:
 
-        >>> root = SX.parse()
-        Traceback (most recent call last):
-        music21.musicxml.xmlObjects.MusicXMLExportException:
-            In part (MusicXML Part), measure (1): Attempted to create a second <staff> tag
+        >>> root = musicxml.m21ToXml.ScoreExporter(s).parse()
+        >>> len(root.findall('part/measure/note/staff'))
+        2
         '''
         initialPartStaffRoot: Optional[Element] = None
         for i, ps in enumerate(group):
@@ -583,9 +582,10 @@ class PartStaffExporterMixin:
         by a single :class:`PartExporter`, remove the obsolete `PartExporter`s from
         `self.partExporterList` so that they are not included in the export.
 
-        In addition, remove any obsolete `PartStaff` from the `StaffGroup`
-        (in the deepcopied stream used for exporting) to ensure <part-group type="stop" />
-        is written.
+        In addition, add the `StaffGroup` to `self.joinedStaffGroups`, so that
+        <part-group type="stop" /> is written after its first `PartStaff`.  (The
+        `StaffGroup` itself is left alone, since the stream being exported may not
+        be a copy.)
 
         Called by :meth:`~music21.musicxml.partStaffExporter.PartStaffExporterMixin.joinPartStaffs`
 
@@ -609,8 +609,7 @@ class PartStaffExporterMixin:
             # noinspection PyAttributeOutsideInit
             self.partExporterList = [pex for pex in self.partExporterList
                                         if pex.xmlRoot != partStaffRoot]
-            # Replace PartStaff in StaffGroup -- ensures <part-group number="1" type="stop" />
-            group.replaceSpannedElement(ps, group.getFirst())
+        self.joinedStaffGroups.append(group)
 
     @staticmethod
     def moveMeasureContents(measure: Element, otherMeasure: Element, staffNumber: int):
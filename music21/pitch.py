@@ -4554,6 +4554,7 @@ class Pitch(prebase.ProtoM21Object):
         overrideStatus: bool = False,
         cautionaryNotImmediateRepeat: bool = True,
         lastNoteWasTied: bool = False,
+        pitchPastTable: Optional['PitchPastTable'] = None,
     ):
         '''
         Given an ordered list of Pitch objects in `pitchPast`, determine if
@@ -4591,6 +4592,10 @@ class Pitch(prebase.ProtoM21Object):
         If `lastNoteWasTied` is True then this note will be treated as
         immediately following a tie.
 
+        If a :class:`~music21.pitch.PitchPastTable` is given as `pitchPastTable`,
+        it is used instead of `pitchPast` and `pitchPastMeasure`. This is much
+        faster when the pitches of a long measure or stream are processed in turn.
+
         >>> a = pitch.Pitch('a')
         >>> past = [pitch.Pitch('a#'), pitch.Pitch('c#'), pitch.Pitch('c')]
         >>> a.updateAccidentalDisplay(past, cautionaryAll=True)
@@ -4616,10 +4621,10 @@ class Pitch(prebase.ProtoM21Object):
         # N.B. -- this is a very complex method
         # do not alter it without significant testing.
 
-        if pitchPast is None:
-            pitchPast = []
-        if pitchPastMeasure is None:
-            pitchPastMeasure = []
+        if pitchPastTable is None:
+            pitchPastTable = PitchPastTable(pitchPastMeasure)
+            if pitchPast is not None:
+                pitchPastTable.extend(pitchPast)
         if alteredPitches is None:
             alteredPitches = []
 
@@ -4631,8 +4636,6 @@ class Pitch(prebase.ProtoM21Object):
         # i.e. if it's the first instance of an accidental after a tie
         displayAccidentalIfNoPreviousAccidentals = False
 
-        pitchPastAll = pitchPastMeasure + pitchPast
-
         if overrideStatus is False:  # go with what we have defined
             if self.accidental is None:
                 pass  # no accidental defined; we may need to add one
@@ -4653,7 +4656,7 @@ class Pitch(prebase.ProtoM21Object):
                 return  # exit: nothing more to do
 
         # no pitches in past...
-        if not pitchPastAll:
+        if not pitchPastTable:
             # if we have no past, we always need to show the accidental,
             # unless this accidental is in the alteredPitches list
             if (self.accidental is not None
@@ -4681,16 +4684,13 @@ class Pitch(prebase.ProtoM21Object):
         # pitches in past... first search if last pitch in measure
         # at this octave contradicts this pitch.  if so then no matter what
         # we need an accidental.
-        for i in reversed(range(len(pitchPast))):
-            thisPPast = pitchPast[i]
-            if thisPPast.step == self.step and thisPPast.octave == self.octave:
-                if thisPPast.name != self.name:  # conflicting alters, need accidental and return
-                    if self.accidental is None:
-                        self.accidental = Accidental('natural')
-                    self.accidental.displayStatus = True
-                    return
-                else:  # names are the same, skip this line of questioning
-                    break
+        thisPPast = pitchPastTable.lastInMeasure.get((self.step, self.octave))
+        if thisPPast is not None and thisPPast.name != self.name:
+            # conflicting alters, need accidental and return
+            if self.accidental is None:
+                self.accidental = Accidental('natural')
+            self.accidental.displayStatus = True
+            return
         # nope, no previous pitches in this octave and register, now more complex things...
 
         # here tied and always are treated the same; we assume that
@@ -4709,44 +4709,17 @@ class Pitch(prebase.ProtoM21Object):
         # store if a match was found and display set from past pitches
         setFromPitchPast = False
 
-        if cautionaryPitchClass is True:  # warn no mater what octave; thus create new without oct
-            pSelf = Pitch(self.name)
-            pSelf.accidental = self.accidental
-        else:
-            pSelf = self
-
-        # where does the line divide between in measure and out of measure
-        outOfMeasureLength = len(pitchPastMeasure)
-
         # need to step through pitchPast in reverse
         # comparing this pitch to the past pitches; if we find a match
-        # in terms of name, then decide what to do
-
-        # are we only comparing a list of past pitches all of
-        # which are the same as this one and in the same measure?
-        # if so, set continuousRepeatsInMeasure to True
-        # else, set to False
-        continuousRepeatsInMeasure: bool
-
-        # figure out if this pitch is in the measure (pPastInMeasure = True)
-        # or not.
-        for i in reversed(range(len(pitchPastAll))):
-
-            # is the past pitch in the measure or out of the measure?
-            pPastInMeasure: bool
-
-            if i < outOfMeasureLength:
-                pPastInMeasure = False
-                continuousRepeatsInMeasure = False
-            else:
-                pPastInMeasure = True
-                for j in range(i, len(pitchPastAll)):
-                    # do we have a continuous stream of the same note leading up to this one...
-                    if pitchPastAll[j].nameWithOctave != self.nameWithOctave:
-                        continuousRepeatsInMeasure = False
-                        break
-                else:
-                    continuousRepeatsInMeasure = True
+        # in terms of name, then decide what to do.  Only past pitches with
+        # the same step (A and A#) need to be compared.
+
+        # for each one, pPastInMeasure says if it is in this measure, and
+        # continuousRepeatsInMeasure says if we are only comparing a list of
+        # past pitches all of which are the same as this one and in the same measure
+        for (pPast,
+             pPastInMeasure,
+             continuousRepeatsInMeasure) in pitchPastTable.reversedSameStep(self):
             # if the pitch is the first of a measure, has an accidental,
             # it is not an altered key signature pitch,
             # and it is not a natural, it should always be set to display
@@ -4756,23 +4729,12 @@ class Pitch(prebase.ProtoM21Object):
                 self.accidental.displayStatus = True
                 return  # do not search past
 
-            # create Pitch objects for comparison; remove pitch space
-            # information if we are only doing a pitch class comparison
-            if cautionaryPitchClass is True:  # no octave; create new without oct
-                pPast = Pitch(pitchPastAll[i].name)
-                # must manually assign reference to the same accidentals
-                # as name alone will not transfer display status
-                pPast.accidental = pitchPastAll[i].accidental
-            else:  # cautionary in terms of pitch space; must match exact
-                pPast = pitchPastAll[i]
-
-            # if we do not match steps (A and A#), we can continue
-            if pPast.step != pSelf.step:
+            if pPast is None:  # the start of the previous measure
                 continue
 
             # store whether these match at the same octave; needed for some
             # comparisons even if not matching pitchSpace
-            if self.octave == pitchPastAll[i].octave:
+            if self.octave == pPast.octave:
                 octaveMatch = True
             else:
                 octaveMatch = False
@@ -4783,7 +4745,7 @@ class Pitch(prebase.ProtoM21Object):
                     and pPast.accidental is not None
                     and pPast.accidental.displayStatus is True):
                 # only needed if one has a natural and this does not
-                if pSelf.accidental is not None:
+                if self.accidental is not None:
                     self.accidental.displayStatus = False
                 return
 
@@ -4794,8 +4756,8 @@ class Pitch(prebase.ProtoM21Object):
 
             elif (continuousRepeatsInMeasure is True
                   and pPast.accidental is not None
-                  and pSelf.accidental is not None
-                  and pPast.accidental.name == pSelf.accidental.name):
+                  and self.accidental is not None
+                  and pPast.accidental.name == self.accidental.name):
 
                 # BUG! what about C#4 C#5 C#4 C#5 -- last C#4 and C#5
                 #   should not show accidental if cautionaryNotImmediateRepeat is False
@@ -4815,8 +4777,8 @@ class Pitch(prebase.ProtoM21Object):
             # yet, if we are against the key sig, then we need another natural if in another octave
             elif (pPast.accidental is not None
                   and pPast.accidental.name == 'natural'
-                  and (pSelf.accidental is None
-                       or pSelf.accidental.name == 'natural')):
+                  and (self.accidental is None
+                       or self.accidental.name == 'natural')):
                 if continuousRepeatsInMeasure is True:  # an immediate repeat; do not show
                     # unless we are altering the key signature and in
                     # a different register
@@ -4858,8 +4820,8 @@ class Pitch(prebase.ProtoM21Object):
             # we use step and octave though not necessarily a ps comparison
             elif (pPast.accidental is not None
                   and pPast.accidental.name != 'natural'
-                  and (pSelf.accidental is None
-                       or pSelf.accidental.displayStatus is False)):
+                  and (self.accidental is None
+                       or self.accidental.displayStatus is False)):
                 if octaveMatch is False and cautionaryPitchClass is False:
                     continue
                 if self.accidental is None:
@@ -4871,16 +4833,16 @@ class Pitch(prebase.ProtoM21Object):
             # if An or A to A#: need to make sure display is set
             elif ((pPast.accidental is None
                    or pPast.accidental.name == 'natural')
-                  and pSelf.accidental is not None
-                  and pSelf.accidental.name != 'natural'):
+                  and self.accidental is not None
+                  and self.accidental.name != 'natural'):
                 self.accidental.displayStatus = True
                 setFromPitchPast = True
                 break
 
             # if A- or An to A#: need to make sure display is set
             elif (pPast.accidental is not None
-                  and pSelf.accidental is not None
-                  and pPast.accidental.name != pSelf.accidental.name):
+                  and self.accidental is not None
+                  and pPast.accidental.name != self.accidental.name):
                 self.accidental.displayStatus = True
                 setFromPitchPast = True
                 break
@@ -4888,7 +4850,7 @@ class Pitch(prebase.ProtoM21Object):
             # going from a natural to an accidental, we should already be
             # showing the accidental, but just to check
             # if A to A#, or A to A-, but not A# to A
-            elif pPast.accidental is None and pSelf.accidental is not None:
+            elif pPast.accidental is None and self.accidental is not None:
                 self.accidental.displayStatus = True
                 # environLocal.printDebug(['match previous no mark'])
                 setFromPitchPast = True
@@ -4899,8 +4861,8 @@ class Pitch(prebase.ProtoM21Object):
             # if cautionaryNotImmediateRepeat is False, will not be shown
             elif (continuousRepeatsInMeasure is False
                   and pPast.accidental is not None
-                  and pSelf.accidental is not None
-                  and pPast.accidental.name == pSelf.accidental.name
+                  and self.accidental is not None
+                  and pPast.accidental.name == self.accidental.name
                   and octaveMatch is True):
                 if (cautionaryNotImmediateRepeat is False
                         and pPast.accidental.displayStatus is not False):
@@ -5021,6 +4983,129 @@ class Pitch(prebase.ProtoM21Object):
         return chordOut
 
 
+# ------------------------------------------------------------------------------
+class PitchPastTable:
+    '''
+    The pitches preceding a pitch in its measure, and those in the previous
+    measure (`pitchPastMeasure`), kept in a form that
+    :meth:`~music21.pitch.Pitch.updateAccidentalDisplay` can search without
+    looking at every one of them: only earlier pitches of the same step matter.
+
+    Pitches of the measure are added in order with `append()` or `extend()`;
+    each costs the same no matter how many pitches came before, so the whole
+    of a measure or stream can be processed with a single table.
+
+    >>> past = pitch.PitchPastTable([pitch.Pitch('F#4'), pitch.Pitch('A4')])
+    >>> past.extend([pitch.Pitch('F4'), pitch.Pitch('C#5')])
+    >>> past.append(pitch.Pitch('C#5'))
+    >>> len(past)
+    5
+
+    >>> f = pitch.Pitch('F4')
+    >>> f.updateAccidentalDisplay(pitchPastTable=past)
+    >>> f.accidental, f.accidental.displayStatus
+    (<music21.pitch.Accidental natural>, True)
+
+    `reversedSameStep()` gives the earlier pitches with the same step as a
+    given pitch, latest first, saying for each whether it is in this measure
+    and whether it and everything after it in the measure repeats the given
+    pitch.  If there is a previous measure, None marks where it begins.
+    If the given pitch has no accidental, neither do any earlier pitches
+    matter that had none, so those are left out.
+
+    >>> for pPast, inMeasure, isRepeat in past.reversedSameStep(pitch.Pitch('C#5')):
+    ...     print(pPast, inMeasure, isRepeat)
+    C#5 True True
+    C#5 True True
+    None False False
+    >>> for pPast, inMeasure, isRepeat in past.reversedSameStep(pitch.Pitch('F#4')):
+    ...     print(pPast, inMeasure, isRepeat)
+    F4 True False
+    None False False
+    F#4 False False
+    >>> for pPast, inMeasure, isRepeat in past.reversedSameStep(pitch.Pitch('F5')):
+    ...     print(pPast, inMeasure, isRepeat)
+    None False False
+    F#4 False False
+    '''
+    def __init__(self, pitchPastMeasure: Optional[List['Pitch']] = None):
+        # steps to the pitches of the previous measure or of this one, in order
+        self.pastMeasure: Dict[str, List['Pitch']] = {}
+        self.inMeasure: Dict[str, List['Pitch']] = {}
+        # the same, for pitches with accidentals; in this measure, by index in inMeasure
+        self.pastMeasureAltered: Dict[str, List['Pitch']] = {}
+        self.inMeasureAltered: Dict[str, List[int]] = {}
+        # (step, octave) to the last pitch in this measure
+        self.lastInMeasure: Dict[Tuple[str, Optional[int]], 'Pitch'] = {}
+        # nameWithOctave of the last pitch, and how many times in a row it ends the measure
+        self.repeatedName: Optional[str] = None
+        self.repeatCount = 0
+
+        self.pastMeasureLength = 0
+        self.inMeasureLength = 0
+        if pitchPastMeasure:
+            for p in pitchPastMeasure:
+                self.pastMeasure.setdefault(p.step, []).append(p)
+                if p.accidental is not None:
+                    self.pastMeasureAltered.setdefault(p.step, []).append(p)
+            self.pastMeasureLength = len(pitchPastMeasure)
+
+    def __len__(self):
+        return self.pastMeasureLength + self.inMeasureLength
+
+    def append(self, p: 'Pitch'):
+        '''
+        Add a pitch from the current measure, after all the others.
+        '''
+        sameStep = self.inMeasure.setdefault(p.step, [])
+        if p.accidental is not None:
+            self.inMeasureAltered.setdefault(p.step, []).append(len(sameStep))
+        sameStep.append(p)
+        self.lastInMeasure[(p.step, p.octave)] = p
+        nameWithOctave = p.nameWithOctave
+        if nameWithOctave == self.repeatedName:
+            self.repeatCount += 1
+        else:
+            self.repeatedName = nameWithOctave
+            self.repeatCount = 1
+        self.inMeasureLength += 1
+
+    def extend(self, pitches):
+        '''
+        Add several pitches from the current measure, in order.
+        '''
+        for p in pitches:
+            self.append(p)
+
+    def reversedSameStep(self, p: 'Pitch'):
+        '''
+        Yield a tuple of (pitch, isInMeasure, isContinuousRepeat) for each pitch
+        with the same step as `p`, latest first, with (None, False, False)
+        before those of the previous measure if it had any pitches.
+
+        If `p` has no accidental, only pitches with accidentals are given:
+        updateAccidentalDisplay() passes over the others.
+        '''
+        step = p.step
+        sameStep = self.inMeasure.get(step, ())
+        if p.accidental is None:
+            indices = reversed(self.inMeasureAltered.get(step, ()))
+            pastMeasure = self.pastMeasureAltered.get(step, ())
+        else:
+            indices = reversed(range(len(sameStep)))
+            pastMeasure = self.pastMeasure.get(step, ())
+
+        # the last repeatCount pitches all have the same step
+        repeatCount = self.repeatCount if p.nameWithOctave == self.repeatedName else 0
+        firstRepeat = len(sameStep) - repeatCount
+        for i in indices:
+            yield sameStep[i], True, i >= firstRepeat
+        if self.pastMeasureLength:
+            yield None, False, False
+            for pPast in reversed(pastMeasure):
+                yield pPast, False, False
+
+
 # ------------------------------------------------------------------------------
 
 class Test(unittest.TestCase):
@@ -5373,6 +5458,37 @@ class Test(unittest.TestCase):
         a4.updateAccidentalDisplay(past, cautionaryPitchClass=False)
         self.assertEqual(a4.accidental, None)
 
+    def testUpdateAccidentalDisplayPitchPastTable(self):
+        '''
+        A PitchPastTable added to one pitch at a time gives the same
+        results as lists of past pitches.
+        '''
+        def display(pList):
+            return [(p.nameWithOctave, None if p.accidental is None
+                     else (p.accidental.name, p.accidental.displayStatus))
+                    for p in pList]
+
+        names = ['c4', 'c#4', 'c4', 'c4', 'c5', 'c#5', 'cn4', 'c-4', 'c-4', 'd4',
+                 'c#4', 'c#4', 'c#3', 'c3', 'c4', 'd#4', 'c5', 'c5']
+        for cautionaryPitchClass in (True, False):
+            for cautionaryNotImmediateRepeat in (True, False):
+                keywords = {'cautionaryPitchClass': cautionaryPitchClass,
+                            'cautionaryNotImmediateRepeat': cautionaryNotImmediateRepeat,
+                            'alteredPitches': [Pitch('c#')]}
+                pastMeasure = [Pitch('c#4'), Pitch('c4')]
+
+                pList = [Pitch(name) for name in names]
+                for i, p in enumerate(pList):
+                    p.updateAccidentalDisplay(pList[:i], pastMeasure, **keywords)
+
+                pTableList = [Pitch(name) for name in names]
+                table = PitchPastTable(pastMeasure)
+                for p in pTableList:
+                    p.updateAccidentalDisplay(pitchPastTable=table, **keywords)
+                    table.append(p)
+
+                self.assertEqual(display(pTableList), display(pList))
+
     def testAccidentalsCautionary(self):
         '''
         a nasty test provided by Jose Cabal-Ugaz about octave leaps,
@@ -5587,7 +5703,7 @@ class Test(unittest.TestCase):
 # define presented order in documentation
 
 
-_DOC_ORDER = [Pitch, Accidental, Microtone]
+_DOC_ORDER = [Pitch, Accidental, Microtone, PitchPastTable]
 
 
 if __name__ == '__main__':
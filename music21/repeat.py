@@ -19,8 +19,10 @@ the :class:`~music21.bar.Repeat` which represents a normal barline repeat.
 import copy
 import string
 import unittest
+from collections import namedtuple
 from typing import Union
 
+from music21 import common
 from music21 import exceptions21
 from music21 import expressions
 from music21 import spanner
@@ -638,6 +640,30 @@ class ExpanderException(exceptions21.Music21Exception):
     pass
 
 
+ExpansionStep = namedtuple('ExpansionStep', [
+    'sourceIndex',
+    'number',
+    'numberSuffix',
+    'leftBarlineType',
+    'rightBarlineType',
+    'stripRepeatExpressions',
+])
+ExpansionStep.__doc__ = '''
+One measure of an expanded Stream, as given by :meth:`Expander.expansionPlan`.
+
+`sourceIndex` is the index of the measure in the unexpanded Stream; `number` and
+`numberSuffix` are the measure number the expanded measure gets.  `leftBarlineType` and
+`rightBarlineType` are None if the barline is kept as it is, otherwise the type of the
+plain :class:`~music21.bar.Barline` replacing a repeat barline.
+If `stripRepeatExpressions` is True, all RepeatExpressions in the measure are removed.
+'''
+
+# expansion plans are shared between all Expanders of Streams with the same repeat
+# structure (see Expander._planSignature), such as the parts of a Score, or the same
+# Score expanded again.
+_expansionPlanCache = common.LRUCache(maxSize=256)
+
+
 class Expander:
     '''
     The Expander object can expand a single Part or Part-like Stream with repeats. Nested
@@ -713,6 +739,7 @@ class Expander:
     def __init__(self, streamObj=None):
         self._src = streamObj
         self._repeatBrackets = None
+        self._expansionPlan = None
         if streamObj is not None:
             self._setup()
 
@@ -735,9 +762,9 @@ class Expander:
         if self._srcMeasureCount == 0:
             raise ExpanderException('no measures found in the source stream to be expanded')
 
-        # store counts of all non barline elements.
+        # store counts of all non barline elements; only counted, so no need to flatten.
         # doing class matching by string as problems matching in some test cases
-        reStream = self._srcMeasureStream.flat.getElementsByClass(
+        reStream = self._srcMeasureStream.recurse().getElementsByClass(
             'RepeatExpression'
         ).stream()
         self._codaCount = len(reStream.getElementsByClass('Coda'))
@@ -812,10 +839,7 @@ class Expander:
         of the original instead of the
         index of the original is used -- suffixes are important here for endings etc..
 
-        Inefficient, because the entire stream is expanded before making this call,
-        rather than just seeing
-        what needs to be expanded and returning that.
-
+        The map is read from the :meth:`expansionPlan`, so no measures are copied.
 
         >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.    G4 a b   c2.')
         >>> s.makeMeasures(inPlace=True)
@@ -829,33 +853,297 @@ class Expander:
         >>> e.measureMap(returnType='measureNumber')
         ['1', '2', '2a', '2b', '3', '4', '4a', '5']
         '''
-        measureNumberList = []
-        measureNumberNoSuffixList = []
-        post = self.process()
+        plan = self.expansionPlan()
+        if returnType == 'measureNumber':
+            return [str(step.number) + (step.numberSuffix or '') for step in plan]
+        return [step.sourceIndex for step in plan]
 
-        measureContainingStreams = post
+    def expansionPlan(self):
+        '''
+        Return the order of the measures in the expanded Stream as a tuple of
+        :class:`~music21.repeat.ExpansionStep` objects, one for each measure, giving
+        the index of the source measure it comes from and how it differs from it.
 
-        for i, m in enumerate(measureContainingStreams.getElementsByClass('Measure')):
-            measureNumberList.append(m.measureNumberWithSuffix())
-            measureNumberNoSuffixList.append(m.number)
+        The plan is computed without copying the content of any measure and is
+        shared with every other Expander for a Stream with the same repeat structure,
+        so expanding the same Score (or each of its parts) again is cheap.
+        Use :meth:`processFromPlan` or :meth:`iterExpandedMeasures` to realize it.
 
-        if returnType == 'measureNumber':
-            return measureNumberList
+        >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> e = repeat.Expander(s)
+        >>> for step in e.expansionPlan():
+        ...     step
+        ExpansionStep(sourceIndex=0, number=1, numberSuffix=None,
+                      leftBarlineType=None, rightBarlineType=None, stripRepeatExpressions=False)
+        ExpansionStep(sourceIndex=1, number=2, numberSuffix=None,
+                      leftBarlineType='double', rightBarlineType='double',
+                      stripRepeatExpressions=False)
+        ExpansionStep(sourceIndex=1, number=2, numberSuffix='a',
+                      leftBarlineType='double', rightBarlineType='double',
+                      stripRepeatExpressions=False)
+        ExpansionStep(sourceIndex=2, number=3, numberSuffix=None,
+                      leftBarlineType=None, rightBarlineType=None, stripRepeatExpressions=False)
+
+        A start repeat without an end cannot be expanded:
+
+        >>> s.measure(3).leftBarline = bar.Repeat(direction='start')
+        >>> e = repeat.Expander(s)
+        >>> e.expansionPlan()
+        Traceback (most recent call last):
+        music21.repeat.ExpanderException: cannot expand Stream:
+            badly formed repeats or repeat expressions
+        '''
+        if self._src is None:
+            raise ExpanderException('no Stream has been given to expand')
+        if self._expansionPlan is not None:
+            return self._expansionPlan
+
+        signature = self._planSignature()
+        plan = _expansionPlanCache.get(signature)
+        if plan is None:
+            plan = self._computeExpansionPlan()
+            _expansionPlanCache[signature] = plan
+        self._expansionPlan = plan
+        return plan
+
+    def iterExpandedMeasures(self):
+        '''
+        Yield, for each measure of the expanded Stream, a tuple of its
+        :class:`~music21.repeat.ExpansionStep` and the measure of the source Stream
+        it is a repetition of.  Nothing is copied: the measures are those of the source
+        Stream, so their numbers, barlines and RepeatExpressions are as they
+        are there; the step says how the expanded measure differs.
+
+        This is useful for reading through a Stream in playing order, for instance
+        for rendering it.
+
+        >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> e = repeat.Expander(s)
+        >>> for step, m in e.iterExpandedMeasures():
+        ...     print(step.number, step.numberSuffix, m is s.measure(step.number), m.notes[0].name)
+        1 None True A
+        2 None True C
+        2 a True C
+        3 None True F
+        '''
+        srcMeasures = list(self._srcMeasureStream)
+        for step in self.expansionPlan():
+            yield step, srcMeasures[step.sourceIndex]
+
+    def processFromPlan(self, plan=None, *, shareMeasures=True):
+        '''
+        Return a new Stream of the expanded measures, as :meth:`process` does, but
+        built from an expansion plan (by default this Expander's
+        :meth:`expansionPlan`) instead of analyzing and copying the repeats again.
+
+        If `shareMeasures` is True (default), the first time a source measure is used
+        unaltered, the source measure itself is placed in the new Stream; only measures
+        that are repeated, renumbered, or which lose repeat barlines or
+        RepeatExpressions are deep-copied.  Changing the shared measures changes
+        the source Stream.  If `shareMeasures` is False, every measure is deep-copied,
+        just as in :meth:`process`.
+
+        >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end', times=3)
+        >>> e = repeat.Expander(s)
+        >>> s2 = e.processFromPlan()
+        >>> [m.measureNumberWithSuffix() for m in s2]
+        ['1', '2', '2a', '2b', '3']
+        >>> s2.measure(1) is s.measure(1)
+        True
+        >>> s2.measure(2) is s.measure(2)
+        False
+        >>> s2.measure(2).leftBarline
+        <music21.bar.Barline type=double>
+        >>> s.measure(2).leftBarline
+        <music21.bar.Repeat direction=start>
+
+        >>> s3 = e.processFromPlan(shareMeasures=False)
+        >>> s3.measure(1) is s.measure(1)
+        False
+        >>> s3.measure(1).derivation.origin is s.measure(1)
+        True
+        '''
+        from music21 import bar
+        if plan is None:
+            plan = self.expansionPlan()
+
+        srcMeasures = list(self._srcMeasureStream)
+        new = self._srcMeasureStream.__class__()
+        used = set()
+        for step in plan:
+            mSrc = srcMeasures[step.sourceIndex]
+            if (shareMeasures
+                    and step.sourceIndex not in used
+                    and not self._stepAltersMeasure(step, mSrc)):
+                m = mSrc
+            else:
+                m = copy.deepcopy(mSrc)
+                m.number = step.number
+                m.numberSuffix = step.numberSuffix
+                if step.leftBarlineType is not None:
+                    m.leftBarline = bar.Barline(step.leftBarlineType)
+                if step.rightBarlineType is not None:
+                    m.rightBarline = bar.Barline(step.rightBarlineType)
+                if step.stripRepeatExpressions:
+                    self._stripRepeatExpressions(m)
+            used.add(step.sourceIndex)
+            new.append(m)
+        return new
 
-        measureNumberDict = {}
-        measureNumberNoSuffixDict = {}
+    @staticmethod
+    def _stepAltersMeasure(step, m):
+        '''
+        Return True if the measure of the expanded Stream described by `step` is
+        not the same as the source measure `m`.
+        '''
+        return (step.number != m.number
+                or step.numberSuffix != m.numberSuffix
+                or step.leftBarlineType is not None
+                or step.rightBarlineType is not None
+                or step.stripRepeatExpressions)
+
+    def _planSignature(self):
+        '''
+        Return a hashable summary of everything in the source Stream that the
+        expansion depends on: the numbers, barlines and RepeatExpressions
+        of each measure, and the measures spanned by each RepeatBracket.
+        '''
+        def barlineSignature(b):
+            if b is None:
+                return None
+            return (b.classes[0], b.type, getattr(b, 'direction', None), getattr(b, 'times', None))
+
+        measureIndices = {}
+        measureSignatures = []
         for i, m in enumerate(self._srcMeasureStream):
-            measureNumberDict[m.measureNumberWithSuffix()] = i
-            measureNumberNoSuffixDict[m.number] = i
-            # could be overwritten if the same measureNumber is used multiple times.
+            measureIndices[id(m)] = i
+            expressions = tuple((e.classes[0], getattr(e, 'repeatAfterJump', None))
+                                for e in m.getElementsByClass('RepeatExpression'))
+            measureSignatures.append((m.number,
+                                      m.numberSuffix,
+                                      barlineSignature(m.leftBarline),
+                                      barlineSignature(m.rightBarline),
+                                      expressions,
+                                      self._hasNestedRepeatExpressions(m)))
+
+        bracketSignatures = []
+        for rb in self._repeatBrackets:
+            bracketSignatures.append((tuple(rb.getNumberList()),
+                                      tuple(measureIndices.get(id(e))
+                                            for e in rb.getSpannedElements())))
+        return tuple(measureSignatures), tuple(bracketSignatures)
+
+    @staticmethod
+    def _hasNestedRepeatExpressions(m):
+        '''
+        Return True if the measure has RepeatExpressions in a Voice or other
+        Stream within it, rather than directly in the measure.
+        '''
+        for sub in m.getElementsByClass('Stream'):
+            if sub.recurse().getElementsByClass('RepeatExpression').first() is not None:
+                return True
+        return False
 
-        indexList = []
-        for i, measureNumberWithSuffix in enumerate(measureNumberList):
-            try:
-                indexList.append(measureNumberDict[measureNumberWithSuffix])
-            except KeyError:
-                indexList.append(measureNumberNoSuffixDict[measureNumberNoSuffixList[i]])
-        return indexList
+    def _planSkeleton(self):
+        '''
+        Return a Stream of empty Measures standing in for the source measures, which
+        have the same numbers, barlines, RepeatExpressions and RepeatBrackets, and so
+        expand the same way, but cost next to nothing to copy.
+        '''
+        from music21 import duration
+        from music21 import stream
+
+        skeleton = stream.Stream()
+        shells = {}
+        for m in self._srcMeasureStream:
+            shell = stream.Measure(number=m.number)
+            shell.numberSuffix = m.numberSuffix
+            shell.duration = duration.Duration(m.duration.quarterLength)
+            if m.leftBarline is not None:
+                shell.leftBarline = copy.deepcopy(m.leftBarline)
+            if m.rightBarline is not None:
+                shell.rightBarline = copy.deepcopy(m.rightBarline)
+            for e in m.getElementsByClass('RepeatExpression'):
+                shell.insert(m.elementOffset(e), copy.deepcopy(e))
+            shells[id(m)] = shell
+            skeleton.append(shell)
+
+        for rb in self._repeatBrackets:
+            # a deepcopy of a spanner still spans the source measures
+            rbShell = copy.deepcopy(rb)
+            for e in rb.getSpannedElements():
+                if id(e) in shells:
+                    rbShell.replaceSpannedElement(id(e), shells[id(e)])
+            skeleton.insert(0, rbShell)
+        return skeleton
+
+    def _computeExpansionPlan(self):
+        '''
+        Expand the repeats of a skeleton of the source Stream
+        and read the plan off the expanded measures.
+        '''
+        canExpand = self.isExpandable()
+        if canExpand is False:
+            raise ExpanderException(
+                'cannot expand Stream: badly formed repeats or repeat expressions')
+
+        srcMeasures = list(self._srcMeasureStream)
+        if canExpand is None:
+            return tuple(ExpansionStep(i, m.number, m.numberSuffix, None, None, False)
+                         for i, m in enumerate(srcMeasures))
+
+        if any(self._hasNestedRepeatExpressions(m) for m in srcMeasures):
+            # the skeleton only carries RepeatExpressions found directly in measures,
+            # so expand the Stream itself.
+            planSource = self._src
+        else:
+            planSource = self._planSkeleton()
+        expander = Expander(planSource)
+        expanded = expander.process()
+
+        # every expanded measure is a (copy of a) copy of a measure of planSource
+        planIndices = {id(m): i for i, m in enumerate(expander._srcMeasureStream)}
+        plan = []
+        for m in expanded:
+            origin = m
+            while id(origin) not in planIndices:
+                origin = origin.derivation.origin
+                if origin is None:  # pragma: no cover
+                    raise ExpanderException('cannot find the source of an expanded measure')
+            i = planIndices[id(origin)]
+            mSrc = srcMeasures[i]
+            plan.append(ExpansionStep(
+                i,
+                m.number,
+                m.numberSuffix,
+                self._replacedBarlineType(mSrc.leftBarline, m.leftBarline),
+                self._replacedBarlineType(mSrc.rightBarline, m.rightBarline),
+                (mSrc.getElementsByClass('RepeatExpression').first() is not None
+                    and m.getElementsByClass('RepeatExpression').first() is None),
+            ))
+        return tuple(plan)
+
+    @staticmethod
+    def _replacedBarlineType(srcBarline, newBarline):
+        '''
+        Return the type of `newBarline` if it replaces the repeat barline
+        `srcBarline`, otherwise None.
+        '''
+        if (srcBarline is not None
+                and 'Repeat' in srcBarline.classes
+                and newBarline is not None
+                and 'Repeat' not in newBarline.classes):
+            return newBarline.type
+        return None
 
     def _stripRepeatBarlines(self, m, newType='double'):
         '''
@@ -1886,7 +2174,8 @@ class Expander:
         self._stripRepeatExpressions(new)
         return new
 
-    _DOC_ORDER = ['process', 'measureMap']
+    _DOC_ORDER = ['process', 'expansionPlan', 'processFromPlan', 'iterExpandedMeasures',
+                  'measureMap']
 
 # ---------------------------------------------------------
 
@@ -4295,6 +4584,51 @@ class Test(unittest.TestCase):
 #         s.show()
 #         post = s.expandRepeats()
 
+    def testExpansionPlan(self):
+        from music21 import bar
+        from music21 import converter
+        from music21.abcFormat import testFiles
+
+        def measureContents(measures):
+            return [(m.measureNumberWithSuffix(),
+                     repr(m.leftBarline),
+                     repr(m.rightBarline),
+                     [repr(e) for e in m.recurse()])
+                    for m in measures]
+
+        # repeat brackets
+        s = converter.parse(testFiles.mysteryReel)
+        p = s.parts[0]
+        ex = Expander(p)
+        plan = ex.expansionPlan()
+        self.assertEqual(len(plan), 32)
+        post = Expander(p).process()
+        self.assertEqual(measureContents(ex.processFromPlan(shareMeasures=False)),
+                         measureContents(post))
+        shared = ex.processFromPlan()
+        self.assertEqual(measureContents(shared), measureContents(post))
+        sources = [m for step, m in ex.iterExpandedMeasures()]
+        self.assertEqual(sum(m1 is m2 for m1, m2 in zip(shared, sources)), 16)
+
+        # the plan is reused for a Stream with the same repeats
+        self.assertIs(Expander(copy.deepcopy(p)).expansionPlan(), plan)
+
+        # da capo al coda with a repeat before the jump
+        p = converter.parse('tinynotation: 2/4 c2 d2 e2 f2 g2 a2')
+        p.makeMeasures(inPlace=True)
+        p.measure(1).insert(0, Coda())
+        p.measure(2).leftBarline = bar.Repeat(direction='start')
+        p.measure(3).rightBarline = bar.Repeat(direction='end')
+        p.measure(4).append(DaCapoAlCoda())
+        p.measure(5).insert(0, Coda())
+        ex = Expander(p)
+        self.assertEqual(ex.measureMap(), [0, 1, 2, 1, 2, 3, 0, 4, 5])
+        self.assertEqual(measureContents(ex.processFromPlan()),
+                         measureContents(Expander(p).process()))
+        self.assertTrue(all(step.stripRepeatExpressions
+                            for step in ex.expansionPlan()
+                            if step.sourceIndex in (0, 3, 4)))
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
@@ -57,6 +57,141 @@ _keyCache = {}
 # but it will always be replaced.
 _NOTATION_SINGLETON = fbNotation.Notation()
 
+# LRU-bounded memos of parsing a figure in a key (see RomanNumeral._parseFigure)
+# and of the figure and key that romanNumeralFromChord finds for a chord.
+# See cacheStats() for how often they are used.
+USE_FIGURE_CACHE = True
+_figureCache = common.LRUCache(maxSize=4096)
+_chordFigureCache = common.LRUCache(maxSize=8192)
+
+# attributes of a RomanNumeral set by parsing its figure in its key.
+# When a parse is reused from _figureCache, the strings and numbers in these
+# attributes are shared, and the objects in _MUTABLE_PARSED_FIGURE_ATTRIBUTES
+# are copied for each RomanNumeral.
+_PARSED_FIGURE_ATTRIBUTES = (
+    'primaryFigure',
+    'secondaryRomanNumeral',
+    'secondaryRomanNumeralKey',
+    'scaleDegree',
+    'frontAlterationString',
+    'frontAlterationTransposeInterval',
+    'frontAlterationAccidental',
+    'romanNumeralAlone',
+    'figuresWritten',
+    'figuresNotationObj',
+    'impliedQuality',
+    'impliedScale',
+    'useImpliedScale',
+)
+_MUTABLE_PARSED_FIGURE_ATTRIBUTES = (
+    'secondaryRomanNumeral',
+    'secondaryRomanNumeralKey',
+    'frontAlterationTransposeInterval',
+    'frontAlterationAccidental',
+    'figuresNotationObj',
+    'impliedScale',
+)
+
+
+def _keyCacheDescription(keyOrScale):
+    '''
+    Return a hashable description of `keyOrScale` for the figure caches,
+    or None if RomanNumerals in it should not be cached.
+
+    >>> roman._keyCacheDescription(key.Key('c#'))
+    ('C#', 'minor')
+    >>> roman._keyCacheDescription(None)
+    ''
+    >>> roman._keyCacheDescription(key.Key('D', 'dorian')) is None
+    True
+    '''
+    if keyOrScale is None:
+        return ''
+    if isinstance(keyOrScale, key.Key) and keyOrScale.mode in ('major', 'minor'):
+        return (keyOrScale.tonic.nameWithOctave, keyOrScale.mode)
+    return None
+
+
+def _copyParsedFigureObjects(parsed, oldScale, newScale):
+    '''
+    Replace the objects in `parsed`, a dictionary of the
+    _MUTABLE_PARSED_FIGURE_ATTRIBUTES of a RomanNumeral, with copies, so that
+    they can be stored in or taken from the figure cache without being shared.
+    A secondary RomanNumeral in the key `oldScale` is remade in `newScale`.
+
+    Keys and scales are copied with copy.copy, as in _getKeyFromCache;
+    the secondary RomanNumeral and the figures Notation are made again,
+    which is faster than copy.deepcopy.
+
+    >>> k = key.Key('c')
+    >>> rn1 = roman.RomanNumeral('bVI65/iv', k)
+    >>> rn2 = roman.RomanNumeral('bVI65/iv', k)
+    >>> rn2.secondaryRomanNumeral is rn1.secondaryRomanNumeral
+    False
+    >>> rn2.secondaryRomanNumeral.key is k
+    True
+    >>> rn2.secondaryRomanNumeralKey is rn1.secondaryRomanNumeralKey
+    False
+    >>> rn2.secondaryRomanNumeralKey
+    <music21.key.Key of f minor>
+    >>> rn2.figuresNotationObj is rn1.figuresNotationObj
+    False
+    >>> rn2.frontAlterationAccidental is rn1.frontAlterationAccidental
+    False
+    '''
+    secondary = parsed['secondaryRomanNumeral']
+    if secondary is not None:
+        if secondary._scale is oldScale:
+            secondaryScale = newScale
+        else:
+            secondaryScale = copy.copy(secondary._scale)
+        parsed['secondaryRomanNumeral'] = RomanNumeral(
+            secondary.figure,
+            secondaryScale,
+            caseMatters=secondary.caseMatters,
+        )
+    for attr in ('secondaryRomanNumeralKey', 'impliedScale'):
+        if parsed[attr] is not None:
+            parsed[attr] = copy.copy(parsed[attr])
+    for attr in ('frontAlterationTransposeInterval', 'frontAlterationAccidental'):
+        if parsed[attr] is not None:
+            parsed[attr] = copy.deepcopy(parsed[attr])
+    parsed['figuresNotationObj'] = fbNotation.Notation(
+        parsed['figuresNotationObj'].notationColumn)
+
+
+def cacheStats():
+    '''
+    Return a dictionary of statistics (hits, misses, hitRate, size, maxSize)
+    for the caches of parsed figures (`'figure'`) and of the figures found by
+    :func:`~music21.roman.romanNumeralFromChord` (`'chord'`).
+
+    >>> roman.clearCaches()
+    >>> rn = roman.RomanNumeral('V7', key.Key('E-'))
+    >>> rn = roman.RomanNumeral('V7', key.Key('E-'))
+    >>> stats = roman.cacheStats()
+    >>> stats['figure']['hits'], stats['figure']['misses']
+    (1, 1)
+    >>> stats['figure']['hitRate']
+    0.5
+    '''
+    return {'figure': _figureCache.stats(),
+            'chord': _chordFigureCache.stats(),
+            }
+
+
+def clearCaches():
+    '''
+    Empty the caches of parsed figures and of figures found from chords,
+    and reset their statistics.
+
+    >>> roman.clearCaches()
+    >>> roman.cacheStats()['chord']['size']
+    0
+    '''
+    _figureCache.clear()
+    _chordFigureCache.clear()
+
 
 def _getKeyFromCache(keyStr: str) -> key.Key:
     '''
@@ -820,6 +955,90 @@ def romanNumeralFromChord(chordObj,
     # <music21.roman.RomanNumeral IV7 in c minor>
     # <music21.roman.RomanNumeral IV#75#3 in c minor>
     '''
+    chordCacheKey = None
+    if USE_FIGURE_CACHE:
+        chordCacheKey = _chordFigureCacheKey(chordObj, keyObj, preferSecondaryDominants)
+    cached = None
+    if chordCacheKey is not None:
+        cached = _chordFigureCache.get(chordCacheKey)
+    if cached is not None:
+        rnString, foundKeyName = cached
+        if foundKeyName is not None:
+            keyObj = _getKeyFromCache(foundKeyName)
+        elif isinstance(keyObj, str):
+            keyObj = key.Key(keyObj)
+    else:
+        rnString, keyObj = _figureAndKeyFromChord(chordObj, keyObj)
+        if chordCacheKey is not None:
+            # when no key is given, the key found comes from the cache of keys
+            foundKeyName = keyObj.tonicPitchNameWithCase if chordCacheKey[1] is None else None
+            _chordFigureCache[chordCacheKey] = (rnString, foundKeyName)
+
+    try:
+        rn = RomanNumeral(rnString, keyObj, updatePitches=False)
+    except fbNotation.ModifierException as strerror:
+        raise RomanNumeralException(
+            'Could not parse {0} from chord {1} as an RN '
+            'in key {2}: {3}'.format(rnString, chordObj, keyObj, strerror))  # pragma: no cover
+
+    # Is this linking them in an unsafe way?
+    rn.pitches = chordObj.pitches
+    return rn
+
+
+def _chordFigureCacheKey(chordObj, keyObj, preferSecondaryDominants=False):
+    '''
+    Return a key for `_chordFigureCache` describing everything about `chordObj`
+    and `keyObj` that :func:`~music21.roman.romanNumeralFromChord` uses,
+    or None if the result should not be cached.
+
+    Octaves do not matter when every pitch name is different and the bass is
+    the only lowest note, so the same figure is found for any voicing:
+
+    >>> k = key.Key('F')
+    >>> key1 = roman._chordFigureCacheKey(chord.Chord('E3 C4 G4 B-4'), k)
+    >>> key1
+    (('E', 'C', 'G', 'B-'), ('F', 'major'), 'E', False)
+    >>> key1 == roman._chordFigureCacheKey(chord.Chord('E2 C5 G3 B-4'), k)
+    True
+
+    Otherwise the octaves are part of the key:
+
+    >>> roman._chordFigureCacheKey(chord.Chord('C4 E4 G4 C5'), k)
+    (('C4', 'E4', 'G4', 'C5'), ('F', 'major'), 'C4', False)
+    '''
+    if chordObj._overrides:
+        return None
+    if keyObj is None or isinstance(keyObj, str):
+        keyDescription = keyObj
+    else:
+        keyDescription = _keyCacheDescription(keyObj)
+        if not keyDescription:
+            return None
+
+    pitches = chordObj.pitches
+    if not pitches:
+        return None
+    for p in pitches:
+        if p._microtone is not None and p._microtone.cents != 0:
+            return None
+    bass = chordObj.bass()
+    names = tuple(p.name for p in pitches)
+    if (len(set(names)) == len(names)
+            and all(p is bass or p.ps > bass.ps for p in pitches)):
+        return (names, keyDescription, bass.name, preferSecondaryDominants)
+    return (tuple(p.nameWithOctave for p in pitches), keyDescription,
+            bass.nameWithOctave, preferSecondaryDominants)
+
+
+def _figureAndKeyFromChord(chordObj, keyObj):
+    '''
+    Does the work of :func:`~music21.roman.romanNumeralFromChord`, returning
+    the figure and the key of the RomanNumeral for `chordObj`.
+
+    >>> roman._figureAndKeyFromChord(chord.Chord('E-4 G4 C#5'), None)
+    ('It6', <music21.key.Key of g minor>)
+    '''
     aug6subs = {
         '#ivo6b3': 'It6',
         'IIø#643': 'Fr43',
@@ -898,16 +1117,7 @@ def romanNumeralFromChord(chordObj,
         elif rnString in ('Fr43', 'Sw43'):
             keyObj = _getKeyFromCache(chordObj.seventh.name.lower())
 
-    try:
-        rn = RomanNumeral(rnString, keyObj, updatePitches=False)
-    except fbNotation.ModifierException as strerror:
-        raise RomanNumeralException(
-            'Could not parse {0} from chord {1} as an RN '
-            'in key {2}: {3}'.format(rnString, chordObj, keyObj, strerror))  # pragma: no cover
-
-    # Is this linking them in an unsafe way?
-    rn.pitches = chordObj.pitches
-    return rn
+    return rnString, keyObj
 
 
 class Minor67Default(enum.Enum):
@@ -1871,7 +2081,10 @@ class RomanNumeral(harmony.Harmony):
         self.sixthMinor = sixthMinor
         self.seventhMinor = seventhMinor
 
+        # entry in _figureCache for this figure and key, used only while initializing.
+        self._figureCacheEntry = None
         super().__init__(figure, updatePitches=updatePitches)
+        self._figureCacheEntry = None
         self._parsingComplete = True
         self._functionalityScore = None
         self.editorial.followsKeyChange = False
@@ -1906,6 +2119,26 @@ class RomanNumeral(harmony.Harmony):
         if not isinstance(self._figure, str):  # pragma: no cover
             raise RomanException(f'got a non-string figure: {self._figure!r}')
 
+        # reparsing a figure that has been set again keeps earlier
+        # bracketed alterations, so only newly initialized objects use the cache.
+        figureCacheKey = None
+        if USE_FIGURE_CACHE and not self._parsingComplete:
+            keyDescription = _keyCacheDescription(self._scale)
+            if keyDescription is not None:
+                figureCacheKey = (self._figure, keyDescription, self.caseMatters,
+                                  self.sixthMinor, self.seventhMinor)
+        if figureCacheKey is not None:
+            cacheEntry = _figureCache.get(figureCacheKey)
+            if cacheEntry is not None:
+                selfDict = self.__dict__
+                selfDict.update(cacheEntry['parsed'])
+                _copyParsedFigureObjects(selfDict, cacheEntry['scale'], self._scale)
+                self.bracketedAlterations = list(cacheEntry['bracketedAlterations'])
+                self.omittedSteps = list(cacheEntry['omittedSteps'])
+                self.addedSteps = list(cacheEntry['addedSteps'])
+                self._figureCacheEntry = cacheEntry
+                return
+
         if not self.useImpliedScale:
             useScale = self._scale
         else:
@@ -1939,6 +2172,24 @@ class RomanNumeral(harmony.Harmony):
         shFig = ','.join(expandShortHand(workingFigure))
         self.figuresNotationObj = fbNotation.Notation(shFig)
 
+        if figureCacheKey is not None:
+            selfDict = self.__dict__
+            # store copies, so that changes to this RomanNumeral's objects
+            # (including its key) do not change the cache
+            parsed = {attr: selfDict[attr] for attr in _PARSED_FIGURE_ATTRIBUTES}
+            cachedScale = copy.copy(self._scale)
+            _copyParsedFigureObjects(parsed, self._scale, cachedScale)
+            cacheEntry = {
+                'parsed': parsed,
+                'scale': cachedScale,
+                'bracketedAlterations': tuple(self.bracketedAlterations),
+                'omittedSteps': tuple(self.omittedSteps),
+                'addedSteps': tuple(self.addedSteps),
+                'pitches': None,  # filled in by _updatePitches
+            }
+            _figureCache[figureCacheKey] = cacheEntry
+            self._figureCacheEntry = cacheEntry
+
     def _setImpliedQualityFromString(self, workingFigure):
         # major, minor, augmented, or diminished (and half-diminished for 7ths)
         impliedQuality = ''
@@ -2530,6 +2781,16 @@ class RomanNumeral(harmony.Harmony):
         '''
         Utility function to update the pitches to the new figure etc.
         '''
+        cacheEntry = self._figureCacheEntry
+        if cacheEntry is not None and cacheEntry['pitches'] is not None:
+            self.scaleCardinality = cacheEntry['scaleCardinality']
+            # share the memo so that a root override stays one of the pitches
+            memo = {}
+            self.pitches = [copy.deepcopy(p, memo) for p in cacheEntry['pitches']]
+            for overrideName, overridePitch in cacheEntry['overrides'].items():
+                self._overrides[overrideName] = copy.deepcopy(overridePitch, memo)
+            return
+
         if self.secondaryRomanNumeralKey is not None:
             useScale = self.secondaryRomanNumeralKey
         elif not self.useImpliedScale:
@@ -2622,6 +2883,13 @@ class RomanNumeral(harmony.Harmony):
                 f'_updatePitches() was unable to derive pitches from the figure: {self.figure!r}'
             )  # pragma: no cover
 
+        if cacheEntry is not None:
+            memo = {}
+            cacheEntry['scaleCardinality'] = self.scaleCardinality
+            cacheEntry['overrides'] = {overrideName: copy.deepcopy(overridePitch, memo)
+                                       for overrideName, overridePitch in self._overrides.items()}
+            cacheEntry['pitches'] = tuple(copy.deepcopy(p, memo) for p in self.pitches)
+
 
     # PUBLIC PROPERTIES #
 
@@ -3643,6 +3911,68 @@ class Test(unittest.TestCase):
             # True, minor key:
             self.assertTrue(RomanNumeral(fig, 'a').isMixture())
 
+    def testFigureCache(self):
+        k = key.Key('B-')
+        clearCaches()
+        rn1 = RomanNumeral('V7[no3]', k)
+        rn2 = RomanNumeral('V7[no3]', k)
+        self.assertEqual(cacheStats()['figure']['hits'], 1)
+        self.assertEqual([p.nameWithOctave for p in rn2.pitches],
+                         [p.nameWithOctave for p in rn1.pitches])
+        self.assertIs(rn2.key, k)
+        self.assertEqual(rn2.root().name, 'F')
+        self.assertIn(rn2.root(), rn2.pitches)
+
+        # changing one does not change the other or the cache
+        rn1.pitches[0].octave = 1
+        rn1.omittedSteps.append(5)
+        rn3 = RomanNumeral('V7[no3]', k)
+        self.assertEqual(rn3.pitches[0].octave, rn2.pitches[0].octave)
+        self.assertNotEqual(rn3.pitches[0].octave, 1)
+        self.assertEqual(rn3.omittedSteps, [3])
+
+        # a different key is parsed anew
+        rn4 = RomanNumeral('V7[no3]', key.Key('b-'))
+        self.assertEqual(cacheStats()['figure']['misses'], 2)
+        self.assertEqual(rn4.figureAndKey, 'V7[no3] in b- minor')
+
+    def testFigureCacheDoesNotShareObjects(self):
+        k = key.Key('c')
+        clearCaches()
+        rn1 = RomanNumeral('bVII7/V', k)
+        rn2 = RomanNumeral('bVII7/V', k)
+        # only the figure and its secondary 'V' are parsed
+        self.assertEqual(cacheStats()['figure']['misses'], 2)
+        for attr in _MUTABLE_PARSED_FIGURE_ATTRIBUTES:
+            if getattr(rn1, attr) is not None:
+                self.assertIsNot(getattr(rn2, attr), getattr(rn1, attr), attr)
+
+        # changing the objects of one does not change the next one from the cache
+        rn1.secondaryRomanNumeralKey.tonic = pitch.Pitch('D')
+        rn2.secondaryRomanNumeral.figure = 'IV'
+        rn2.frontAlterationAccidental.set('sharp')
+        rn3 = RomanNumeral('bVII7/V', k)
+        self.assertEqual(rn3.secondaryRomanNumeralKey.tonic.name, 'G')
+        self.assertEqual(rn3.secondaryRomanNumeral.figure, 'V')
+        self.assertEqual(rn3.frontAlterationAccidental.name, 'flat')
+        self.assertEqual([p.name for p in rn3.pitches], ['F', 'A', 'C', 'E-'])
+
+    def testChordFigureCache(self):
+        clearCaches()
+        rn1 = romanNumeralFromChord(chord.Chord('E3 C4 G4 B-4'), key.Key('F'))
+        rn2 = romanNumeralFromChord(chord.Chord('E2 C3 G5 B-5'), key.Key('F'))
+        self.assertEqual(cacheStats()['chord']['hits'], 1)
+        self.assertEqual(rn1.figure, 'V65')
+        self.assertEqual(rn2.figure, 'V65')
+        self.assertEqual([p.nameWithOctave for p in rn2.pitches], ['E2', 'C3', 'G5', 'B-5'])
+
+        # found key is restored when no key is given
+        rn3 = romanNumeralFromChord(chord.Chord('E-4 G4 C#5'))
+        rn4 = romanNumeralFromChord(chord.Chord('E-3 G4 C#4'))
+        self.assertEqual(cacheStats()['chord']['hits'], 2)
+        self.assertEqual(rn4.figureAndKey, rn3.figureAndKey)
+        self.assertEqual(rn4.figureAndKey, 'It6 in g minor')
+
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
 
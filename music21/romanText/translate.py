@@ -146,10 +146,6 @@ environLocal = environment.Environment(_MOD)
 ROMANTEXT_VERSION = 1.0
 
 
-USE_RN_CACHE = False
-# Not currently using rnCache because of problems with PivotChords,
-# See mail from Dmitri, 30 September 2014
-
 # ------------------------------------------------------------------------------
 
 
@@ -315,10 +311,6 @@ def _getKeyAndPrefix(rtKeyOrString):
     return k, prefix
 
 
-# Cache each of the created keys so that we don't recreate them.
-_rnKeyCache = {}
-
-
 class PartTranslator:
     '''
     A refactoring of the previously massive romanTextToStreamScore function
@@ -804,20 +796,11 @@ class PartTranslator:
             #     if aSrc.lower().startswith('vi'):  # vi or vii w/ or w/o o
             #         if aSrc.upper() == a.src:  # VI or VII to bVI or bVII
             #             aSrc = 'b' + aSrc
-            cacheTuple = (aSrc, self.kCurrent.tonicPitchNameWithCase)
-            if USE_RN_CACHE and cacheTuple in _rnKeyCache:  # pragma: no cover
-                # print('Got a match: ' + str(cacheTuple))
-                # Problems with Caches not picking up pivot chords...
-                #    Not faster, see below.
-                rn = copy.deepcopy(_rnKeyCache[cacheTuple])
-            else:
-                # print('No match for: ' + str(cacheTuple))
-                rn = roman.RomanNumeral(aSrc,
-                                        copy.deepcopy(self.kCurrent),
-                                        sixthMinor=self.sixthMinor,
-                                        seventhMinor=self.seventhMinor,
-                                        )
-                _rnKeyCache[cacheTuple] = rn
+            rn = roman.RomanNumeral(aSrc,
+                                    copy.deepcopy(self.kCurrent),
+                                    sixthMinor=self.sixthMinor,
+                                    seventhMinor=self.seventhMinor,
+                                    )
             # surprisingly, not faster... and more dangerous
             # rn = roman.RomanNumeral(aSrc, kCurrent)
             # # SLOWEST!!!
@@ -78,7 +78,6 @@ from music21 import exceptions21
 from music21 import pitch
 from music21 import interval
 from music21 import sieve
-from music21.converter.subConverters import SubConverter
 
 _MOD = 'scale'
 environLocal = environment.Environment(_MOD)
@@ -619,6 +618,7 @@ class AbstractScale(Scale):
         if fmt is not None:
             fileFormat, unused_ext = common.findFormat(fmt)
             if fileFormat == 'scala':
+                from music21.converter.subConverters import SubConverter
                 returnedFilePath = self.write(fileFormat, direction=direction)
                 SubConverter().launch(returnedFilePath, fmt=fileFormat, app=app)
                 return
@@ -3469,7 +3469,7 @@ class Test(unittest.TestCase):
                          '[C1, D1, E1, F#1, G#1, A1, B1, C2, D2, E2, F#2, G#2, A2, B2, C3]')
 
         self.assertEqual(self.pitchOut(mm.getPitches('c1', 'c3', direction='descending')),
-                         '[C1, D1, E1, F1, G1, A1, B1, C2, D2, E2, F2, G2, A2, B2, C3]')
+                         '[C3, B2, A2, G2, F2, E2, D2, C2, B1, A1, G1, F1, E1, D1, C1]')
 
         self.assertEqual(self.pitchOut(mm.getPitches('a5', 'a6', direction='ascending')),
                          '[A5, B5, C6, D6, E6, F#6, G#6, A6]')
@@ -3605,7 +3605,7 @@ class Test(unittest.TestCase):
 
         self.assertEqual(str(sc.next('e-1', 'ascending', getNeighbor='descending')), 'F1')
 
-        self.assertEqual(str(sc.pitchFromDegree(1)), 'C1')
+        self.assertEqual(str(sc.pitchFromDegree(1)), 'C4')
         # there is no third step in ascending form
         self.assertEqual(str(sc.pitchFromDegree(3)), 'None')
         self.assertEqual(str(sc.pitchFromDegree(3, direction='descending')), 'E-4')
@@ -86,6 +86,42 @@ def _lte(a, b):
 # innerDict maps the repr of an interval object to a nameWithAccidental
 _transposePitchAndApplySimplificationCache = {}
 
+# realizations of deterministic networks, shared by all networks with the same
+# signature (see IntervalNetwork.signature), so that the many scales which are created
+# for the same kind of scale (for every Key, for instance) do not realize it anew.
+# maps (signature, direction, nodeId, pitchReference, minPitch, maxPitch,
+# includeFirst, alteredDegrees) to a tuple of (pitches, nodeIds).
+_realizationCache = common.LRUCache(maxSize=4096)
+
+# degree-to-pitch and pitch-to-degree tables for octave-duplicating deterministic
+# networks, see IntervalNetwork.getPitchFromNodeDegree and
+# IntervalNetwork._pitchToDegreeTable
+_degreeTableCache = common.LRUCache(maxSize=2048)
+
+# comparison attributes of pitches which do not depend on the octave
+_OCTAVE_FREE_ATTRIBUTES = ('name', 'pitchClass', 'step')
+# marks a value in a pitch-to-degree table that more than one degree has
+_AMBIGUOUS_DEGREE = 'ambiguous'
+
+
+def _alteredDegreesKey(alteredDegrees):
+    '''
+    Return a hashable version of an alteredDegrees dictionary, for cache keys.
+
+    >>> alteredDegrees = {7: {'direction': 'bi', 'interval': interval.Interval('-a1')}}
+    >>> scale.intervalNetwork._alteredDegreesKey(alteredDegrees)
+    ((7, 'bi', 'A-1', -100.0),)
+    >>> scale.intervalNetwork._alteredDegreesKey(None)
+    ()
+    '''
+    if not alteredDegrees:
+        return ()
+    return tuple(sorted((degree,
+                         alteration['direction'],
+                         alteration['interval'].directedName,
+                         alteration['interval'].cents)
+                        for degree, alteration in alteredDegrees.items()))
+
 
 class EdgeException(exceptions21.Music21Exception):
     pass
@@ -419,12 +455,12 @@ class IntervalNetwork:
         # could be 'simplifyEnharmonic', 'mostCommon' or None
         self.pitchSimplification = pitchSimplification
 
-        # store segments
-        self._ascendingCache = OrderedDict()
-        self._descendingCache = OrderedDict()
         # store min/max, as this is evaluated before getting cache values
         self._minMaxCache = OrderedDict()
         self._nodeDegreeDictionaryCache = {}
+        # nodes and edges part of signature; realized segments are stored in
+        # the module-level _realizationCache under the signature.
+        self._structureSignature = None
 
     def clear(self):
         '''
@@ -434,9 +470,8 @@ class IntervalNetwork:
         self.nodeIdCount = 0
         self.edges = OrderedDict()
         self.nodes = OrderedDict()
-        self._ascendingCache = OrderedDict()
-        self._descendingCache = OrderedDict()
         self._nodeDegreeDictionaryCache = {}
+        self._structureSignature = None
 
     def __eq__(self, other):
         '''
@@ -460,8 +495,54 @@ class IntervalNetwork:
         '''
         # compare all nodes and edges; if the same, and all keys are the same,
         # then matched
-        return (isinstance(other, self.__class__)
-                and self.__dict__ == other.__dict__)
+        if not isinstance(other, self.__class__):
+            return False
+        cacheAttributes = ('_minMaxCache', '_nodeDegreeDictionaryCache', '_structureSignature')
+        selfDict = {k: v for k, v in self.__dict__.items() if k not in cacheAttributes}
+        otherDict = {k: v for k, v in other.__dict__.items() if k not in cacheAttributes}
+        return selfDict == otherDict
+
+    @property
+    def signature(self):
+        '''
+        A hashable description of the nodes, edges, and settings of this network.
+        Networks with the same signature realize the same pitches, so they
+        share cached realizations.
+
+        The nodes and edges are only read again after the network is refilled
+        (or `clear` is called), so do not change them directly after realizing.
+
+        >>> net1 = scale.intervalNetwork.IntervalNetwork(['M2', 'M2', 'm2'])
+        >>> net2 = scale.intervalNetwork.IntervalNetwork(['M2', 'M2', 'm2'])
+        >>> net3 = scale.intervalNetwork.IntervalNetwork(['M2', 'm2', 'M2'])
+        >>> net1.signature == net2.signature
+        True
+        >>> net1.signature == net3.signature
+        False
+        >>> net2.octaveDuplicating = True
+        >>> net1.signature == net2.signature
+        False
+
+        Networks pickled before signatures existed compute theirs when first asked:
+
+        >>> del net3._structureSignature
+        >>> net3.signature == scale.intervalNetwork.IntervalNetwork(['M2', 'm2', 'M2']).signature
+        True
+        '''
+        # getattr: networks unpickled from older caches lack the attribute
+        if getattr(self, '_structureSignature', None) is None:
+            nodeSignature = tuple((n.id, n.degree, n.weight) for n in self.nodes.values())
+            edgeSignature = tuple((e.interval.directedName,
+                                   e.interval.cents,
+                                   e.direction,
+                                   e.weight,
+                                   tuple(e._connections))
+                                  for e in self.edges.values())
+            self._structureSignature = (nodeSignature, edgeSignature)
+        return (self._structureSignature,
+                self.octaveDuplicating,
+                self.deterministic,
+                self.pitchSimplification)
 
     def fillBiDirectedEdges(self, edgeList):
         '''
@@ -1302,9 +1383,14 @@ class IntervalNetwork:
     # TODO: need to collect intervals as well
 
     def _getCacheKey(self, nodeObj, pitchReference, minPitch, maxPitch,
-                     includeFirst=None):
+                     includeFirst=None, direction=DIRECTION_ASCENDING, alteredDegrees=None):
         '''
         Return key for caching based on critical components.
+
+        >>> net = scale.intervalNetwork.IntervalNetwork(['M2', 'M2', 'm2'])
+        >>> ck = net._getCacheKey(net.terminusLowNodes[0], pitch.Pitch('C4'), None, None)
+        >>> ck[1:]
+        ('ascending', 'terminusLow', 'C4', None, None, None, ())
         '''
         if minPitch is not None:
             minKey = minPitch.nameWithOctave
@@ -1315,8 +1401,8 @@ class IntervalNetwork:
             maxKey = maxPitch.nameWithOctave
         else:
             maxKey = None
-        return (nodeObj.id, pitchReference.nameWithOctave,
-                minKey, maxKey, includeFirst)
+        return (self.signature, direction, nodeObj.id, pitchReference.nameWithOctave,
+                minKey, maxKey, includeFirst, _alteredDegreesKey(alteredDegrees))
 
     def realizeAscending(
             self,
@@ -1386,9 +1472,13 @@ class IntervalNetwork:
             ck = self._getCacheKey(nodeObj,
                                    pitchReference,
                                    minPitch,
-                                   maxPitch)
-            if ck in self._ascendingCache:
-                return self._ascendingCache[ck]
+                                   maxPitch,
+                                   direction=DIRECTION_ASCENDING,
+                                   alteredDegrees=alteredDegrees)
+            cached = _realizationCache.get(ck)
+            if cached is not None:
+                # copies, since callers may alter the lists or the pitches in them
+                return [copy.deepcopy(p) for p in cached[0]], list(cached[1])
         else:
             ck = None
 
@@ -1473,7 +1563,8 @@ class IntervalNetwork:
 
         # store in cache
         if self.deterministic:
-            self._ascendingCache[ck] = post, postNodeId
+            _realizationCache[ck] = (tuple(copy.deepcopy(p) for p in post),
+                                     tuple(postNodeId))
 
         # environLocal.printDebug(['realizeAscending()', 'post', post, 'postNodeId', postNodeId])
 
@@ -1580,9 +1671,12 @@ class IntervalNetwork:
                                    pitchReference,
                                    minPitch,
                                    maxPitch,
-                                   includeFirst)
-            if ck in self._descendingCache:
-                return self._descendingCache[ck]
+                                   (includeFirst, reverse),
+                                   direction=DIRECTION_DESCENDING,
+                                   alteredDegrees=alteredDegrees)
+            cached = _realizationCache.get(ck)
+            if cached is not None:
+                return [copy.deepcopy(p) for p in cached[0]], list(cached[1])
 
         # if this network is octaveDuplicating, than we can shift
         # reference down octaves to just above minPitch
@@ -1662,7 +1756,8 @@ class IntervalNetwork:
 
         # store in cache
         if self.deterministic:
-            self._descendingCache[ck] = pre, preNodeId
+            _realizationCache[ck] = (tuple(copy.deepcopy(p) for p in pre),
+                                     tuple(preNodeId))
 
         return pre, preNodeId
 
@@ -2513,6 +2608,20 @@ class IntervalNetwork:
         1
 
         '''
+        if comparisonAttribute in _OCTAVE_FREE_ATTRIBUTES and not alteredDegrees:
+            table = self._pitchToDegreeTable(pitchReference,
+                                             nodeName,
+                                             comparisonAttribute,
+                                             direction)
+            if table is not None:
+                if isinstance(pitchTarget, str):
+                    pitchTarget = pitch.Pitch(pitchTarget)
+                elif 'Note' in pitchTarget.classes:
+                    pitchTarget = pitchTarget.pitch
+                degree = table.get(getattr(pitchTarget, comparisonAttribute), None)
+                if degree is not _AMBIGUOUS_DEGREE:
+                    return degree
+
         nId = self.getRelativeNodeId(
             pitchReference=pitchReference,
             nodeName=nodeName,
@@ -2526,6 +2635,94 @@ class IntervalNetwork:
         else:
             return self.nodeIdToDegree(nId)
 
+    def _degreeTableKey(self, tableType, pitchReference, nodeName, *extra):
+        '''
+        Return the key in _degreeTableCache for a table of type `tableType`
+        for this network, with `pitchReference` assigned to `nodeName`,
+        or None if no table can be used: degree tables are only kept for
+        octave-duplicating, deterministic networks, for which the octave of
+        `pitchReference` only shifts the octave of every pitch realized.
+
+        >>> net = scale.intervalNetwork.IntervalNetwork(['M2', 'M2', 'm2', 'M2', 'M2', 'M2', 'm2'],
+        ...                                             octaveDuplicating=True)
+        >>> net._degreeTableKey('degreeFromPitch', pitch.Pitch('E-3'), 1, 'name')[2:]
+        ('E-', 1, 'name')
+        >>> net.octaveDuplicating = False
+        >>> net._degreeTableKey('degreeFromPitch', pitch.Pitch('E-3'), 1, 'name') is None
+        True
+        '''
+        if pitchReference is None or not (self.octaveDuplicating and self.deterministic):
+            return None
+        if isinstance(pitchReference, str):
+            pitchReference = pitch.Pitch(pitchReference)
+        microtone = pitchReference._microtone
+        if microtone is not None and microtone.cents != 0:
+            return None
+        if isinstance(nodeName, Node):
+            nodeName = nodeName.id
+        return (tableType, self.signature, pitchReference.name, nodeName) + extra
+
+    def _pitchToDegreeTable(self, pitchReference, nodeName, comparisonAttribute, direction):
+        '''
+        Return a dictionary mapping the value of `comparisonAttribute` (one of
+        'name', 'pitchClass', or 'step') for every pitch realized from
+        `pitchReference` assigned to `nodeName` to its node degree, as
+        :meth:`getRelativeNodeDegree` would find it; values shared by nodes of
+        different degrees map to _AMBIGUOUS_DEGREE.  Returns None if the network
+        does not allow such a table.
+
+        Tables are shared by all networks with the same signature.
+
+        >>> net = scale.intervalNetwork.IntervalNetwork(['M2', 'M2', 'm2', 'M2', 'M2', 'M2', 'm2'],
+        ...                                             octaveDuplicating=True)
+        >>> table = net._pitchToDegreeTable('e-2', 1, 'name', 'ascending')
+        >>> table['D']
+        7
+        >>> table['E-']
+        1
+        >>> 'E' in table
+        False
+        '''
+        tableKey = self._degreeTableKey('degreeFromPitch', pitchReference, nodeName,
+                                        comparisonAttribute, direction)
+        if tableKey is None:
+            return None
+        table = _degreeTableCache.get(tableKey)
+        if table is not None:
+            return table
+
+        if isinstance(pitchReference, str):
+            pitchReference = pitch.Pitch(pitchReference)
+        else:
+            pitchReference = copy.deepcopy(pitchReference)
+        if pitchReference.octave is None:
+            pitchReference.octave = pitchReference.implicitOctave
+        if nodeName is None:
+            nodeObj = self.getTerminusLowNodes()[0]
+        else:
+            nodeObj = self.nodeNameToNodes(nodeName)[0]
+
+        # two octaves realize every node, as getRelativeNodeId does around its target
+        realizedPitches, realizedNodes = self.realize(
+            pitchReference,
+            nodeObj,
+            minPitch=pitchReference.transpose(-12, inPlace=False),
+            maxPitch=pitchReference.transpose(12, inPlace=False),
+            direction=direction)
+
+        degrees = {}
+        for p, nId in zip(realizedPitches, realizedNodes):
+            degrees.setdefault(getattr(p, comparisonAttribute), set()).add(
+                self.nodeIdToDegree(nId))
+        table = {}
+        for value, degreeSet in degrees.items():
+            if len(degreeSet) == 1:
+                table[value] = degreeSet.pop()
+            else:
+                table[value] = _AMBIGUOUS_DEGREE
+        _degreeTableCache[tableKey] = table
+        return table
+
     def getPitchFromNodeDegree(self,
                                pitchReference,
                                nodeName,
@@ -2568,6 +2765,58 @@ class IntervalNetwork:
         >>> net.getPitchFromNodeDegree('c', 1, 6, 'descending')
         <music21.pitch.Pitch A-4>
         '''
+        table = None
+        if minPitch is None and maxPitch is None and not alteredDegrees:
+            tableKey = self._degreeTableKey('pitchFromDegree', pitchReference, nodeName,
+                                            direction, equateTermini)
+            if tableKey is not None:
+                table = _degreeTableCache.get(tableKey)
+                if table is None:
+                    table = {}
+                    _degreeTableCache[tableKey] = table
+
+        if table is not None:
+            # the pitch is found by degree from the table, shifted to the octave of
+            # pitchReference; the table is filled as degrees are looked up.
+            if isinstance(pitchReference, str):
+                pitchReference = pitch.Pitch(pitchReference)
+            referenceOctave = pitchReference.octave
+            if referenceOctave is None:
+                referenceOctave = pitchReference.implicitOctave
+            try:
+                name, octaveShift = table[nodeDegreeTarget]
+                post = pitch.Pitch(name)
+                post.octave = referenceOctave + octaveShift
+                return post
+            except KeyError:
+                pass
+
+        post = self._getPitchFromNodeDegreeByRealization(pitchReference,
+                                                         nodeName,
+                                                         nodeDegreeTarget,
+                                                         direction=direction,
+                                                         minPitch=minPitch,
+                                                         maxPitch=maxPitch,
+                                                         alteredDegrees=alteredDegrees,
+                                                         equateTermini=equateTermini)
+        if (table is not None
+                and post is not None
+                and (post._microtone is None or post._microtone.cents == 0)):
+            table[nodeDegreeTarget] = (post.name, post.octave - referenceOctave)
+        return post
+
+    def _getPitchFromNodeDegreeByRealization(self,
+                                             pitchReference,
+                                             nodeName,
+                                             nodeDegreeTarget,
+                                             direction=DIRECTION_ASCENDING,
+                                             minPitch=None,
+                                             maxPitch=None,
+                                             alteredDegrees=None,
+                                             equateTermini=True):
+        '''
+        Does the work of :meth:`getPitchFromNodeDegree` by realizing the network.
+        '''
         # these are the reference node -- generally one except for bidirectional
         # scales.
         nodeListForNames = self.nodeNameToNodes(nodeName)
@@ -3508,6 +3757,44 @@ class Test(unittest.TestCase):
                 getNeighbor='descending')),
             'A-4')
 
+    def testDegreeTables(self):
+        from music21 import scale
+        edgeList = ['M2', 'M2', 'm2', 'M2', 'M2', 'M2', 'm2']
+        net = IntervalNetwork(edgeList, octaveDuplicating=True)
+        uncached = IntervalNetwork(edgeList, octaveDuplicating=True)
+        # a network which is not deterministic never uses the tables
+        uncached.deterministic = False
+
+        for ref in ('e-2', 'b-', 'c-3'):
+            for direction in (DIRECTION_ASCENDING, DIRECTION_DESCENDING):
+                for unused_repeat in range(2):  # second time from the tables
+                    for degree in range(1, 9):
+                        self.assertEqual(
+                            net.getPitchFromNodeDegree(ref, 1, degree, direction=direction),
+                            uncached.getPitchFromNodeDegree(ref, 1, degree,
+                                                            direction=direction))
+                    for target in ('c', 'c#', 'd-', 'e', 'e-', 'f#', 'g', 'b-', 'c-'):
+                        for attr in ('name', 'pitchClass', 'step'):
+                            self.assertEqual(
+                                net.getRelativeNodeDegree(ref, 1, target,
+                                                          comparisonAttribute=attr,
+                                                          direction=direction),
+                                uncached.getRelativeNodeDegree(ref, 1, target,
+                                                               comparisonAttribute=attr,
+                                                               direction=direction))
+
+        sc = scale.MelodicMinorScale('a3')
+        self.assertEqual(str(sc.pitchFromDegree(6, direction=DIRECTION_ASCENDING)), 'F#4')
+        self.assertEqual(str(sc.pitchFromDegree(6, direction=DIRECTION_DESCENDING)), 'F4')
+        self.assertEqual(sc.getScaleDegreeFromPitch('g#', direction=DIRECTION_DESCENDING), None)
+        self.assertEqual(sc.getScaleDegreeFromPitch('g', direction=DIRECTION_DESCENDING), 7)
+
+        # pitches returned from tables are new objects
+        sc = scale.MajorScale('d4')
+        p1 = sc.pitchFromDegree(3)
+        p1.octave = 1
+        self.assertEqual(str(sc.pitchFromDegree(3)), 'F#4')
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
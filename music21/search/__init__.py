@@ -15,7 +15,7 @@ For searching a group of scores see the search functions within
 :ref:`moduleCorpus` .
 '''
 __all__ = [
-    'base', 'lyrics', 'segment', 'serial',
+    'base', 'lyrics', 'melodicIndex', 'segment', 'serial',
 
     'Wildcard', 'WildcardDuration', 'SearchMatch', 'StreamSearcher',
     'streamSearchBase', 'rhythmicSearch', 'noteNameSearch', 'noteNameRhythmicSearch',
@@ -34,6 +34,7 @@ __all__ = [
 
 from music21.search import base
 from music21.search import lyrics
+from music21.search import melodicIndex
 from music21.search import segment
 from music21.search import serial
 
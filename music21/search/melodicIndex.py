@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         search/melodicIndex.py
+# Purpose:      Persistent n-gram index of melodies for searching a whole corpus
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2021 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+An inverted index from melodic n-grams to the parts of the scores of a corpus
+that contain them, kept in a local SQLite database, so that a melody can be
+found anywhere in a corpus in milliseconds, without parsing any scores.
+
+Each part is stored as the string made by
+:func:`~music21.search.base.translateIntervalsAndSpeed`
+(one character per note, giving the chromatic interval from the previous note
+and whether it is faster, slower, or the same speed),
+so searches are independent of transposition and can optionally ignore rhythm.
+
+Indices for the corpora are built alongside the metadata cache with
+:meth:`~music21.corpus.corpora.Corpus.cacheMelodicIndex` and searched with
+`corpus.melodicSearch`:
+
+>>> #_DOCS_SHOW corpus.corpora.CoreCorpus().cacheMelodicIndex()  # once; slow
+>>> #_DOCS_SHOW corpus.melodicSearch('tinyNotation: 4/4 c4 d e f g')
+[<MelodicIndexMatch bach/bwv1.6.mxl part 0, m. 3>, ...]
+
+An index can also be filled with Streams directly:
+
+>>> mi = search.melodicIndex.MelodicIndex(':memory:')
+>>> mi.addStream(converter.parse('tinyNotation: 4/4 c4 d e f g1 g4 f e d c1'),
+...              'scale.txt')
+>>> mi.addStream(converter.parse('tinyNotation: 4/4 d4 e8 f# g4 a1'), 'dScale.txt')
+>>> mi.search("tinyNotation: 4/4 g4 a b c'")
+[<MelodicIndexMatch scale.txt part 0, m. 1>, <MelodicIndexMatch dScale.txt part 0, m. 1>]
+>>> mi.search("tinyNotation: 4/4 g4 a b c'", matchRhythm=True)
+[<MelodicIndexMatch scale.txt part 0, m. 1>]
+>>> mi.search('tinyNotation: 4/4 g4 f e')
+[<MelodicIndexMatch scale.txt part 0, m. 3>]
+'''
+from collections import namedtuple
+import json
+import os
+import pathlib
+import sqlite3
+import unittest
+
+from music21 import common
+from music21 import exceptions21
+from music21.search.base import translateIntervalsAndSpeed
+
+from music21 import environment
+_MOD = 'search.melodicIndex'
+environLocal = environment.Environment(_MOD)
+
+# number of intervals in each indexed n-gram; queries with fewer intervals
+# than this are still found, but by scanning every part.
+NGRAM_LENGTH = 4
+
+# maps each character made by translateIntervalsAndSpeed to the character
+# for the same interval at the same speed, so that rhythm can be ignored
+_IGNORE_RHYTHM = str.maketrans({chr(46 + shift + pd): chr(73 + pd)
+                                for shift in (0, 27, 54)
+                                for pd in range(-13, 14)})
+
+
+class MelodicIndexException(exceptions21.Music21Exception):
+    pass
+
+
+class MelodicIndexMatch(namedtuple('MelodicIndexMatch',
+                                   'sourcePath number partNumber measureNumber opusIndex')):
+    '''
+    The location of one match found by :meth:`MelodicIndex.search`: the path of the file,
+    the number of the work within it (for opus files, otherwise None),
+    the index of the part (from 0), the measure number of the first matching note,
+    and, for a work in an opus that has no number of its own, its index in the
+    opus (from 0; otherwise None).
+
+    >>> search.melodicIndex.MelodicIndexMatch('essenFolksong/teste.abc', None, 0, 3, 1)
+    <MelodicIndexMatch essenFolksong/teste.abc [1] part 0, m. 3>
+    '''
+    __slots__ = ()
+
+    def __new__(cls, sourcePath, number, partNumber, measureNumber, opusIndex=None):
+        return super().__new__(cls, sourcePath, number, partNumber, measureNumber, opusIndex)
+
+    def __repr__(self):
+        number = '' if self.number is None else f' #{self.number}'
+        if self.opusIndex is not None:
+            number += f' [{self.opusIndex}]'
+        return (f'<MelodicIndexMatch {self.sourcePath}{number} '
+                + f'part {self.partNumber}, m. {self.measureNumber}>')
+
+    def parse(self):
+        '''
+        Parse the score that this match was found in.
+        '''
+        from music21 import corpus
+        from music21 import stream
+        if self.opusIndex is not None:
+            return corpus.parse(self.sourcePath).scores[self.opusIndex]
+        s = corpus.parse(self.sourcePath, number=self.number)
+        if self.number is None or not isinstance(s, stream.Opus):
+            return s
+        # only some formats can parse a single work from an opus; find it here
+        for score in s.scores:
+            md = score.metadata
+            if md is not None and md.number is not None and str(md.number) == str(self.number):
+                return score
+        return s
+
+
+def ignoreRhythm(encoded):
+    '''
+    Given a string from translateIntervalsAndSpeed, return the same string with
+    all notes encoded as being the same speed as the previous note.
+
+    >>> s = converter.parse('tinyNotation: 4/4 c4 d8 e f2 r4 g4')
+    >>> search.melodicIndex.ignoreRhythm(search.translateIntervalsAndSpeed(s.flat.notesAndRests))
+    'IGGH G'
+    >>> search.melodicIndex.ignoreRhythm(search.translateIntervalsAndSpeed(
+    ...     converter.parse('tinyNotation: 4/4 c4 d e f r g').flat.notesAndRests))
+    'IGGH G'
+    '''
+    return encoded.translate(_IGNORE_RHYTHM)
+
+
+def encodeScore(score):
+    '''
+    Returns a list of (encoded, measureNumbers) tuples, one for each part of `score`
+    (or just one if `score` has no parts),
+    where `encoded` is the string from translateIntervalsAndSpeed and `measureNumbers`
+    the measure number of each of its characters.
+
+    >>> s = converter.parse('tinyNotation: 4/4 c2 d e f g1')
+    >>> search.melodicIndex.encodeScore(s)
+    [('IGGH,', [1, 1, 2, 2, 3])]
+    '''
+    parts = list(score.parts) if score.hasPartLikeStreams() else [score]
+    return [translateIntervalsAndSpeed(p.recurse().notesAndRests, returnMeasures=True)
+            for p in parts]
+
+
+def _encodeQuery(query):
+    '''
+    Encode a query (a string to parse, or a Stream or list of notes and rests) as
+    translateIntervalsAndSpeed does, leaving off the first character, which
+    says nothing about the notes.
+
+    >>> search.melodicIndex._encodeQuery('tinyNotation: 4/4 c4 d e8 f')
+    'GbH'
+    '''
+    from music21 import converter
+    from music21 import stream
+
+    if isinstance(query, str):
+        query = converter.parse(query)
+    if isinstance(query, stream.Stream):
+        query = query.flat.notesAndRests
+    encoded = translateIntervalsAndSpeed(query)
+    return encoded[1:].strip()
+
+
+class MelodicIndex:
+    '''
+    A persistent index of the melodies of many scores.
+
+    If `fp` is None, the index is kept in the music21 scratch directory.
+    Pass ':memory:' for an index that lasts only as long as this object.
+
+    >>> mi = search.melodicIndex.MelodicIndex(':memory:')
+    >>> len(mi)
+    0
+    >>> mi.addStream(corpus.parse('bwv66.6'), 'bach/bwv66.6.mxl')
+    >>> len(mi)
+    4
+    >>> mi.search(corpus.parse('bwv66.6').parts[0].measure(1).notes)
+    [<MelodicIndexMatch bach/bwv66.6.mxl part 0, m. 1>]
+    '''
+    def __init__(self, fp=None):
+        if fp is None:
+            fp = environLocal.getRootTempDir() / 'm21MelodicIndex.sqlite'
+        self.filePath = fp
+        self.ngramLength = NGRAM_LENGTH
+        self._connection = sqlite3.connect(str(fp))
+        self._connection.executescript(
+            'CREATE TABLE IF NOT EXISTS files ('
+            'sourcePath TEXT PRIMARY KEY, '
+            'modified REAL); '
+            'CREATE TABLE IF NOT EXISTS parts ('
+            'partId INTEGER PRIMARY KEY, '
+            'sourcePath TEXT NOT NULL, '
+            'number TEXT, '
+            'opusIndex INTEGER, '
+            'partNumber INTEGER NOT NULL, '
+            'encoded TEXT NOT NULL, '
+            'intervals TEXT NOT NULL, '
+            'measures TEXT NOT NULL); '
+            'CREATE INDEX IF NOT EXISTS partsBySource ON parts (sourcePath); '
+            'CREATE TABLE IF NOT EXISTS postings ('
+            'ngram TEXT NOT NULL, '
+            'partId INTEGER NOT NULL); '
+            'CREATE INDEX IF NOT EXISTS postingsByNgram ON postings (ngram); '
+        )
+        self._connection.commit()
+
+    def __len__(self):
+        '''
+        The number of parts in the index.
+        '''
+        return self._connection.execute('SELECT COUNT(*) FROM parts').fetchone()[0]
+
+    def close(self):
+        self._connection.close()
+
+    def clear(self):
+        '''
+        Remove everything from the index.
+        '''
+        self._connection.executescript(
+            'DELETE FROM files; DELETE FROM parts; DELETE FROM postings;')
+        self._connection.commit()
+
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _sourceKey(sourcePath):
+        '''
+        Paths within the corpus are stored relative to it, everything else
+        as given.
+        '''
+        sourcePath = pathlib.Path(sourcePath)
+        try:
+            sourcePath = sourcePath.relative_to(common.getCorpusFilePath())
+        except ValueError:
+            pass
+        return sourcePath.as_posix()
+
+    def needsIndexing(self, sourcePath):
+        '''
+        Returns True if the file at `sourcePath` is not in the index or has been
+        modified since it was indexed.
+
+        >>> mi = search.melodicIndex.MelodicIndex(':memory:')
+        >>> mi.needsIndexing('bach/bwv66.6.mxl')
+        True
+        '''
+        row = self._connection.execute('SELECT modified FROM files WHERE sourcePath = ?',
+                                       (self._sourceKey(sourcePath),)).fetchone()
+        if row is None:
+            return True
+        try:
+            return os.stat(sourcePath).st_mtime != row[0]
+        except OSError:
+            return False
+
+    def addEncodings(self, sourcePath, encodingsByNumber):
+        '''
+        Store the encoded parts of the file at `sourcePath`, replacing whatever
+        was stored for it before.
+
+        `encodingsByNumber` is a list of (number, opusIndex, encodings) triples,
+        where `number` is the number of a work within an opus (or None), `opusIndex`
+        the zero-indexed place in the opus of a work without a number (or None),
+        and `encodings` is a list as returned by :func:`encodeScore`.
+        '''
+        key = self._sourceKey(sourcePath)
+        try:
+            modified = os.stat(sourcePath).st_mtime
+        except OSError:
+            modified = None
+
+        connection = self._connection
+        connection.execute(
+            'DELETE FROM postings WHERE partId IN '
+            '(SELECT partId FROM parts WHERE sourcePath = ?)', (key,))
+        connection.execute('DELETE FROM parts WHERE sourcePath = ?', (key,))
+        connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?)', (key, modified))
+
+        n = self.ngramLength
+        for number, opusIndex, encodings in encodingsByNumber:
+            if number is not None:
+                number = str(number)
+            for partNumber, (encoded, measures) in enumerate(encodings):
+                intervals = ignoreRhythm(encoded)
+                cursor = connection.execute(
+                    'INSERT INTO parts (sourcePath, number, opusIndex, partNumber, '
+                    'encoded, intervals, measures) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, number, opusIndex, partNumber, encoded, intervals,
+                     json.dumps(measures)))
+                partId = cursor.lastrowid
+                ngrams = {intervals[i:i + n] for i in range(1, len(intervals) - n + 1)}
+                connection.executemany('INSERT INTO postings VALUES (?, ?)',
+                                       [(ng, partId) for ng in ngrams])
+        connection.commit()
+
+    def addStream(self, streamObj, sourcePath, number=None, opusIndex=None):
+        '''
+        Index a Score (or any Stream) as if it were the file at `sourcePath`.
+        '''
+        self.addEncodings(sourcePath, [(number, opusIndex, encodeScore(streamObj))])
+
+    # --------------------------------------------------------------------------
+    def _candidatePartIds(self, intervals):
+        '''
+        Returns the ids of the parts that contain the rarest of the n-grams in
+        `intervals`, or None if `intervals` is too short to have any n-grams.
+        '''
+        n = self.ngramLength
+        ngrams = {intervals[i:i + n] for i in range(len(intervals) - n + 1)}
+        if not ngrams:
+            return None
+        execute = self._connection.execute
+        rarest = min(ngrams, key=lambda ng: execute(
+            'SELECT COUNT(*) FROM postings WHERE ngram = ?', (ng,)).fetchone()[0])
+        return [row[0] for row in execute(
+            'SELECT partId FROM postings WHERE ngram = ?', (rarest,))]
+
+    def search(self, query, matchRhythm=False):
+        '''
+        Find every place in the index where the melody `query` appears, in any
+        transposition, returning a list of :class:`MelodicIndexMatch` objects.
+
+        `query` can be a Stream, a list of notes and rests, or anything that
+        `converter.parse` accepts (such as a tinyNotation string).
+
+        If `matchRhythm` is True, then each note of the match must also be faster,
+        slower, or the same speed as the previous note just as in `query`.
+        '''
+        encodedQuery = _encodeQuery(query)
+        if not encodedQuery:
+            raise MelodicIndexException('the query must have at least two notes')
+        if matchRhythm:
+            column = 'encoded'
+            target = encodedQuery
+        else:
+            column = 'intervals'
+            target = ignoreRhythm(encodedQuery)
+
+        candidates = self._candidatePartIds(ignoreRhythm(encodedQuery))
+        sql = ('SELECT sourcePath, number, opusIndex, partNumber, '
+               + f'{column}, measures FROM parts')
+        if candidates is None:
+            rows = self._connection.execute(sql + ' WHERE instr(intervals, ?) > 0',
+                                            (ignoreRhythm(encodedQuery),))
+        else:
+            rows = []
+            for i in range(0, len(candidates), 500):
+                chunk = candidates[i:i + 500]
+                rows.extend(self._connection.execute(
+                    sql + f" WHERE partId IN ({','.join('?' * len(chunk))}) ORDER BY partId",
+                    chunk))
+
+        matches = []
+        for sourcePath, number, opusIndex, partNumber, encoded, measures in rows:
+            measureList = None
+            position = encoded.find(target, 1)  # the first character is not a note
+            while position != -1:
+                if measureList is None:
+                    measureList = json.loads(measures)
+                # the first note of the match comes before the first interval,
+                # skipping over any rest in between.
+                start = position - 1
+                while start > 0 and encoded[start] == ' ':
+                    start -= 1
+                matches.append(MelodicIndexMatch(sourcePath, number, partNumber,
+                                                 measureList[start], opusIndex))
+                position = encoded.find(target, position + 1)
+        return matches
+
+
+# ------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def testRests(self):
+        from music21 import converter
+
+        mi = MelodicIndex(':memory:')
+        mi.addStream(converter.parse('tinyNotation: 4/4 c4 d e f r1 g4 a b c'), 'a.txt')
+        # matches continue across a rest only if the query has one too
+        self.assertEqual(mi.search('tinyNotation: 4/4 e4 f g a'), [])
+        self.assertEqual(len(mi.search('tinyNotation: 4/4 e4 f r g a')), 1)
+        # the match starts on the first note, not the rest
+        self.assertEqual(mi.search('tinyNotation: 4/4 f4 r g a b')[0].measureNumber, 1)
+
+    def testReplaceOnReindex(self):
+        from music21 import converter
+
+        mi = MelodicIndex(':memory:')
+        mi.addStream(converter.parse('tinyNotation: 4/4 c4 d e f g a b c'), 'a.txt')
+        self.assertEqual(len(mi.search('tinyNotation: 4/4 c4 d e f g')), 1)
+        mi.addStream(converter.parse('tinyNotation: 4/4 c4 e g c'), 'a.txt')
+        self.assertEqual(len(mi), 1)
+        self.assertEqual(mi.search('tinyNotation: 4/4 c4 d e f g'), [])
+        self.assertEqual(len(mi.search('tinyNotation: 4/4 d4 f# a d')), 1)
+
+    def testOpusIndexKeptApartFromNumber(self):
+        from music21 import converter
+
+        mi = MelodicIndex(':memory:')
+        mi.addEncodings('o.abc', [
+            (None, 0, encodeScore(converter.parse('tinyNotation: 4/4 c4 d e f'))),
+            ('0', None, encodeScore(converter.parse('tinyNotation: 4/4 g4 a b c'))),
+        ])
+        unnumbered, = mi.search('tinyNotation: 4/4 c4 d e f')
+        self.assertIsNone(unnumbered.number)
+        self.assertEqual(unnumbered.opusIndex, 0)
+        numbered, = mi.search('tinyNotation: 4/4 g4 a b c')
+        self.assertEqual(numbered.number, '0')
+        self.assertIsNone(numbered.opusIndex)
+
+    def testAgreesWithScan(self):
+        '''
+        searching the index finds the same places as scanning each part.
+        '''
+        from music21 import corpus
+
+        mi = MelodicIndex(':memory:')
+        paths = ['bach/bwv66.6', 'bach/bwv84.5', 'bach/bwv267']
+        scores = {p: corpus.parse(p) for p in paths}
+        for p, s in scores.items():
+            mi.addStream(s, p)
+        query = scores['bach/bwv66.6'].parts[3].measure(2).notes
+        queryIntervals = ignoreRhythm(_encodeQuery(query))
+        expected = []
+        for p, s in scores.items():
+            for partNumber, (encoded, unused_measures) in enumerate(encodeScore(s)):
+                if queryIntervals in ignoreRhythm(encoded)[1:]:
+                    expected.append((p, partNumber))
+        found = [(m.sourcePath, m.partNumber) for m in mi.search(query)]
+        self.assertTrue(expected)
+        self.assertEqual(sorted(set(found)), sorted(expected))
+
+
+# define presented order in documentation
+_DOC_ORDER = [MelodicIndex, MelodicIndexMatch, encodeScore, ignoreRhythm]
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
@@ -22,4 +22,12 @@ from music21.stream import filters
 from music21.stream import iterator
 from music21.stream import makeNotation
 from music21.stream import streamStatus
-from music21.stream import tests
+
+
+def __getattr__(name):
+    # stream.tests imports musicxml, midi and corpus, which themselves import
+    # stream, so it is only loaded when first asked for.
+    if name == 'tests':
+        import importlib
+        return importlib.import_module('music21.stream.tests')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -46,7 +46,7 @@ from music21 import key
 from music21 import metadata
 from music21 import meter
 from music21 import note
-from music21 import pitch  # for typing
+from music21 import pitch
 from music21 import tie
 from music21 import repeat
 from music21 import sites
@@ -5990,10 +5990,12 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             if 0 not in allTimePoints:
                 allTimePoints = (0,) + allTimePoints
 
-            for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
+            # one sweep through the tree, rather than a search for each verticality
+            verticalities = timespanTree.iterateVerticalitiesAt(allTimePoints)
+            for vert, endTime in zip(verticalities, allTimePoints[1:]):
+                offset = vert.offset
                 if common.almostEquals(offset, endTime):
                     continue
-                vert = timespanTree.getVerticalityAt(offset)
                 quarterLength = endTime - offset
                 if quarterLength < 0:
                     environLocal.warn(
@@ -6034,6 +6036,27 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             rNew.duration.quarterLength = totalDuration
             templateInner.insert(startOffset, rNew)
 
+        def scoreMeasureSlices(scoreObj):
+            '''
+            Yield for each measure index what scoreObj.measure(i, collect=(),
+            indicesNotNumbers=True) would return (without spanners,
+            which are not chordified).
+            '''
+            parts = list(scoreObj.getElementsByClass('Part'))
+            partMeasures = [list(p.getElementsByClass('Measure')) for p in parts]
+            i = 0
+            while True:
+                measureSlice = scoreObj.__class__()
+                measureSlice.mergeAttributes(scoreObj)
+                for p, measures in zip(parts, partMeasures):
+                    mStream = p.cloneEmpty(derivationMethod='measures')
+                    if i < len(measures):
+                        mStream.coreInsert(0, measures[i])
+                        mStream.coreElementsChanged()
+                    measureSlice.insert(0, mStream)
+                yield measureSlice
+                i += 1
+
         # --------------------------------------
         if toSoundingPitch:
             # environLocal.printDebug(['at sounding pitch', allParts[0].atSoundingPitch])
@@ -6058,12 +6081,19 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
 
         if template.hasMeasures():
             measureIterator = template.getElementsByClass('Measure')
-            for i, templateMeasure in enumerate(measureIterator):
-                measurePart = workObj.measure(i, collect=(), indicesNotNumbers=True)
+            if isinstance(workObj, Score):
+                # find each Part's Measures once, rather than searching every Part
+                # again for each measure index as workObj.measure(i) would.
+                measureSlices = scoreMeasureSlices(workObj)
+            else:
+                measureSlices = (workObj.measure(i, collect=(), indicesNotNumbers=True)
+                                 for i in range(len(measureIterator)))
+            for templateMeasure, measurePart in zip(measureIterator, measureSlices):
                 if measurePart is not None:
                     chordifyOneMeasure(templateMeasure, measurePart)
                 else:
-                    environLocal.warn(f'Malformed Part object, {workObj}, at measure index {i}')
+                    environLocal.warn(f'Malformed Part object, {workObj}, '
+                                      + f'at measure {templateMeasure.number}')
         else:
             chordifyOneMeasure(template, workObj)
 
@@ -6367,11 +6397,10 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         else:
             returnObj = self
 
-        # need to reset these lists unless values explicitly provided
-        if pitchPast is None:
-            pitchPast = []
-        if pitchPastMeasure is None:
-            pitchPastMeasure = []
+        # the past pitches, looked up by step as each note is processed
+        pitchPastTable = pitch.PitchPastTable(pitchPastMeasure)
+        if pitchPast is not None:
+            pitchPastTable.extend(pitchPast)
         # see if there is any key signatures to add to altered pitches
         if alteredPitches is None:
             alteredPitches = []
@@ -6408,15 +6437,14 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                     lastNoteWasTied = False
 
                 e.pitch.updateAccidentalDisplay(
-                    pitchPast=pitchPast,
-                    pitchPastMeasure=pitchPastMeasure,
+                    pitchPastTable=pitchPastTable,
                     alteredPitches=alteredPitches,
                     cautionaryPitchClass=cautionaryPitchClass,
                     cautionaryAll=cautionaryAll,
                     overrideStatus=overrideStatus,
                     cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
                     lastNoteWasTied=lastNoteWasTied)
-                pitchPast.append(e.pitch)
+                pitchPastTable.append(e.pitch)
 
                 tiePitchSet.clear()
                 if e.tie is not None and e.tie.type != 'stop':
@@ -6436,8 +6464,7 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                         lastNoteWasTied = False
 
                     p.updateAccidentalDisplay(
-                        pitchPast=pitchPast,
-                        pitchPastMeasure=pitchPastMeasure,
+                        pitchPastTable=pitchPastTable,
                         alteredPitches=alteredPitches,
                         cautionaryPitchClass=cautionaryPitchClass,
                         cautionaryAll=cautionaryAll,
@@ -6452,7 +6479,7 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 for pName in seenPitchNames:
                     tiePitchSet.add(pName)
 
-                pitchPast += e.pitches
+                pitchPastTable.extend(e.pitches)
             else:
                 tiePitchSet.clear()
 
@@ -6571,7 +6598,8 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                     inPlace=True,
                     **srkCopy)
 
-        measureStream.makeTies(meterStream, inPlace=True)
+        if not returnStream.streamStatus.haveTiesBeenMade():
+            measureStream.makeTies(meterStream, inPlace=True)
 
         # measureStream.makeBeams(inPlace=True)
         if not measureStream.streamStatus.beams:
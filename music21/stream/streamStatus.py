@@ -168,6 +168,127 @@ class StreamStatus(SlottedObjectMixin):
         else:
             return None
 
+    def haveTiesBeenMade(self):
+        '''
+        If no element in a Measure of this Stream (or in a Voice of such a Measure)
+        lasts past the end of the Measure, makeTies() has nothing to do, and this
+        method returns True, regardless of if makeTies() has actually been run.
+        Returns None if there are no Measures.
+
+        >>> s = stream.Stream()
+        >>> s.streamStatus.haveTiesBeenMade() is None
+        True
+        >>> m = stream.Measure()
+        >>> m.timeSignature = meter.TimeSignature('2/4')
+        >>> n = note.Note(type='half')
+        >>> m.append(n)
+        >>> s.append(m)
+        >>> s.streamStatus.haveTiesBeenMade()
+        True
+        >>> n.quarterLength = 3
+        >>> s.streamStatus.haveTiesBeenMade()
+        False
+        '''
+        measures = self.client.getElementsByClass('Measure')
+        if not measures:
+            return None
+
+        # the same barDuration that makeTies() uses.
+        lastTimeSignature = None
+        for m in measures:
+            if m.timeSignature is not None:
+                lastTimeSignature = m.timeSignature
+            elif lastTimeSignature is None:
+                lastTimeSignature = m.getContextByClass('TimeSignature')
+            if lastTimeSignature is not None:
+                mEnd = lastTimeSignature.barDuration.quarterLength
+            else:
+                mEnd = 4.0
+
+            if m.hasVoices():
+                bundle = m.voices
+            else:
+                bundle = [m]
+            for v in bundle:
+                for e in v.elements:
+                    eOffset = v.elementOffset(e)
+                    if eOffset < mEnd < common.opFrac(eOffset + e.duration.quarterLength):
+                        return False
+        return True
+
+    def notationStatus(self):
+        '''
+        Returns a dict saying, for each step of makeNotation(), whether it is already
+        done for this Stream: 'measures', 'ties', 'accidentals', 'beams', and
+        'tupletBrackets'.  A step counts as done if there is nothing for it to do:
+        there are no notes shorter than a quarter note to beam, for instance.
+
+        For a Score, each step must be done in every part.
+
+        The result is not cached, since changing a note (its pitch, for instance)
+        does not tell the Streams that contain it.
+
+        >>> s = corpus.parse('bwv66.6')
+        >>> s.streamStatus.notationStatus()
+        {'measures': True, 'ties': True, 'accidentals': True, 'beams': True,
+         'tupletBrackets': True}
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('F#', type='eighth'), 10)
+        >>> s.streamStatus.notationStatus()
+        {'measures': False, 'ties': False, 'accidentals': False, 'beams': False,
+         'tupletBrackets': True}
+        >>> sMeasures = s.makeNotation()
+        >>> sMeasures.streamStatus.notationStatus()
+        {'measures': True, 'ties': True, 'accidentals': True, 'beams': True,
+         'tupletBrackets': True}
+        >>> sMeasures.recurse().notes.first().quarterLength = 8
+        >>> sMeasures.streamStatus.notationStatus()['ties']
+        False
+        '''
+        client = self.client
+        if client.hasPartLikeStreams():
+            status = dict.fromkeys(
+                ('measures', 'ties', 'accidentals', 'beams', 'tupletBrackets'), True)
+            for p in client.getElementsByClass('Stream'):
+                for step, done in p.streamStatus.notationStatus().items():
+                    status[step] = status[step] and done
+        else:
+            isMeasure = 'Measure' in client.classes
+            status = {
+                'measures': isMeasure or client.hasMeasures(),
+                'ties': isMeasure or bool(self.haveTiesBeenMade()),
+                'accidentals': self.haveAccidentalsBeenMade() or not self._accidentalsNeeded(),
+                'beams': self.haveBeamsBeenMade() or not self._beamsNeeded(),
+                'tupletBrackets': self.haveTupletBracketsBeenMade() is not False,
+            }
+
+        return status
+
+    def _accidentalsNeeded(self):
+        '''
+        Returns False if makeAccidentals() has nothing to display: no pitch has an
+        accidental and no key signature alters any pitch.
+        '''
+        client = self.client
+        for p in client.pitches:
+            if p.accidental is not None:
+                return True
+        for ks in client.recurse().getElementsByClass('KeySignature'):
+            if ks.alteredPitches:
+                return True
+        return False
+
+    def _beamsNeeded(self):
+        '''
+        Returns False if makeBeams() has nothing to beam: no note or chord is shorter
+        than a quarter note.
+        '''
+        for n in self.client.recurse(classFilter=('NotRest',), restoreActiveSites=False):
+            if n.duration.quarterLength < 1:
+                return True
+        return False
+
     # PUBLIC PROPERTIES #
 
     @property
@@ -5193,6 +5193,49 @@ class Test(unittest.TestCase):
         post = s3.chordify()
         self.assertEqual(len(post.getElementsByClass('Chord')), 8)
 
+    def testChordifySweepMatchesPerOffset(self):
+        '''
+        chordify finds its verticalities in one sweep through each timespan tree;
+        the result is the same as looking up the verticality at each offset.
+        '''
+        from unittest import mock
+        from music21 import converter
+        from music21.tree.trees import OffsetTree
+
+        def perOffset(timespanTree, offsets):
+            return (timespanTree.getVerticalityAt(offset) for offset in offsets)
+
+        def summary(s):
+            post = []
+            for el in s.flat.notesAndRests:
+                ties = [None if n.tie is None else n.tie.type
+                        for n in (el.notes if el.isChord else [el])]
+                post.append((el.offset, el.quarterLength, el.classes[0],
+                             tuple(p.nameWithOctave for p in el.pitches),
+                             None if el.tie is None else el.tie.type, tuple(ties)))
+            return post
+
+        score = Score()
+        for tn in ('3/4 c2.~ c4 r8 d8~ d4 r2 e8 f8 g2 a4~ a2.',
+                   '3/4 r4 E2~ E4 F8 G8 A4 B2 r4 c4. d8 e4 r2.',
+                   '3/4 g8 a8 b2~ b2 r4 r2 c\'4~ c\'2. c\'4 d\'2'):
+            score.insert(0, converter.parse('tinyNotation: ' + tn))
+        # one part with overlapping notes in a single voice
+        overlapping = Part()
+        overlapping.insert(0, note.Note('C2', quarterLength=5.0))
+        overlapping.insert(1.5, note.Note('G2', quarterLength=3.0))
+        overlapping.insert(7.0, note.Note('D2', quarterLength=2.5))
+        overlapping.makeMeasures(inPlace=True)
+        score.insert(0, overlapping)
+
+        for s in (score, score.flat):
+            for addTies in (True, False):
+                swept = summary(s.chordify(addTies=addTies))
+                with mock.patch.object(OffsetTree, 'iterateVerticalitiesAt', perOffset):
+                    looked = summary(s.chordify(addTies=addTies))
+                self.assertTrue(swept)
+                self.assertEqual(swept, looked)
+
     def testChordifyE(self):
         s1 = Stream()
         m1 = Measure()
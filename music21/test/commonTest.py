@@ -23,6 +23,7 @@ import warnings
 import music21
 from music21 import environment
 from music21 import common
+from music21.test import testRunner
 
 # import importlib
 with warnings.catch_warnings():
@@ -56,7 +57,7 @@ def testImports():
         raise ImportError('lilypond must be installed to run test suites') from e
 
 def defaultDoctestSuite(name=None):
-    globs = __import__('music21').__dict__.copy()
+    globs = testRunner.defaultGlobs()
     docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
     kwArgs = {
         'globs': globs,
@@ -20,7 +20,7 @@ This file is not run with the standard test battery presently.
 import unittest
 
 import music21
-from music21 import common, corpus
+from music21 import bar, common, corpus, repeat
 from music21.musicxml.m21ToXml import GeneralObjectExporter as GEX
 
 from music21 import environment
@@ -245,6 +245,32 @@ class Test(unittest.TestCase):
         '''
         unused = corpus.parse('monteverdi/madrigal.5.3.rntxt', forceSource=True)
 
+    def getRepeatedQuartet(self):
+        s = corpus.parse('beethoven/opus18no1/movement2')
+        for p in s.parts:
+            measures = p.getElementsByClass('Measure')
+            measures[10].leftBarline = bar.Repeat(direction='start')
+            measures[40].rightBarline = bar.Repeat(direction='end')
+            measures[60].leftBarline = bar.Repeat(direction='start')
+            measures[90].rightBarline = bar.Repeat(direction='end', times=3)
+        return s
+
+    def runExpandRepeatsDeepCopy(self):
+        '''Expanding the repeats of a quartet five times by copying
+        '''
+        s = self.getRepeatedQuartet()
+        for i in range(5):
+            for p in s.parts:
+                unused = repeat.Expander(p).process()
+
+    def runExpandRepeatsFromPlan(self):
+        '''Expanding the repeats of a quartet five times from an expansion plan
+        '''
+        s = self.getRepeatedQuartet()
+        for i in range(5):
+            for p in s.parts:
+                unused = repeat.Expander(p).processFromPlan()
+
     # --------------------------------------------------------------------------
     def testTimingTolerance(self):
         '''
@@ -268,6 +294,16 @@ class Test(unittest.TestCase):
                     '2010.11.11': 3.96121883392,
                 }),
 
+            (self.runExpandRepeatsDeepCopy,
+                {
+                    '2026.10.19': 26.478,
+                }),
+
+            (self.runExpandRepeatsFromPlan,
+                {
+                    '2026.10.19': 8.944,
+                }),
+
 
             #
             #
@@ -29,6 +29,22 @@ defaultImports = ['music21']
 
 # test related functions
 
+def defaultGlobs():
+    '''
+    Returns a copy of the namespace of the first module in `defaultImports`
+    to use as the globals of doctests, after importing everything in its `__all__`
+    (since music21 only imports its subpackages when they are first used).
+
+    >>> globs = test.testRunner.defaultGlobs()
+    >>> globs['braille']
+    <module 'music21.braille' from '...'>
+    '''
+    module = __import__(defaultImports[0])
+    for name in getattr(module, '__all__', ()):
+        getattr(module, name)
+    return module.__dict__.copy()
+
+
 def addDocAttrTestsToSuite(suite,
                            moduleVariableLists,
                            outerFilename=None,
@@ -59,7 +75,7 @@ def addDocAttrTestsToSuite(suite,
     '''
     dtp = doctest.DocTestParser()
     if globs is False:
-        globs = __import__(defaultImports[0]).__dict__.copy()
+        globs = defaultGlobs()
 
     elif globs is None:
         globs = {}
@@ -200,8 +216,7 @@ def mainTest(*testClasses, **kwargs):
                 or bool(kwargs.get('moduleRelative', False))):
             pass
         else:
-            for di in defaultImports:
-                globs = __import__(di).__dict__.copy()
+            globs = defaultGlobs()
             if ('importPlusRelative' in testClasses
                     or 'importPlusRelative' in sys.argv
                     or bool(kwargs.get('importPlusRelative', False))):
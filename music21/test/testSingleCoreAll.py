@@ -87,7 +87,7 @@ def main(testGroup=('test',), restoreEnvironmentDefaults=False, limit=None, verb
 
         allLocals = [getattr(moduleObject, x) for x in dir(moduleObject)]
 
-        globs = __import__('music21').__dict__.copy()
+        globs = testRunner.defaultGlobs()
         docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
         testRunner.addDocAttrTestsToSuite(s1,
                                           allLocals,
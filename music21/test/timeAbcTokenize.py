@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:          timeAbcTokenize.py
+# Purpose:       benchmark ABC tokenizing against complete ABC parsing
+#
+# Authors:       Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2021 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+# pragma: no cover
+'''
+Times :meth:`~music21.abcFormat.ABCHandler.tokenize` on the ABC collections in the
+corpus and compares it with the rest of turning the same files into tokens
+(`tokenProcess`) and into Streams.
+
+Run as `python -m music21.test.timeAbcTokenize` or, for other directories of .abc files,
+`python -m music21.test.timeAbcTokenize path/to/dir ...`
+'''
+import io
+import pathlib
+import sys
+import time
+
+from music21 import abcFormat
+from music21 import common
+
+CORPUS_DIRECTORIES = ('nottingham-dataset', 'oneills1850')
+
+
+def readSources(directory):
+    '''
+    Return a list of the contents of all .abc files in `directory`.
+    '''
+    sources = []
+    for fp in sorted(pathlib.Path(directory).glob('**/*.abc')):
+        with io.open(fp, encoding='utf-8', errors='replace') as f:
+            sources.append(f.read())
+    return sources
+
+
+def timeSources(sources, translate=True):
+    '''
+    Return a dictionary of the number of tokens and the seconds taken to tokenize,
+    to process tokens, and (if `translate` is True) to translate `sources`
+    into Streams.
+    '''
+    results = {'tokens': 0, 'tokenize': 0.0, 'tokenProcess': 0.0, 'translate': 0.0}
+    for src in sources:
+        handler = abcFormat.ABCHandler()
+        t = time.perf_counter()
+        handler.tokenize(src)
+        results['tokenize'] += time.perf_counter() - t
+        results['tokens'] += len(handler.tokens)
+
+        t = time.perf_counter()
+        handler.tokenProcess()
+        results['tokenProcess'] += time.perf_counter() - t
+
+        if translate:
+            t = time.perf_counter()
+            if handler.definesReferenceNumbers():
+                abcFormat.translate.abcToStreamOpus(handler)
+            else:
+                abcFormat.translate.abcToStreamScore(handler)
+            results['translate'] += time.perf_counter() - t
+    return results
+
+
+def main(directories=None, translate=True):
+    if not directories:
+        corpusPath = common.getCorpusFilePath()
+        directories = [corpusPath / d for d in CORPUS_DIRECTORIES]
+    for directory in directories:
+        sources = readSources(directory)
+        if not sources:
+            print(f'{directory}: no .abc files')
+            continue
+        r = timeSources(sources, translate=translate)
+        total = r['tokenize'] + r['tokenProcess'] + r['translate']
+        print(f'{pathlib.Path(directory).name}: {len(sources)} files, {r["tokens"]} tokens')
+        print(f'    tokenize     {r["tokenize"]:8.3f}s '
+              + f'({r["tokens"] / max(r["tokenize"], 1e-9):,.0f} tokens/s)')
+        print(f'    tokenProcess {r["tokenProcess"]:8.3f}s')
+        if translate:
+            print(f'    translate    {r["translate"]:8.3f}s')
+        print(f'    tokenize is {100 * r["tokenize"] / total:.0f}% of the total')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:          timeImport.py
+# Purpose:       check that `import music21` stays fast and loads only what it needs
+#
+# Authors:       Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2021 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+# pragma: no cover
+'''
+Times `import music21` in fresh interpreters and fails if it becomes slow again,
+or if it starts importing subpackages (which should only be loaded when first used).
+
+Run as `python -m music21.test.timeImport`.  Use timeGraphImportStar to find out
+which modules are responsible for a slowdown.
+'''
+import statistics
+import subprocess
+import sys
+
+# seconds; `import music21` took about 1.7s when it loaded every subpackage
+MAX_IMPORT_SECONDS = 0.6
+
+# none of these should be imported by `import music21` alone
+LAZY_SUBPACKAGES = (
+    'music21.braille',
+    'music21.features',
+    'music21.figuredBass',
+    'music21.graph',
+    'music21.lily',
+    'music21.mei',
+    'music21.musicxml',
+    'music21.stream',
+)
+
+_SCRIPT = '''
+import sys, time
+t = time.perf_counter()
+import music21
+print(time.perf_counter() - t)
+print(' '.join(m for m in sys.modules if m.startswith('music21')))
+'''
+
+
+def timeOneImport():
+    '''
+    Returns the time to import music21 in a new interpreter and the set of
+    music21 modules that were loaded.
+    '''
+    output = subprocess.run([sys.executable, '-c', _SCRIPT],
+                            check=True,
+                            capture_output=True,
+                            text=True).stdout.splitlines()
+    return float(output[0]), set(output[1].split())
+
+
+def main(runs=5):
+    times = []
+    modules = set()
+    for _ in range(runs):
+        t, modules = timeOneImport()
+        times.append(t)
+    medianTime = statistics.median(times)
+    print(f'import music21: median {medianTime:.3f}s over {runs} runs; '
+          + f'{len(modules)} music21 modules loaded')
+
+    problems = []
+    if medianTime > MAX_IMPORT_SECONDS:
+        problems.append(f'import took longer than {MAX_IMPORT_SECONDS}s')
+    eager = sorted(m for m in LAZY_SUBPACKAGES if m in modules)
+    if eager:
+        problems.append('imported eagerly: ' + ', '.join(eager))
+    for p in problems:
+        print(p)
+    return not problems
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
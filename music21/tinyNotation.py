@@ -468,6 +468,14 @@ class TimeSignatureToken(Token):
 class NoteOrRestToken(Token):
     '''
     represents a Note or Rest.  Chords are represented by Note objects
+
+    Apart from durations taken from the previous token (as in "e-") or from the
+    time signature (as in "e-0"), a NoteToken or RestToken always parses to the same
+    Note or Rest, so it is only parsed once per Converter: the result is kept as a
+    template in the Converter's `tokenTemplates`, and identical tokens get a copy of it
+    (see :meth:`~music21.tinyNotation.NoteOrRestToken.parseFromTemplate`).
+    Tokens of other classes, including subclasses of these two, which may set
+    anything at all on what they parse, are parsed every time.
     '''
 
     def __init__(self, token=''):
@@ -479,6 +487,80 @@ class NoteOrRestToken(Token):
 
 
         self.durationFound = False
+        self.durationFromTimeSignature = False
+
+    def parseFromTemplate(self, parent):
+        '''
+        If an identical token of the same class has already been parsed by `parent` and
+        stored with :meth:`~music21.tinyNotation.NoteOrRestToken.storeTemplate`, return
+        a copy of its Note or Rest, with the parent's last duration if the token does not
+        give one (and record its duration as the parent's last duration).
+        Otherwise return None.
+
+        >>> tnc = tinyNotation.Converter()
+        >>> nToken = tinyNotation.NoteToken('c#8.')
+        >>> n = nToken.parse(tnc)
+        >>> n2 = tinyNotation.NoteToken('c#8.').parseFromTemplate(tnc)
+        >>> n2
+        <music21.note.Note C#>
+        >>> n2 is n
+        False
+        >>> n2.duration.quarterLength
+        0.75
+        >>> tnc.stateDict['lastDuration']
+        0.75
+
+        >>> n3 = tinyNotation.NoteToken('c#').parse(tnc)
+        >>> tnc.stateDict['lastDuration'] = 2.0
+        >>> n4 = tinyNotation.NoteToken('c#').parseFromTemplate(tnc)
+        >>> n4.duration.quarterLength
+        2.0
+
+        Another Converter parses the token again:
+
+        >>> tinyNotation.NoteToken('c#8.').parseFromTemplate(tinyNotation.Converter()) is None
+        True
+        '''
+        templates = self._templatesOf(parent)
+        if templates is None:
+            return None
+        cached = templates.get((self.__class__, self.token), None)
+        if cached is None:
+            return None
+        template, durationFound = cached
+        n = self.copyTemplate(template)
+        if hasattr(parent, 'stateDict'):
+            if not durationFound:
+                n.duration.quarterLength = parent.stateDict['lastDuration']
+            parent.stateDict['lastDuration'] = n.duration.quarterLength
+        return n
+
+    def storeTemplate(self, n, parent):
+        '''
+        Store a copy of `n`, just parsed from this token, in the `tokenTemplates` of
+        `parent` as the template for identical tokens, unless its duration came
+        from the current time signature.
+        '''
+        templates = self._templatesOf(parent)
+        if templates is not None and not self.durationFromTimeSignature:
+            templates[(self.__class__, self.token)] = (self.copyTemplate(n),
+                                                       self.durationFound)
+
+    def _templatesOf(self, parent):
+        '''
+        Returns the `tokenTemplates` of `parent`, or None if it has none or this
+        token is not a NoteToken or RestToken (but a subclass, for instance, whose
+        parse() might set more than :meth:`copyTemplate` copies).
+        '''
+        if self.__class__ not in (NoteToken, RestToken):
+            return None
+        return getattr(parent, 'tokenTemplates', None)
+
+    def copyTemplate(self, template):
+        '''
+        Return a new object of the same class and duration as `template`.
+        '''
+        return template.__class__(duration=copy.deepcopy(template.duration))
 
     def applyDuration(self, n, t, parent):
         '''
@@ -507,6 +589,7 @@ class NoteOrRestToken(Token):
         self.durationFound = True
         typeNum = int(search.group(1))
         if typeNum == 0:
+            self.durationFromTimeSignature = True
             if parent.stateDict['currentTimeSignature'] is not None:
                 element.duration = copy.deepcopy(
                     parent.stateDict['currentTimeSignature'].barDuration
@@ -539,8 +622,12 @@ class RestToken(NoteOrRestToken):
     '''
 
     def parse(self, parent=None):
+        r = self.parseFromTemplate(parent)
+        if r is not None:
+            return r
         r = note.Rest()
         self.applyDuration(r, self.token, parent)
+        self.storeTemplate(r, parent)
         return r
 
 
@@ -585,11 +672,38 @@ class NoteToken(NoteOrRestToken):
         Extract the pitch from the note and then returns the Note.
         '''
         t = self.token
+        if parent:
+            n = self.parseFromTemplate(parent)
+            if n is not None:
+                return n
 
         n = note.Note()
         t = self.processPitchMap(n, t)
         if parent:
             self.applyDuration(n, t, parent)
+            self.storeTemplate(n, parent)
+        return n
+
+    def copyTemplate(self, template):
+        '''
+        Return a new Note with the pitch, ficta, and duration of `template`.
+
+        >>> template = tinyNotation.NoteToken('BB(-)').parse()
+        >>> template.duration.type = 'half'
+        >>> n = tinyNotation.NoteToken('BB(-)').copyTemplate(template)
+        >>> n
+        <music21.note.Note B>
+        >>> n.editorial.ficta
+        <music21.pitch.Accidental flat>
+        >>> n.duration.type
+        'half'
+        >>> n.pitch is template.pitch
+        False
+        '''
+        n = note.Note(copy.deepcopy(template.pitch),
+                      duration=copy.deepcopy(template.duration))
+        if 'ficta' in template.editorial:
+            n.editorial.ficta = copy.deepcopy(template.editorial.ficta)
         return n
 
     def processPitchMap(self, n, t):
@@ -938,6 +1052,9 @@ class Converter:
         self.stringRep = stringRep
         self.activeStates = []
         self.preTokens = None
+        # (Note or Rest, durationFound) already parsed from a token, keyed on
+        # (token class, token); see NoteOrRestToken.parseFromTemplate()
+        self.tokenTemplates = {}
 
         self.generalBracketStateRe = re.compile(r'(\w+){')
         self.tieStateRe = re.compile(r'~')
@@ -1256,6 +1373,22 @@ class Test(unittest.TestCase):
         self.assertEqual(sfn[12].duration.quarterLength, 1.0)
         self.assertEqual(sfn[12].expressions[0].classes, expressions.Fermata().classes)
 
+    def testNoteTokenSubclassNotTemplated(self):
+        class StemmedNoteToken(NoteToken):
+            def parse(self, parent=None):
+                n = super().parse(parent)
+                n.stemDirection = 'up'
+                n.editorial.comments.append(self.token)
+                return n
+
+        c = Converter('4/4 c4 c4 c4 r4')
+        c.tokenMap[-1] = (c.tokenMap[-1][0], StemmedNoteToken)
+        c.parse()
+        sfn = c.stream.flat.notes
+        self.assertEqual([n.stemDirection for n in sfn], ['up', 'up', 'up'])
+        self.assertEqual([len(n.editorial.comments) for n in sfn], [1, 1, 1])
+        self.assertEqual(list(c.tokenTemplates), [(RestToken, '4')])
+
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
 
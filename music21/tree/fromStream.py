@@ -91,6 +91,11 @@ def listOfTreesByClass(inputStream,
         classLists = []
     else:
         outputTrees = [treeClass(source=lastParentage) for _ in classLists]
+    # gather everything first, then insert into each (empty) tree at once,
+    # which lets the tree be built balanced from sorted input, without rebalancing.
+    positionsByTree = [[] for _ in outputTrees]
+    elementsByTree = [[] for _ in outputTrees]
+
     # do this to avoid munging activeSites
     inputStreamElements = inputStream._elements[:] + inputStream._endElements
     for element in inputStreamElements:
@@ -105,11 +110,15 @@ def listOfTreesByClass(inputStream,
                                                 flatten=flatten,
                                                 classLists=classLists,
                                                 useTimespans=useTimespans)
-            for outputTree, subTree in zip(outputTrees, containedTrees):
+            for i, subTree in enumerate(containedTrees):
                 if flatten is not False:  # True or semiFlat
-                    outputTree.insert(subTree[:])
+                    subElements = subTree[:]
+                    positionsByTree[i].extend(
+                        outputTrees[i]._getPositionsFromElements(subElements))
+                    elementsByTree[i].extend(subElements)
                 else:
-                    outputTree.insert(subTree.lowestPosition(), subTree)
+                    positionsByTree[i].append(subTree.lowestPosition())
+                    elementsByTree[i].append(subTree)
             wasStream = True
 
         if not wasStream or flatten == 'semiFlat':
@@ -117,7 +126,7 @@ def listOfTreesByClass(inputStream,
             parentEndTime = initialOffset + lastParentage.duration.quarterLength
             endTime = offset + element.duration.quarterLength
 
-            for classBasedTree, classList in zip(outputTrees, classLists):
+            for i, classList in enumerate(classLists):
                 if classList and not element.isClassOrSubclass(classList):
                     continue
                 if useTimespans:
@@ -131,9 +140,15 @@ def listOfTreesByClass(inputStream,
                                                 parentEndTime=parentEndTime,
                                                 offset=offset,
                                                 endTime=endTime)
-                    classBasedTree.insert(elementTimespan)
+                    positionsByTree[i].append(offset)
+                    elementsByTree[i].append(elementTimespan)
                 else:
-                    classBasedTree.insert(offset, element)
+                    positionsByTree[i].append(offset)
+                    elementsByTree[i].append(element)
+
+    for outputTree, positions, elements in zip(outputTrees, positionsByTree, elementsByTree):
+        if elements:
+            outputTree.insert(positions, elements)
 
     return outputTrees
 
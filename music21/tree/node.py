@@ -323,32 +323,33 @@ class OffsetNode(ElementNode):
     >>> scoreTree = tree.fromStream.asTimespans(sf, flatten=False, classList=None)
     >>> rn = scoreTree.rootNode
 
-    The RootNode here represents the starting position of the Note F at 3.0; It is the center
-    of the elements in the flat Stream.  Its index is 5 (that is, it's the sixth note in the
-    element list) and its offset is 3.0
+    The RootNode here represents the starting position of the Notes G and E# at 4.0;
+    it is the center of the nine offsets in the flat Stream.  Its index is 12 (that is,
+    the G is the thirteenth element in the element list) and its offset is 4.0
 
     >>> rn
-    <OffsetNode 3.0 Indices:0,11,12,20 Length:1>
-    >>> sf[11]
-    <music21.note.Note F>
-    >>> sf[11].offset
-    3.0
+    <OffsetNode 4.0 Indices:0,12,14,20 Length:2>
+    >>> sf[12]
+    <music21.note.Note G>
+    >>> sf[12].offset
+    4.0
 
-    Thus, the indices of 0:5:6:12 indicate that the left-side of the node handles indices
-    from >= 0 to < 5; and the right-side of the node handles indices >= 6 and < 12, and this node
-    handles indices >= 5 and < 6.
+    Thus, the indices of 0:12:14:20 indicate that the left-side of the node handles indices
+    from >= 0 to < 12; and the right-side of the node handles indices >= 14 and < 20, and
+    this node handles indices >= 12 and < 14.
 
-    The `Length: {1}` indicates that there is exactly one element at this location, that is,
-    the F.
+    The `Length: {2}` indicates that there are exactly two elements at this location, that is,
+    the G and the E#.
 
-    The "payload" of the node, is just that element wrapped in a list wrapped in an
-    ElementTimespan or PitchedTimespan:
+    The "payload" of the node, is just those elements each wrapped in an
+    ElementTimespan or PitchedTimespan, in a list:
 
     >>> rn.payload
-    [<PitchedTimespan (3.0 to 4.0) <music21.note.Note F>>]
+    [<PitchedTimespan (4.0 to 5.0) <music21.note.Note G>>,
+     <PitchedTimespan (4.0 to 6.0) <music21.note.Note E#>>]
     >>> rn.payload[0].element
-    <music21.note.Note F>
-    >>> rn.payload[0].element is sf[11]
+    <music21.note.Note G>
+    >>> rn.payload[0].element is sf[12]
     True
 
 
@@ -356,7 +357,7 @@ class OffsetNode(ElementNode):
 
     >>> left = rn.leftChild
     >>> left
-    <OffsetNode 1.0 Indices:0,8,9,11 Length:1>
+    <OffsetNode 1.0 Indices:0,8,9,12 Length:1>
 
     In the leftNode of the leftNode of the rootNode there are eight elements:
     metadata and both notes that begin on offset 0.0:
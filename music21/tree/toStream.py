@@ -84,11 +84,12 @@ def chordified(timespans, templateStream=None):
 
         measureList = list(outputStream.getElementsByClass('Measure'))
 
-        for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
+        verticalities = timespans.iterateVerticalitiesAt(allTimePoints)
+        for vert, endTime in zip(verticalities, allTimePoints[1:]):
+            offset = vert.offset
             while templateOffsets[1] <= offset:
                 templateOffsets.pop(0)
                 measureIndex += 1
-            vert = timespans.getVerticalityAt(offset)
             quarterLength = endTime - offset
             if quarterLength < 0:
                 raise TreeException(
@@ -100,8 +101,9 @@ def chordified(timespans, templateStream=None):
     else:
         allTimePoints = timespans.allTimePoints()
         elements = []
-        for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
-            vert = timespans.getVerticalityAt(offset)
+        verticalities = timespans.iterateVerticalitiesAt(allTimePoints)
+        for vert, endTime in zip(verticalities, allTimePoints[1:]):
+            offset = vert.offset
             quarterLength = endTime - offset
             if quarterLength < 0:
                 raise TreeException(
@@ -15,6 +15,7 @@ Tools for grouping elements, timespans, and especially
 pitched elements into kinds of searchable tree organized by start and stop offsets
 and other positions.
 '''
+import bisect
 import unittest
 import weakref
 from math import inf
@@ -779,12 +780,21 @@ class ElementTree(core.AVLTree):
         if positions is None:
             positions = self._getPositionsFromElements(elements)
 
+        self._insertMany(positions, elements)
+
+        self._updateNodes(initialPosition, initialEndTime)
+
+    def _insertMany(self, positions, elements):
+        '''
+        Inserts each element at the corresponding position, but does not
+        updateIndices or updateEndTimes or updateParents.
+
+        Subclassed by OffsetTree to build an empty tree all at once.
+        '''
         for i, el in enumerate(elements):
             pos = positions[i]
             self._insertCore(pos, el)
 
-        self._updateNodes(initialPosition, initialEndTime)
-
     def _insertCore(self, position, el):
         '''
         Inserts a single element at an offset, creating new nodes as necessary,
@@ -1134,6 +1144,76 @@ class OffsetTree(ElementTree):
         node.payload.append(el)
         node.payload.sort(key=self._insertCorePayloadSortKey)
 
+    def _insertMany(self, positions, elements):
+        '''
+        If the tree is empty, sort the elements by position (which is linear
+        if they are already sorted, as when they come from a sorted Stream) and build
+        a balanced tree all at once with populateFromSortedList, rather than
+        inserting and rebalancing one at a time.
+        '''
+        if self.rootNode is not None:
+            super()._insertMany(positions, elements)
+            return
+        # sorted() is stable, so elements at the same position stay in insertion order,
+        # just as they would be if inserted one at a time.
+        self.populateFromSortedList(sorted(zip(positions, elements), key=lambda pe: pe[0]))
+
+    def populateFromSortedList(self, listOfTuples):
+        '''
+        Populate this (empty) tree from a list of two-tuples of (offset, element)
+        sorted by offset, in time proportional to the length of the list.
+
+        Unlike the ElementTree version, offsets may repeat: elements at the same offset
+        go into one node's payload, in the same order that :meth:`insert` would
+        put them.  The resulting tree is perfectly balanced and its indices and endTimes
+        are computed once, from the bottom up.
+
+        >>> score = tree.makeExampleScore()
+        >>> notes = list(score.flat.notes)
+        >>> len(notes)
+        12
+        >>> t = tree.trees.OffsetTree()
+        >>> t.populateFromSortedList([(n.offset, n) for n in notes])
+        >>> t
+        <OffsetTree {12} (0.0 to 8.0)>
+        >>> t.rootNode
+        <OffsetNode 3.0 Indices:0,5,6,12 Length:1>
+        >>> t.elementsStartingAt(2.0)
+        (<music21.note.Note E>, <music21.note.Note G#>)
+        >>> t.rootNode.height
+        3
+        '''
+        grouped = []
+        for position, el in listOfTuples:
+            if grouped and grouped[-1][0] == position:
+                grouped[-1][1].append(el)
+            else:
+                grouped.append((position, [el]))
+
+        sortKey = self._insertCorePayloadSortKey
+        NodeClass = self.nodeClass
+
+        def recurse(start, stop):
+            '''
+            Build the subtree for grouped[start:stop] without copying sub-lists.
+            '''
+            if start >= stop:
+                return None
+            midpoint = (start + stop - 1) // 2
+            position, payload = grouped[midpoint]
+            payload.sort(key=sortKey)
+            n = NodeClass(position)
+            n.payload = payload
+            n.leftChild = recurse(start, midpoint)
+            n.rightChild = recurse(midpoint + 1, stop)
+            n.update()
+            return n
+
+        self.rootNode = recurse(0, len(grouped))
+        if self.rootNode is not None:
+            self.rootNode.updateIndices()
+            self.rootNode.updateEndTimes()
+
     def copy(self):
         # noinspection PyShadowingNames
         r'''
@@ -1263,6 +1343,122 @@ class OffsetTree(ElementTree):
         results = recurse(self.rootNode)
         return tuple(results)
 
+    def elementsOverlappingRange(self, startOffset, endOffset):
+        r'''
+        Finds elements in this OffsetTree which sound at any point in the half-open range
+        from `startOffset` up to (but not including) `endOffset`: those that start
+        before `endOffset` and either end after `startOffset` or start within the range
+        (so zero-length elements in the range are found as well).
+
+        Elements are ordered as they are in the tree.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> for ts in scoreTree.elementsOverlappingRange(0.75, 1.5):
+        ...     ts
+        <PitchedTimespan (0.0 to 1.0) <music21.note.Note E>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+        <PitchedTimespan (0.5 to 1.0) <music21.note.Note G#>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note A>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note F#>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note C#>>
+        <PitchedTimespan (1.0 to 2.0) <music21.note.Note F#>>
+
+        Elements that end exactly at `startOffset` are not included:
+
+        >>> [ts.element for ts in scoreTree.elementsOverlappingRange(1.0, 2.0)]
+        [<music21.note.Note A>, <music21.note.Note F#>,
+         <music21.note.Note C#>, <music21.note.Note F#>]
+
+        The search uses the highest endTime kept on each node to skip any subtree
+        that ends before the range, so it takes time proportional to the log of the
+        size of the tree plus the number of elements found.
+
+        Requires a tree whose positions are offsets, not SortTuples.
+
+        >>> scoreTree.elementsOverlappingRange(2.0, 1.0)
+        Traceback (most recent call last):
+        music21.tree.trees.ElementTreeException: endOffset 1.0 is before startOffset 2.0
+        '''
+        if endOffset < startOffset:
+            raise ElementTreeException(
+                f'endOffset {endOffset} is before startOffset {startOffset}')
+
+        result = []
+
+        def recurse(node):
+            if node is None or node.endTimeHigh < startOffset:
+                return
+            recurse(node.leftChild)
+            position = node.position
+            if position < endOffset:
+                for el in node.payload:
+                    if position >= startOffset or self.elementEndTime(el, node) > startOffset:
+                        result.append(el)
+                recurse(node.rightChild)
+
+        recurse(self.rootNode)
+        return tuple(result)
+
+    def elementsOverlappingRanges(self, ranges):
+        r'''
+        Given a list of (startOffset, endOffset) pairs, returns a list with the result of
+        :meth:`elementsOverlappingRange` for each of them, in the same order, but found
+        in a single sweep through the tree.  This is much faster than calling
+        `elementsOverlappingRange` in a loop when there are many ranges, such as
+        one for every beat or measure of a score.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> beats = [(float(i), i + 1.0) for i in range(4)]
+        >>> for found in scoreTree.elementsOverlappingRanges(beats):
+        ...     len(found)
+        7
+        4
+        4
+        4
+
+        >>> ranges = [(2.0, 4.0), (0.75, 1.5), (3.0, 3.0)]
+        >>> batch = scoreTree.elementsOverlappingRanges(ranges)
+        >>> batch == [scoreTree.elementsOverlappingRange(s, e) for s, e in ranges]
+        True
+
+        Requires a tree whose positions are offsets, not SortTuples.
+        '''
+        ranges = list(ranges)
+        for startOffset, endOffset in ranges:
+            if endOffset < startOffset:
+                raise ElementTreeException(
+                    f'endOffset {endOffset} is before startOffset {startOffset}')
+
+        nodes = list(self.iterNodes())
+        positions = [node.position for node in nodes]
+        # payloads paired with their end times, one list per node, computed only once
+        nodeEntries = [[(self.elementEndTime(el, node), el) for el in node.payload]
+                       for node in nodes]
+
+        results = [()] * len(ranges)
+        nodeIndex = 0
+        # (endTime, element) pairs for elements that start before the current startOffset
+        # and have not yet ended, in tree order.
+        sounding = []
+        order = sorted(range(len(ranges)), key=lambda i: ranges[i][0])
+        for i in order:
+            startOffset, endOffset = ranges[i]
+            firstInside = bisect.bisect_left(positions, startOffset, lo=nodeIndex)
+            while nodeIndex < firstInside:
+                sounding.extend(nodeEntries[nodeIndex])
+                nodeIndex += 1
+            sounding = [(endTime, el) for endTime, el in sounding if endTime > startOffset]
+
+            found = [el for unused_endTime, el in sounding]
+            stopIndex = bisect.bisect_left(positions, endOffset, lo=firstInside)
+            for entries in nodeEntries[firstInside:stopIndex]:
+                found.extend(el for unused_endTime, el in entries)
+            results[i] = tuple(found)
+        return results
+
     def removeElements(self, elements, offsets=None, runUpdate=True):
         r'''
         Removes `elements` which can be Music21Objects or Timespans
@@ -1432,6 +1628,66 @@ class OffsetTree(ElementTree):
         )
         return verticality
 
+    def iterateVerticalitiesAt(self, offsets):
+        r'''
+        Yields the verticality at each offset in `offsets`, which must be sorted
+        in ascending order.  Each verticality is the same as what
+        :meth:`getVerticalityAt` would give, but all are found in a single sweep
+        through the tree, keeping a list of the elements currently sounding,
+        instead of searching the tree three times for every offset.
+
+        Requires a tree whose positions are offsets, not SortTuples.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans()
+        >>> for v in scoreTree.iterateVerticalitiesAt([0.0, 0.5, 0.75, 1.0]):
+        ...     v
+        <music21.tree.verticality.Verticality 0.0 {A3 E4 C#5}>
+        <music21.tree.verticality.Verticality 0.5 {G#3 B3 E4 B4}>
+        <music21.tree.verticality.Verticality 0.75 {G#3 B3 E4 B4}>
+        <music21.tree.verticality.Verticality 1.0 {F#3 C#4 F#4 A4}>
+
+        >>> v = list(scoreTree.iterateVerticalitiesAt([0.5]))[0]
+        >>> w = scoreTree.getVerticalityAt(0.5)
+        >>> v.startTimespans == w.startTimespans
+        True
+        >>> v.overlapTimespans == w.overlapTimespans
+        True
+        >>> v.stopTimespans == w.stopTimespans
+        True
+        '''
+        from music21.tree.verticality import Verticality
+
+        nodes = list(self.iterNodes())
+        numNodes = len(nodes)
+        nodeIndex = 0
+        # (endTime, element) pairs for elements that started before the current offset,
+        # in the same (position, payload) order in which the tree traverses them.
+        sounding = []
+        for offset in offsets:
+            while nodeIndex < numNodes and nodes[nodeIndex].position < offset:
+                node = nodes[nodeIndex]
+                sounding.extend((self.elementEndTime(el, node), el) for el in node.payload)
+                nodeIndex += 1
+            sounding = [(endTime, el) for endTime, el in sounding if endTime >= offset]
+
+            stopTimespans = [el for endTime, el in sounding if endTime == offset]
+            overlapTimespans = tuple(el for endTime, el in sounding if endTime > offset)
+            startTimespans = ()
+            if nodeIndex < numNodes and nodes[nodeIndex].position == offset:
+                node = nodes[nodeIndex]
+                startTimespans = tuple(node.payload)
+                stopTimespans.extend(el for el in node.payload
+                                     if self.elementEndTime(el, node) == offset)
+
+            yield Verticality(
+                overlapTimespans=overlapTimespans,
+                startTimespans=startTimespans,
+                offset=offset,
+                stopTimespans=tuple(stopTimespans),
+                timespanTree=self,
+            )
+
     def simultaneityDict(self):
         '''
         Creates a dictionary of offsets that have more than one element starting at that time,
@@ -1499,6 +1755,28 @@ class Test(unittest.TestCase):
         st3 = et.getPositionAfter(5.0)
         self.assertIsNotNone(st3)
 
+    def testBulkInsertMatchesSingleInserts(self):
+        from music21 import corpus
+
+        notes = list(corpus.parse('bwv66.6').flat.notes)
+        positions = [n.offset for n in notes]
+
+        bulkTree = OffsetTree()
+        bulkTree.insert(positions, notes)
+        singleTree = OffsetTree()
+        for position, n in zip(positions, notes):
+            singleTree.insert(position, n)
+
+        self.assertEqual(list(bulkTree), list(singleTree))
+        self.assertEqual(bulkTree.endTime, singleTree.endTime)
+        for position in (0.0, 6.0, 35.0):
+            self.assertEqual(bulkTree.elementsStartingAt(position),
+                             singleTree.elementsStartingAt(position))
+            self.assertEqual(bulkTree.elementsOverlappingOffset(position),
+                             singleTree.elementsOverlappingOffset(position))
+        for n in notes[::7]:
+            self.assertEqual(bulkTree.index(n), singleTree.index(n))
+
 #     def testBachDoctest(self):
 #         from music21 import corpus, note, chord, tree
 #         bach = corpus.parse('bwv66.6')
@@ -1577,6 +1855,28 @@ class Test(unittest.TestCase):
         self.assertEqual(elementList[1].name, 'A')
         self.assertEqual(elementList[2].name, 'A')
 
+    def testElementsOverlappingRange(self):
+        from music21 import corpus
+
+        score = corpus.parse('bwv66.6')
+        for scoreTree in (score.asTimespans(),
+                          score.asTree(flatten=True, groupOffsets=True)):
+            allElements = []
+            for n in scoreTree.iterNodes():
+                for el in n.payload:
+                    allElements.append((n.position, scoreTree.elementEndTime(el, n), el))
+
+            ranges = [(i / 4, i / 4 + length)
+                      for i in range(0, 150, 7) for length in (0.25, 1.0, 3.5)]
+            ranges.append((36.0, 40.0))  # final barlines have no duration
+            ranges.reverse()
+            batch = scoreTree.elementsOverlappingRanges(ranges)
+            for (start, end), found in zip(ranges, batch):
+                expected = tuple(el for position, endTime, el in allElements
+                                 if position < end and (position >= start or endTime > start))
+                self.assertEqual(scoreTree.elementsOverlappingRange(start, end), expected)
+                self.assertEqual(found, expected)
+
 
 #     def testBachDoctest(self):
 #         from music21 import corpus, note, chord, tree
@@ -36,6 +36,7 @@ The list of objects included here are:
 '''
 import enum
 import unittest
+from collections import namedtuple
 from typing import List
 
 from music21 import base
@@ -1286,6 +1287,259 @@ class VoiceLeadingQuartetException(exceptions21.Music21Exception):
     pass
 
 
+# ------------------------------------------------------------------------------
+class VoiceLeadingViolation(namedtuple('VoiceLeadingViolation',
+                                       'rule offset nextOffset measureNumber nextMeasureNumber '
+                                       'upperPart lowerPart')):
+    '''
+    A violation found by :class:`VoiceLeadingChecker`: the name of the rule
+    (the name of the :class:`VoiceLeadingQuartet` method that would be True),
+    the offsets and measure numbers of the two verticalities that the parts
+    move between, and the indices of the upper and the lower part in the score.
+
+    >>> vlv = voiceLeading.VoiceLeadingViolation('parallelFifth', 2.0, 3.0, 1, 2, 0, 3)
+    >>> vlv
+    <VoiceLeadingViolation parallelFifth 2.0 -> 3.0 (m. 1 -> 2) parts 0, 3>
+    '''
+    __slots__ = ()
+
+    def __repr__(self):
+        return (f'<VoiceLeadingViolation {self.rule} {self.offset} -> {self.nextOffset} '
+                + f'(m. {self.measureNumber} -> {self.nextMeasureNumber}) '
+                + f'parts {self.upperPart}, {self.lowerPart}>')
+
+
+class VoiceLeadingChecker:
+    '''
+    Checks the voice leading between every pair of parts of a score at once.
+
+    Instead of creating a :class:`VoiceLeadingQuartet` (and its four Interval objects)
+    for each pair of parts at each pair of verticalities, the pitch sounding in each part at
+    each verticality of the score's timespan tree is put into matrices of parts by
+    verticalities, and motion types and the rules of VoiceLeadingQuartet are found for
+    all pairs of parts and all pairs of consecutive verticalities with array operations.
+    Intervals are spelled intervals, just as in VoiceLeadingQuartet.  Requires numpy.
+
+    >>> bach = corpus.parse('bwv66.6')
+    >>> vlc = voiceLeading.VoiceLeadingChecker(bach)
+    >>> vlc.pitchSpace.shape
+    (4, 51)
+    >>> vlc.offsets[:5]
+    [0.0, 0.5, 1.0, 2.0, 3.0]
+    >>> vlc.pitchSpace[:, 0]
+    array([73., 64., 57., 57.])
+
+    :meth:`violations` returns the places where the rules are broken, ordered by
+    offset; parts are given by their index in the score, upper part first:
+
+    >>> for v in vlc.violations()[:4]:
+    ...     print(v)
+    <VoiceLeadingViolation hiddenOctave 6.5 -> 7.0 (m. 2 -> 2) parts 0, 3>
+    <VoiceLeadingViolation hiddenFifth 6.5 -> 7.0 (m. 2 -> 2) parts 1, 3>
+    <VoiceLeadingViolation hiddenFifth 9.5 -> 10.0 (m. 3 -> 3) parts 0, 2>
+    <VoiceLeadingViolation hiddenOctave 10.5 -> 11.0 (m. 3 -> 3) parts 0, 3>
+
+    A part holding a chord is represented by the highest pitch of the chord.  Parts which
+    are silent at one of two consecutive verticalities have no motion between them.
+    '''
+    rules = ('parallelFifth', 'parallelOctave', 'parallelUnison',
+             'hiddenFifth', 'hiddenOctave', 'voiceCrossing', 'voiceOverlap')
+
+    def __init__(self, score):
+        if 'numpy' in base._missingImport:
+            raise VoiceLeadingCheckerException('VoiceLeadingChecker requires numpy.')
+        import numpy as np
+
+        self.parts = list(score.parts)
+        if not self.parts:
+            raise VoiceLeadingCheckerException('VoiceLeadingChecker needs a score with parts.')
+        partIndices = {id(p): i for i, p in enumerate(self.parts)}
+
+        scoreTree = score.asTimespans(classList=(note.Note, chord.Chord))
+        verticalities = list(scoreTree.iterateVerticalities())
+        self.offsets = [float(v.offset) for v in verticalities]
+        self.measureNumbers = [v.measureNumber for v in verticalities]
+
+        # the pitch of each part at each verticality, or None
+        self.pitches = [[None] * len(verticalities) for unused in self.parts]
+        for i, vert in enumerate(verticalities):
+            for ts in vert.startAndOverlapTimespans:
+                partIndex = partIndices.get(id(ts.part), None)
+                if partIndex is None or not ts.pitches:
+                    continue
+                p = max(ts.pitches)
+                current = self.pitches[partIndex][i]
+                if current is None or p > current:
+                    self.pitches[partIndex][i] = p
+
+        shape = (len(self.parts), len(verticalities))
+        self.pitchSpace = np.full(shape, np.nan)
+        self.diatonicNoteNums = np.zeros(shape, dtype=int)
+        for partIndex, partPitches in enumerate(self.pitches):
+            for i, p in enumerate(partPitches):
+                if p is not None:
+                    self.pitchSpace[partIndex, i] = p.ps
+                    self.diatonicNoteNums[partIndex, i] = p.diatonicNoteNum
+
+        self._arrays = None
+
+    def _getArrays(self):
+        '''
+        Compute (once) the boolean arrays of motions and rules, each of shape
+        (pairs of parts, pairs of consecutive verticalities), and the part indices
+        of the pairs.
+        '''
+        if self._arrays is not None:
+            return self._arrays
+        import numpy as np
+
+        ps = self.pitchSpace
+        dnn = self.diatonicNoteNums
+        upper, lower = np.triu_indices(len(self.parts), 1)
+
+        sounding = ~np.isnan(ps)
+        valid = (sounding[upper, :-1] & sounding[upper, 1:]
+                 & sounding[lower, :-1] & sounding[lower, 1:])
+
+        # melodic intervals: a part stays only for a perfect unison
+        psMotion = ps[:, 1:] - ps[:, :-1]
+        stays = (psMotion == 0) & (dnn[:, 1:] == dnn[:, :-1])
+        direction = np.sign(np.nan_to_num(psMotion))
+
+        noMotion = valid & stays[upper] & stays[lower]
+        oblique = valid & ~noMotion & (stays[upper] | stays[lower])
+        sameDirection = direction[upper] == direction[lower]
+        similar = valid & ~noMotion & sameDirection
+        contrary = valid & ~noMotion & ~oblique & ~sameDirection
+
+        # harmonic intervals, from the upper part to the lower part
+        genericSteps = dnn[lower] - dnn[upper]
+        semitones = np.nan_to_num(ps[lower] - ps[upper])
+        semitones = np.where(genericSteps < 0, -semitones, semitones)
+        genericSteps = np.abs(genericSteps)
+        octaves = genericSteps // 7
+        simpleSteps = genericSteps % 7
+        # semitones above the perfect or major simple interval
+        simpleSemitones = semitones - 12 * octaves
+        perfectUnisonOrOctave = (simpleSteps == 0) & (simpleSemitones == 0)
+        perfectFifth = (simpleSteps == 4) & (simpleSemitones == 7)
+        unison = perfectUnisonOrOctave & (genericSteps == 0)
+        octave = perfectUnisonOrOctave & (genericSteps > 0)
+        semiSimpleSteps = np.where((genericSteps > 0) & (simpleSteps == 0), 7, simpleSteps)
+
+        def both(harmonic):
+            return harmonic[:, :-1] & harmonic[:, 1:]
+
+        sameSimpleName = ((simpleSteps[:, :-1] == simpleSteps[:, 1:])
+                          & (simpleSemitones[:, :-1] == simpleSemitones[:, 1:]))
+        sameSemiSimpleSteps = semiSimpleSteps[:, :-1] == semiSimpleSteps[:, 1:]
+        parallel = (similar
+                    & ((dnn[lower, :-1] - dnn[upper, :-1]) == (dnn[lower, 1:] - dnn[upper, 1:])))
+        antiParallel = contrary & sameSimpleName
+        hidden = similar & ~sameSemiSimpleSteps
+
+        upperPs = np.nan_to_num(ps[upper])
+        lowerPs = np.nan_to_num(ps[lower])
+
+        self._arrays = {
+            'upper': upper,
+            'lower': lower,
+            'noMotion': noMotion,
+            'oblique': oblique,
+            'parallel': parallel,
+            'similar': similar,
+            'antiParallel': antiParallel,
+            'contrary': contrary,
+            'parallelFifth': (similar | contrary) & both(perfectFifth),
+            'parallelOctave': ((similar & both(octave))
+                               | (contrary & both(perfectUnisonOrOctave))),
+            'parallelUnison': ((similar & both(unison))
+                               | (contrary & both(perfectUnisonOrOctave))),
+            'hiddenFifth': hidden & perfectFifth[:, 1:],
+            'hiddenOctave': hidden & perfectUnisonOrOctave[:, 1:],
+            'voiceCrossing': valid & ((upperPs[:, :-1] < lowerPs[:, :-1])
+                                      | (upperPs[:, 1:] < lowerPs[:, 1:])),
+            'voiceOverlap': valid & ((upperPs[:, 1:] < lowerPs[:, :-1])
+                                     | (lowerPs[:, 1:] > upperPs[:, :-1])),
+        }
+        return self._arrays
+
+    def motionTypes(self, *, allowAntiParallel=False):
+        '''
+        Returns a dictionary mapping each pair of part indices (upper, lower)
+        to a list of the :class:`MotionType` between each pair of consecutive verticalities,
+        as :meth:`VoiceLeadingQuartet.motionType` would find it, or None where one of the
+        parts is silent.
+
+        >>> bach = corpus.parse('bwv66.6')
+        >>> vlc = voiceLeading.VoiceLeadingChecker(bach)
+        >>> motions = vlc.motionTypes()
+        >>> sorted(motions)
+        [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+        >>> motions[(0, 3)][3:6]
+        [<MotionType.parallel: 'Parallel'>, <MotionType.contrary: 'Contrary'>,
+         <MotionType.contrary: 'Contrary'>]
+        '''
+        arrays = self._getArrays()
+        order = [MotionType.oblique, MotionType.parallel, MotionType.similar]
+        if allowAntiParallel:
+            order.append(MotionType.antiParallel)
+        order.extend([MotionType.contrary, MotionType.noMotion])
+
+        post = {}
+        for pairIndex, (u, low) in enumerate(zip(arrays['upper'], arrays['lower'])):
+            motions = [None] * (len(self.offsets) - 1)
+            # first matching motion type wins, so go through them in reverse
+            for motionType in reversed(order):
+                for i in arrays[motionType.name][pairIndex].nonzero()[0]:
+                    motions[i] = motionType
+            post[(int(u), int(low))] = motions
+        return post
+
+    def violations(self, rules=None):
+        '''
+        Returns a list of :class:`VoiceLeadingViolation` objects for each place where
+        two parts break one of the rules in `rules` (default, all the rules in
+        `.rules`) between consecutive verticalities, ordered by offset.
+
+        >>> s = stream.Score()
+        >>> s.insert(0, converter.parse("tinyNotation: 4/4 g4 a4 d'4 e'4"))
+        >>> s.insert(0, converter.parse('tinyNotation: 4/4 c4 d4 d4 e4'))
+        >>> vlc = voiceLeading.VoiceLeadingChecker(s)
+        >>> for v in vlc.violations():
+        ...     print(v)
+        <VoiceLeadingViolation parallelFifth 0.0 -> 1.0 (m. 1 -> 1) parts 0, 1>
+        <VoiceLeadingViolation parallelOctave 2.0 -> 3.0 (m. 1 -> 1) parts 0, 1>
+        >>> vlc.violations(['hiddenFifth', 'voiceCrossing'])
+        []
+        >>> vlc.motionTypes()
+        {(0, 1): [<MotionType.parallel: 'Parallel'>, <MotionType.oblique: 'Oblique'>,
+                  <MotionType.parallel: 'Parallel'>]}
+        '''
+        if rules is None:
+            rules = self.rules
+        arrays = self._getArrays()
+        post = []
+        for rule in rules:
+            if rule not in self.rules:
+                raise VoiceLeadingCheckerException(f'no such voice-leading rule: {rule!r}')
+            pairIndices, transitions = arrays[rule].nonzero()
+            for pairIndex, i in zip(pairIndices, transitions):
+                post.append(VoiceLeadingViolation(rule,
+                                                  self.offsets[i],
+                                                  self.offsets[i + 1],
+                                                  self.measureNumbers[i],
+                                                  self.measureNumbers[i + 1],
+                                                  int(arrays['upper'][pairIndex]),
+                                                  int(arrays['lower'][pairIndex])))
+        post.sort(key=lambda v: (v.offset, v.upperPart, v.lowerPart))
+        return post
+
+
+class VoiceLeadingCheckerException(exceptions21.Music21Exception):
+    pass
+
+
 def getVerticalityFromObject(music21Obj, scoreObjectIsFrom, classFilterList=None):
     '''
     returns the :class:`~music21.voiceLeading.Verticality` object given a score,
@@ -2425,6 +2679,49 @@ class Test(unittest.TestCase):
         assert d.hiddenInterval(interval.Interval('A4')) is False
         assert d.hiddenInterval(interval.Interval('AA4')) is False
 
+    def testVoiceLeadingCheckerMatchesQuartets(self):
+        from music21 import corpus
+        for workName in ('bwv66.6', 'bwv10.7'):
+            vlc = VoiceLeadingChecker(corpus.parse(workName))
+            violations = set(vlc.violations())
+            motions = vlc.motionTypes(allowAntiParallel=True)
+            for (upper, lower), motionList in motions.items():
+                upperPitches = vlc.pitches[upper]
+                lowerPitches = vlc.pitches[lower]
+                for i, motionType in enumerate(motionList):
+                    quartetPitches = (upperPitches[i], upperPitches[i + 1],
+                                      lowerPitches[i], lowerPitches[i + 1])
+                    if None in quartetPitches:
+                        self.assertIsNone(motionType)
+                        continue
+                    vlq = VoiceLeadingQuartet(*[note.Note(p) for p in quartetPitches])
+                    self.assertEqual(motionType, vlq.motionType(allowAntiParallel=True))
+                    for rule in vlc.rules:
+                        violation = VoiceLeadingViolation(rule,
+                                                          vlc.offsets[i],
+                                                          vlc.offsets[i + 1],
+                                                          vlc.measureNumbers[i],
+                                                          vlc.measureNumbers[i + 1],
+                                                          upper,
+                                                          lower)
+                        self.assertEqual(violation in violations, getattr(vlq, rule)(),
+                                         violation)
+
+    def testVoiceLeadingCheckerSpelling(self):
+        from music21 import converter
+        from music21 import stream
+        s = stream.Score()
+        s.insert(0, converter.parse('tinyNotation: 4/4 g4 a4 g#4 a4 a4'))
+        s.insert(0, converter.parse('tinyNotation: 4/4 c4 d4 d-4 d4 r4'))
+        vlc = VoiceLeadingChecker(s)
+        # D-4 to G#4 is a doubly augmented fourth, not a fifth: the motion
+        # from and to it is not parallel, and rests have no motion
+        self.assertEqual([(v.rule, v.offset) for v in vlc.violations()],
+                         [('parallelFifth', 0.0), ('hiddenFifth', 2.0)])
+        self.assertEqual(vlc.motionTypes()[(0, 1)][-1], None)
+        self.assertRaises(VoiceLeadingCheckerException, vlc.violations, ['parallelSecond'])
+        self.assertRaises(VoiceLeadingCheckerException, VoiceLeadingChecker, stream.Score())
+
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
     pass
@@ -2432,7 +2729,8 @@ class TestExternal(unittest.TestCase):  # pragma: no cover
 
 # -----------------------------------------------------------------------------
 
-_DOC_ORDER = [VoiceLeadingQuartet, ThreeNoteLinearSegment, Verticality, VerticalityNTuplet]
+_DOC_ORDER = [VoiceLeadingQuartet, VoiceLeadingChecker, ThreeNoteLinearSegment,
+              Verticality, VerticalityNTuplet]
 
 if __name__ == '__main__':
     import music21